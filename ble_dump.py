@@ -2,10 +2,32 @@ import asyncio
 import os
 from bleak import BleakClient
 
+from ble_tui.tools.daemon import request
+
 # Device address can be configured via environment variable
 # Default is for LongBuddy-EMU
 ADDR = os.getenv("BLE_TEST_DEVICE_ADDRESS", "A4486977-7944-04D0-ACB9-25ABF3578B51")
 
+# Rendered property lists; there are only a handful of distinct combinations
+_PROPS_CACHE: dict[frozenset[str], str] = {}
+
+
+def props_label(properties):
+    key = frozenset(properties)
+    label = _PROPS_CACHE.get(key)
+    if label is None:
+        label = _PROPS_CACHE[key] = ",".join(sorted(key))
+    return label
+
+
+def print_services(services):
+    for svc in services:
+        print("SVC", svc["uuid"])
+        for ch in svc["characteristics"]:
+            props = ",".join(ch["properties"])
+            print("  CHAR", ch["uuid"], "props=", props, "handle=", ch["handle"])
+
+
 async def main():
     print(f"Connecting to {ADDR}...")
     async with BleakClient(ADDR) as client:
@@ -14,8 +36,17 @@ async def main():
         for svc in services:
             print("SVC", svc.uuid)
             for ch in svc.characteristics:
-                props = ",".join(sorted(ch.properties))
+                props = props_label(ch.properties)
                 handle = getattr(ch, "handle", None)
                 print("  CHAR", ch.uuid, "props=", props, "handle=", handle)
 
-asyncio.run(main())
+
+if __name__ == "__main__":
+    # Reuse the daemon's connection and cached GATT layout when it is running.
+    reply = request({"op": "dump", "address": ADDR})
+    if reply is None:
+        asyncio.run(main())
+    elif reply["ok"]:
+        print_services(reply["services"])
+    else:
+        print("daemon error:", reply["error"])
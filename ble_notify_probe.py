@@ -4,6 +4,9 @@ import os
 
 from bleak import BleakClient
 
+from ble_tui.tools.daemon import request
+from ble_tui.utils import NOTIFY_CONCURRENCY
+
 
 # Device address can be configured via environment variable
 # Default is for LongBuddy-EMU
@@ -28,31 +31,60 @@ else:
     CHARS = DEFAULT_CHARS
 
 
+# How long to listen for notifications
+PROBE_SECONDS = 12
+
+
 def cb(sender, data):
     print(f"notify sender={sender} len={len(data)} hex={bytes(data).hex()}")
 
 
+async def gather_limited(coro_factory, uuids):
+    sem = asyncio.Semaphore(NOTIFY_CONCURRENCY)
+
+    async def run(uuid):
+        async with sem:
+            return await coro_factory(uuid)
+
+    return await asyncio.gather(*(run(u) for u in uuids), return_exceptions=True)
+
+
 async def main():
     print(f"Connecting to {ADDR}...")
     print(f"Will probe {len(CHARS)} characteristic(s) for notifications")
     async with BleakClient(ADDR) as client:
         print("connected:", client.is_connected)
 
-        for uuid in CHARS:
-            try:
-                await client.start_notify(uuid, cb)
+        results = await gather_limited(lambda u: client.start_notify(u, cb), CHARS)
+        for uuid, result in zip(CHARS, results):
+            if isinstance(result, Exception):
+                print(f"subscribe failed: {uuid} -> {result!r}")
+            else:
                 print("subscribed:", uuid)
-            except Exception as exc:
-                print(f"subscribe failed: {uuid} -> {exc!r}")
 
-        await asyncio.sleep(12)
+        await asyncio.sleep(PROBE_SECONDS)
+
+        await gather_limited(client.stop_notify, CHARS)
+
 
-        for uuid in CHARS:
-            try:
-                await client.stop_notify(uuid)
-            except Exception:
-                pass
+def print_daemon_reply(reply):
+    for uuid in reply["subscribed"]:
+        print("subscribed:", uuid)
+    for uuid, error in reply["errors"].items():
+        print(f"subscribe failed: {uuid} -> {error}")
+    for event in reply["events"]:
+        data = bytes.fromhex(event["hex"])
+        print(f"notify sender={event['uuid']} len={len(data)} hex={event['hex']}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Reuse the daemon's connection when it is running.
+    reply = request(
+        {"op": "notify", "address": ADDR, "uuids": CHARS, "duration": PROBE_SECONDS}
+    )
+    if reply is None:
+        asyncio.run(main())
+    elif reply["ok"]:
+        print_daemon_reply(reply)
+    else:
+        print("daemon error:", reply["error"])
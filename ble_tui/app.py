@@ -3,18 +3,27 @@ from __future__ import annotations
 
 import asyncio
 import threading
-import traceback
-from datetime import datetime
-from typing import Any, Optional
+from itertools import islice
+from typing import Any, Iterator, Optional
 
 from bleak import BleakClient
 from textual import events
 from textual.app import App, ComposeResult
 from textual.containers import Grid, Vertical, VerticalScroll
+from textual.timer import Timer
 from textual.widgets import DataTable, Footer, Header, RichLog, Static, Tree
 
-from ble_tui.models import CharacteristicInfo, DeviceInfo, LogEntry
-from ble_tui.services import BleService, StateService
+from ble_tui.models import (
+    PROP_INDICATE,
+    PROP_NOTIFY,
+    PROP_READ,
+    PROP_WRITE,
+    PROP_WRITE_NO_RESPONSE,
+    CharacteristicInfo,
+    DeviceInfo,
+    LogEntry,
+)
+from ble_tui.services import BleService, ErrorLogService, StateService
 from ble_tui.ui.renderers import (
     characteristic_label,
     latest_value_markup,
@@ -24,7 +33,14 @@ from ble_tui.ui.renderers import (
 )
 from ble_tui.ui.styles import APP_CSS
 from ble_tui.ui.write_dialog import WriteDialog
-from ble_tui.utils import ERROR_LOG_PATH, format_ble_error, LOG_MAX
+from ble_tui.utils import (
+    ERROR_LOG_PATH,
+    format_ble_error,
+    HIGHLIGHT_RENDER_DELAY_S,
+    LOG_MAX,
+    NOTIFY_FLUSH_INTERVAL_S,
+    NOTIFY_FLUSH_MAX_BYTES,
+)
 
 
 class BleTui(App):
@@ -40,23 +56,53 @@ class BleTui(App):
         ("enter", "connect", "Connect"),
         ("r", "read_char", "Read"),
         ("n", "toggle_notify", "Notify"),
+        ("a", "subscribe_all", "Notify All"),
         ("w", "write_char", "Write"),
         ("l", "clear_log", "Clear"),
         ("h", "toggle_value_height", "Expand"),
         ("q", "quit", "Quit"),
     ]
 
-    def __init__(self) -> None:
+    def __init__(
+        self, ble: Optional[BleService] = None, auto_scan: bool = True
+    ) -> None:
         super().__init__()
-        self._ble = BleService()
+        self._ble = ble if ble is not None else BleService()
+        self._auto_scan = auto_scan
+        self._errors = ErrorLogService(ERROR_LOG_PATH)
+        # Notifications buffered between UI frames (filled from BLE threads)
+        self._notify_lock = threading.Lock()
+        # Thread running the app's event loop; set in on_mount
+        self._app_thread_id: Optional[int] = None
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """Set every piece of per-session mutable state to its initial value."""
         self._state = StateService()
-        self._ble_lock = asyncio.Lock()
+        # Connection lifecycle (scan/connect/disconnect/discovery) vs. single
+        # GATT operations; the op lock is held only around the bleak call.
+        self._conn_lock = asyncio.Lock()
+        self._op_lock = asyncio.Lock()
         self._client: Optional[BleakClient] = None
+        self._connected_addr_client: Optional[BleakClient] = None
+        self._connected_addr: Optional[str] = None
+        self._char_nodes: dict[str, Any] = {}
+        # Key/log version currently shown in #log, to skip redundant redraws
+        self._log_view_key: Optional[str] = None
+        self._log_view_version: Optional[int] = None
+        self._highlight_timer: Optional[Timer] = None
+        self._pending_notifies: dict[str, list[bytes]] = {}
+        self._pending_status: Optional[str] = None
+        self._pending_bytes = 0
+        self._flush_scheduled = False
+        self._flush_forced = False
         self._selected_device: Optional[str] = None
         self._selected_char: Optional[str] = None
         self._scan_in_progress = False
         self._expanded_value = False
         self._status_msg = "Ready"
+        # status_line() inputs last shown in #status
+        self._status_inputs: Optional[tuple[Any, ...]] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -73,32 +119,57 @@ class BleTui(App):
                 with VerticalScroll(id="latest_value_scroll", classes="latest-value"):
                     yield Static("", id="latest_value")
                 yield Static("History", id="history_title", classes="history-title")
-                yield RichLog(id="log", wrap=True)
+                yield RichLog(id="log", wrap=True, max_lines=LOG_MAX)
         yield Static("Ready", id="status")
         yield Footer()
 
     async def on_mount(self) -> None:
-        devices = self.query_one("#devices", DataTable)
+        self._app_thread_id = threading.get_ident()
+
+        # Widget identities never change after compose; look them up once.
+        self._devices_table = self.query_one("#devices", DataTable)
+        self._gatt_tree = self.query_one("#gatt", Tree)
+        self._status_widget = self.query_one("#status", Static)
+        self._history_title = self.query_one("#history_title", Static)
+        self._log_meta = self.query_one("#log_meta", Static)
+        self._latest_value = self.query_one("#latest_value", Static)
+        self._latest_value_scroll = self.query_one(
+            "#latest_value_scroll", VerticalScroll
+        )
+        self._log_view = self.query_one("#log", RichLog)
+        self._panes = (
+            self._devices_table,
+            self._gatt_tree,
+            self._latest_value_scroll,
+            self._log_view,
+        )
+
+        devices = self._devices_table
         devices.add_columns("Conn", "RSSI", "Name", "Address")
         devices.cursor_type = "row"
         devices.zebra_stripes = True
         devices.focus()
-        self._set_status("Auto-scanning for BLE devices...")
-        asyncio.create_task(self.action_scan())
+        if self._auto_scan:
+            self._set_status("Auto-scanning for BLE devices...")
+            asyncio.create_task(self.action_scan())
 
     def _set_status(self, msg: str) -> None:
         self._status_msg = msg
         self._render_status()
 
     def _render_status(self) -> None:
-        line = status_line(
-            status_msg=self._status_msg,
-            connected_address=self._connected_address(),
-            scan_in_progress=self._scan_in_progress,
-            selected_char=self._selected_char,
-            subscribed_count=len(self._state.subscribed),
+        inputs = (
+            self._status_msg,
+            self._connected_address(),
+            self._scan_in_progress,
+            self._selected_char,
+            len(self._state.subscribed),
         )
-        self.query_one("#status", Static).update(line)
+        # Notification bursts re-set the same status; skip the widget update
+        if inputs == self._status_inputs:
+            return
+        self._status_inputs = inputs
+        self._status_widget.update(status_line(*inputs))
 
     def _render_history_title(self, key: Optional[str] = None) -> None:
         """Update history title with entry count for selected characteristic."""
@@ -116,62 +187,61 @@ class BleTui(App):
             else:
                 title = f"History ({count})"
 
-        self.query_one("#history_title", Static).update(title)
+        self._history_title.update(title)
 
-    def _record_error(self, context: str, exc: Exception) -> None:
-        ts = datetime.now().isoformat(timespec="seconds")
-        details = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
-        try:
-            with open(ERROR_LOG_PATH, "a", encoding="utf-8") as f:
-                f.write(f"[{ts}] {context}\n{details}\n")
-        except Exception:
-            pass
+    def _record_error(self, context: str, exc: BaseException) -> None:
+        self._errors.record(context, exc)
 
     def _connected_address(self) -> Optional[str]:
-        return self._state.connected_address(self._client)
+        # Reading client.address/is_connected crosses into the backend, so only
+        # do it once per client object; connect/disconnect reset the cache.
+        client = self._client
+        if client is not self._connected_addr_client:
+            self._connected_addr_client = client
+            self._connected_addr = self._state.connected_address(client)
+        return self._connected_addr
+
+    def _reset_connected_address(self) -> None:
+        self._connected_addr_client = None
+        self._connected_addr = None
 
     def _restore_device_cursor(self, addr: Optional[str]) -> None:
-        if not addr or addr not in self._state.device_order:
-            if self._state.device_order:
-                devices_table = self.query_one("#devices", DataTable)
-                devices_table.move_cursor(row=0, column=0)
+        row_index = self._state.device_index.get(addr) if addr else None
+        if row_index is None:
+            if self._state.devices:
+                self._devices_table.move_cursor(row=0, column=0)
             return
-        row_index = self._state.device_order.index(addr)
-        devices_table = self.query_one("#devices", DataTable)
-        devices_table.move_cursor(row=row_index, column=0)
+        self._devices_table.move_cursor(row=row_index, column=0)
 
     def _render_devices_table(self, preserve_addr: Optional[str] = None) -> None:
-        devices_table = self.query_one("#devices", DataTable)
+        devices_table = self._devices_table
         devices_table.clear()
         connected_addr = self._connected_address()
-        for addr in self._state.device_order:
-            dev = self._state.devices.get(addr)
-            if dev is None:
-                continue
+        for addr, dev in self._state.devices.items():
             conn_label = "ON" if connected_addr == addr else ""
             devices_table.add_row(
                 conn_label, str(dev.rssi), dev.name, dev.address, key=dev.address
             )
         self._restore_device_cursor(preserve_addr)
 
+    def _clear_devices_table_only(self) -> None:
+        self._devices_table.clear()
+
     async def action_scan(self) -> None:
         if self._scan_in_progress:
             return
-        async with self._ble_lock:
+        async with self._conn_lock:
             self._scan_in_progress = True
-            self._render_status()
             self._set_status("Scanning...")
             previous_addr = self._selected_device
-            self._state.devices.clear()
-            self._state.device_order.clear()
-            self._render_devices_table(preserve_addr=previous_addr)
+            self._state.replace_devices([])
+            self._clear_devices_table_only()
 
             try:
                 devices = await self._ble.scan()
             except Exception as exc:
                 self._record_error("scan", exc)
                 self._scan_in_progress = False
-                self._render_status()
                 self._set_status(format_ble_error("Scan", exc, ERROR_LOG_PATH))
                 return
 
@@ -179,11 +249,10 @@ class BleTui(App):
             self._render_devices_table(preserve_addr=previous_addr)
 
             self._scan_in_progress = False
-            self._render_status()
             self._set_status(f"Scan complete: {len(devices)} device(s).")
 
     async def action_connect(self) -> None:
-        async with self._ble_lock:
+        async with self._conn_lock:
             self._select_device_from_cursor()
             if not self._selected_device:
                 self._set_status("Select a device first.")
@@ -194,56 +263,73 @@ class BleTui(App):
             addr = self._selected_device
             self._set_status(f"Connecting to {addr}...")
 
-            def _on_disconnect(_: BleakClient) -> None:
-                try:
-                    self.call_from_thread(self._handle_disconnect)
-                except Exception:
-                    pass
-
             try:
                 self._client = await self._ble.connect(
-                    addr, disconnected_callback=_on_disconnect
+                    addr, disconnected_callback=self._on_disconnected
                 )
             except Exception as exc:
                 self._record_error("connect", exc)
                 self._set_status(format_ble_error("Connect", exc, ERROR_LOG_PATH))
                 return
+            self._reset_connected_address()
 
             self._render_devices_table(preserve_addr=addr)
             self._set_status(f"Connected: {addr}")
             await self._discover_gatt()
-            self.query_one("#gatt", Tree).focus()
+            self._gatt_tree.focus()
 
     async def action_disconnect(self) -> None:
-        async with self._ble_lock:
+        async with self._conn_lock:
             await self._disconnect_internal()
             self._set_status("Disconnected")
 
     async def _disconnect_internal(self) -> None:
-        if self._client and self._client.is_connected:
+        # Drop the client first so its disconnected_callback is ignored
+        client, self._client = self._client, None
+        if client and client.is_connected:
             try:
-                await self._ble.disconnect(self._client)
+                await self._ble.disconnect(client)
             except Exception as exc:
                 self._record_error("disconnect", exc)
-        self._client = None
+        self._reset_connected_address()
         self._state.clear_connection_state()
         self._selected_char = None
         self._clear_gatt_ui()
 
     def _clear_gatt_ui(self) -> None:
-        gatt = self.query_one("#gatt", Tree)
+        gatt = self._gatt_tree
         gatt.clear()
         gatt.root.label = "GATT"
         gatt.refresh()
-        self.query_one("#log_meta", Static).update("No characteristic selected")
-        self.query_one("#latest_value", Static).update("")
-        self.query_one("#log", RichLog).clear()
+        self._char_nodes.clear()
+        with self._notify_lock:
+            self._pending_notifies.clear()
+            self._pending_bytes = 0
+        self._log_meta.update("No characteristic selected")
+        self._latest_value.update("")
+        self._log_view.clear()
+        self._log_view_key = None
         self._render_history_title(None)  # Reset to "History"
         self._render_devices_table(preserve_addr=self._selected_device)
         self._render_status()
 
-    def _handle_disconnect(self) -> None:
+    def _on_disconnected(self, client: BleakClient) -> None:
+        """Bleak's disconnected_callback; backends call it on any thread."""
+        if self._app_thread_id == threading.get_ident():
+            self._handle_disconnect(client)
+            return
+        try:
+            self.call_from_thread(self._handle_disconnect, client)
+        except Exception:
+            # The app is shutting down; there is no UI left to update.
+            pass
+
+    def _handle_disconnect(self, client: Optional[BleakClient] = None) -> None:
+        if client is not None and client is not self._client:
+            # Late callback from a client we already disconnected or replaced
+            return
         self._client = None
+        self._reset_connected_address()
         self._state.clear_connection_state()
         self._selected_char = None
         self._clear_gatt_ui()
@@ -267,22 +353,25 @@ class BleTui(App):
 
         self._state.set_gatt(services_map, key_map)
 
-        gatt = self.query_one("#gatt", Tree)
-        gatt.clear()
-        gatt.root.label = "GATT"
-        root = gatt.root
-
-        for svc_uuid, chars in self._state.services.items():
-            svc_node = root.add(f"Service {svc_uuid}")
-            for info in chars:
-                svc_node.add(
-                    characteristic_label(info, info.key in self._state.subscribed),
-                    data=info,
-                )
-            svc_node.expand()
+        gatt = self._gatt_tree
+        subscribed = self._state.subscribed
+        # One screen update for the whole tree, however many nodes it has
+        with self.batch_update():
+            gatt.clear()
+            gatt.root.label = "GATT"
+            root = gatt.root
+            self._char_nodes.clear()
+
+            for svc_uuid, chars in self._state.services.items():
+                svc_node = root.add(f"Service {svc_uuid}", expand=True)
+                for info in chars:
+                    self._char_nodes[info.key] = svc_node.add(
+                        characteristic_label(info, info.key in subscribed),
+                        data=info,
+                    )
 
-        gatt.root.expand()
-        gatt.refresh()
+            root.expand()
+            gatt.refresh()
         self._set_status(
             f"GATT loaded: {service_count} service(s), {char_count} characteristic(s)."
         )
@@ -291,7 +380,7 @@ class BleTui(App):
         return self._state.char_target(info)
 
     def _sync_selected_char_from_tree(self) -> Optional[CharacteristicInfo]:
-        gatt = self.query_one("#gatt", Tree)
+        gatt = self._gatt_tree
         cursor_node = getattr(gatt, "cursor_node", None)
         if cursor_node is None:
             return None
@@ -303,78 +392,122 @@ class BleTui(App):
         return None
 
     async def action_read_char(self) -> None:
-        async with self._ble_lock:
-            if not self._client:
-                self._set_status("Select a characteristic first.")
-                return
+        if not self._client:
+            self._set_status("Select a characteristic first.")
+            return
 
-            info = self._sync_selected_char_from_tree()
-            if info is None and self._selected_char:
-                info = self._state.find_char(self._selected_char)
-            if not info or "read" not in info.properties:
-                self._set_status("Selected characteristic is not readable.")
-                return
+        info = self._sync_selected_char_from_tree()
+        if info is None and self._selected_char:
+            info = self._state.find_char(self._selected_char)
+        if not info or not info.props_mask & PROP_READ:
+            self._set_status("Selected characteristic is not readable.")
+            return
 
-            try:
-                data = await self._ble.read_char(self._client, self._char_target(info))
-            except Exception as exc:
-                self._record_error("read_char", exc)
-                self._set_status(f"Read failed (details in {ERROR_LOG_PATH})")
-                return
+        client, target = self._client, self._char_target(info)
+        try:
+            async with self._op_lock:
+                data = await self._ble.read_char(client, target)
+        except Exception as exc:
+            self._record_error("read_char", exc)
+            self._set_status(f"Read failed (details in {ERROR_LOG_PATH})")
+            return
 
-            self._append_value(info.key, data)
-            self._set_status(f"Read {info.uuid}")
+        self._append_value(info.key, data)
+        self._set_status(f"Read {info.uuid}")
 
     async def action_toggle_notify(self) -> None:
-        async with self._ble_lock:
-            if not self._client:
-                self._set_status("Select a characteristic first.")
-                return
+        if not self._client:
+            self._set_status("Select a characteristic first.")
+            return
 
-            info = self._sync_selected_char_from_tree()
-            if info is None and self._selected_char:
-                info = self._state.find_char(self._selected_char)
-            if not info or (
-                "notify" not in info.properties and "indicate" not in info.properties
-            ):
-                self._set_status("Selected characteristic is not notifiable.")
-                return
+        info = self._sync_selected_char_from_tree()
+        if info is None and self._selected_char:
+            info = self._state.find_char(self._selected_char)
+        if not info or not info.props_mask & (PROP_NOTIFY | PROP_INDICATE):
+            self._set_status("Selected characteristic is not notifiable.")
+            return
 
-            if info.key in self._state.subscribed:
-                try:
-                    await self._ble.stop_notify(self._client, self._char_target(info))
-                except Exception as exc:
-                    self._record_error("stop_notify", exc)
-                    self._set_status(
-                        f"Stop notify failed (details in {ERROR_LOG_PATH})"
+        client, target = self._client, self._char_target(info)
+        if info.key in self._state.subscribed:
+            try:
+                async with self._op_lock:
+                    await self._ble.stop_notify(client, target)
+            except Exception as exc:
+                self._record_error("stop_notify", exc)
+                self._set_status(
+                    f"Stop notify failed (details in {ERROR_LOG_PATH})"
+                )
+                return
+            self._state.subscribed.remove(info.key)
+            self._set_status(f"Stopped notify {info.uuid}")
+        else:
+            try:
+                async with self._op_lock:
+                    await self._ble.start_notify(
+                        client, target, self._notify_callback(info)
                     )
-                    return
-                self._state.subscribed.remove(info.key)
-                self._set_status(f"Stopped notify {info.uuid}")
-            else:
+            except Exception as exc:
+                self._record_error("start_notify", exc)
+                self._set_status(
+                    f"Start notify failed (details in {ERROR_LOG_PATH})"
+                )
+                return
+            self._state.subscribed.add(info.key)
+            self._set_status(f"Subscribed {info.uuid}")
 
-                def _cb(sender: Any, data: bytearray) -> None:
-                    key = info.key
-                    sender_handle = getattr(sender, "handle", None)
-                    if isinstance(sender_handle, int):
-                        key = self._state.key_by_handle.get(sender_handle, key)
-                    self._dispatch_notify(key, bytes(data), info.uuid)
+        self._refresh_gatt_labels(info.key)
+        self._render_status()
 
-                try:
-                    await self._ble.start_notify(
-                        self._client, self._char_target(info), _cb
-                    )
-                except Exception as exc:
-                    self._record_error("start_notify", exc)
-                    self._set_status(
-                        f"Start notify failed (details in {ERROR_LOG_PATH})"
-                    )
-                    return
+    async def action_subscribe_all(self) -> None:
+        """Subscribe to every notifiable characteristic in one concurrent batch."""
+        if not self._client:
+            self._set_status("Connect to a device first.")
+            return
+
+        pending = [
+            info
+            for chars in self._state.services.values()
+            for info in chars
+            if info.key not in self._state.subscribed
+            and info.props_mask & (PROP_NOTIFY | PROP_INDICATE)
+        ]
+        if not pending:
+            self._set_status("No unsubscribed notifiable characteristics.")
+            return
+
+        client = self._client
+        subscriptions = [
+            (self._char_target(info), self._notify_callback(info)) for info in pending
+        ]
+        async with self._op_lock:
+            errors = await self._ble.start_notify_many(client, subscriptions)
+        failed = 0
+        for info, exc in zip(pending, errors):
+            if exc is None:
                 self._state.subscribed.add(info.key)
-                self._set_status(f"Subscribed {info.uuid}")
+                self._refresh_gatt_labels(info.key)
+            else:
+                failed += 1
+                self._record_error(f"start_notify {info.uuid}", exc)
+
+        subscribed = len(pending) - failed
+        if failed:
+            self._set_status(
+                f"Subscribed {subscribed}/{len(pending)} "
+                f"(details in {ERROR_LOG_PATH})"
+            )
+        else:
+            self._set_status(f"Subscribed {subscribed} characteristic(s)")
 
-            self._refresh_gatt_labels()
-            self._render_status()
+    def _notify_callback(self, info: CharacteristicInfo) -> Any:
+        def _cb(sender: Any, data: bytearray) -> None:
+            key = info.key
+            sender_handle = getattr(sender, "handle", None)
+            if isinstance(sender_handle, int):
+                key = self._state.key_by_handle.get(sender_handle, key)
+            self._dispatch_notify(key, bytes(data), info.uuid)
+
+        return _cb
 
     async def action_write_char(self) -> None:
         if not self._client:
@@ -385,8 +518,10 @@ class BleTui(App):
         if info is None and self._selected_char:
             info = self._state.find_char(self._selected_char)
 
-        has_write = info is not None and "write" in info.properties
-        has_write_nr = info is not None and "write-without-response" in info.properties
+        has_write = info is not None and bool(info.props_mask & PROP_WRITE)
+        has_write_nr = info is not None and bool(
+            info.props_mask & PROP_WRITE_NO_RESPONSE
+        )
 
         if not has_write and not has_write_nr:
             self._set_status("Selected characteristic is not writable.")
@@ -409,29 +544,27 @@ class BleTui(App):
     async def _do_write(
         self, info: CharacteristicInfo, data: bytes, use_response: bool
     ) -> None:
-        async with self._ble_lock:
-            try:
-                await self._ble.write_char(
-                    self._client, self._char_target(info), data, response=use_response
-                )
-            except Exception as exc:
-                if use_response:
-                    self._record_error("write_char (with-response, retrying without)", exc)
-                    try:
-                        await self._ble.write_char(
-                            self._client, self._char_target(info), data, response=False
-                        )
-                    except Exception as exc2:
-                        self._record_error("write_char (without-response)", exc2)
-                        self._set_status(f"Write failed (details in {ERROR_LOG_PATH})")
-                        return
-                    self._set_status(
-                        f"Wrote {len(data)} bytes to {info.uuid} (no-response fallback)"
-                    )
+        client, target = self._client, self._char_target(info)
+        try:
+            async with self._op_lock:
+                await self._ble.write_char(client, target, data, response=use_response)
+        except Exception as exc:
+            if use_response:
+                self._record_error("write_char (with-response, retrying without)", exc)
+                try:
+                    async with self._op_lock:
+                        await self._ble.write_char(client, target, data, response=False)
+                except Exception as exc2:
+                    self._record_error("write_char (without-response)", exc2)
+                    self._set_status(f"Write failed (details in {ERROR_LOG_PATH})")
                     return
-                self._record_error("write_char", exc)
-                self._set_status(f"Write failed (details in {ERROR_LOG_PATH})")
+                self._set_status(
+                    f"Wrote {len(data)} bytes to {info.uuid} (no-response fallback)"
+                )
                 return
+            self._record_error("write_char", exc)
+            self._set_status(f"Write failed (details in {ERROR_LOG_PATH})")
+            return
 
         self._set_status(f"Wrote {len(data)} bytes to {info.uuid}")
 
@@ -459,45 +592,123 @@ class BleTui(App):
         return self._state.find_char(key)
 
     def _append_value(self, key: str, data: bytes) -> None:
-        self._state.append_value(key, data)
-        if self._selected_char == key:
+        self._append_values(key, [data])
+
+    def _append_values(self, key: str, payloads: list[bytes]) -> None:
+        shown_version = self._state.log_version.get(key)
+        entries = [self._state.append_value(key, data) for data in payloads]
+        if entries and self._selected_char == key:
+            self._append_to_log_view(key, entries, shown_version)
+
+    def _append_to_log_view(
+        self, key: str, entries: list[LogEntry], prev_version: Optional[int]
+    ) -> None:
+        """Show new entries for the selected characteristic without a full redraw.
+
+        Falls back to a full redraw unless #log showed the log exactly as it
+        was before `entries` were appended (`prev_version`).
+        """
+        if self._log_view_key != key or self._log_view_version != prev_version:
             self._render_log(key)
+            return
+        self._render_history_title(key)
+        self._latest_value.update(
+            self._latest_value_markup(key, entries[-1])
+        )
+        self._log_view_version = self._state.log_version.get(key)
+        log_view = self._log_view
+        for entry in entries[-LOG_MAX:]:
+            log_view.write(log_line(entry))
+
+    def _latest_value_markup(self, key: str, entry: LogEntry) -> str:
+        cached = self._state.latest_markup.get(key)
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        markup = latest_value_markup(entry, self._state.latest_data.get(key, b""))
+        self._state.latest_markup[key] = (entry, markup)
+        return markup
 
     def _dispatch_notify(self, key: str, data: bytes, uuid: str) -> None:
+        # Buffer the payload; the UI is updated at most once per frame, or
+        # as soon as NOTIFY_FLUSH_MAX_BYTES are waiting.
+        with self._notify_lock:
+            self._pending_notifies.setdefault(key, []).append(data)
+            self._pending_status = f"Notify {uuid} ({len(data)} B)"
+            self._pending_bytes += len(data)
+            if self._flush_scheduled:
+                if self._flush_forced or self._pending_bytes < NOTIFY_FLUSH_MAX_BYTES:
+                    return
+                self._flush_forced = True
+                force = True
+            else:
+                self._flush_scheduled = True
+                force = False
+            on_app_thread = self._app_thread_id == threading.get_ident()
         try:
-            self.call_from_thread(self._append_value, key, data)
-            self.call_from_thread(self._set_status, f"Notify {uuid} ({len(data)} B)")
+            if on_app_thread:
+                # Some BLE backends invoke notification callbacks on the app
+                # thread; skip the call_from_thread() round trip, and still
+                # draw a burst arriving within one frame only once.
+                if force:
+                    self._flush_notifies()
+                else:
+                    self.call_after_refresh(self._flush_notifies)
+            elif force:
+                self.call_from_thread(self._flush_notifies)
+            else:
+                self.call_from_thread(self._schedule_flush)
         except Exception as exc:
-            # Some BLE backends invoke notification callbacks on the app thread.
-            # In that case, call_from_thread() raises by design; direct calls are safe.
-            if self._thread_id == threading.get_ident():
-                self._append_value(key, data)
-                self._set_status(f"Notify {uuid} ({len(data)} B)")
-                return
             # If we can't marshal to the main thread (typically during shutdown),
             # avoid touching Textual widgets from the BLE callback thread.
+            with self._notify_lock:
+                self._pending_notifies.clear()
+                self._pending_bytes = 0
+                self._flush_scheduled = False
+                self._flush_forced = False
             self._record_error("notify_dispatch", exc)
 
+    def _schedule_flush(self) -> None:
+        asyncio.get_running_loop().call_later(
+            NOTIFY_FLUSH_INTERVAL_S, self._flush_notifies
+        )
+
+    def _flush_notifies(self) -> None:
+        with self._notify_lock:
+            pending = self._pending_notifies
+            status = self._pending_status
+            self._pending_notifies = {}
+            self._pending_status = None
+            self._pending_bytes = 0
+            self._flush_scheduled = False
+            self._flush_forced = False
+        for key, payloads in pending.items():
+            self._append_values(key, payloads)
+        if status is not None:
+            self._set_status(status)
+
     def _render_log(self, key: str) -> None:
-        log_view = self.query_one("#log", RichLog)
+        logs = self._state.logs.get(key, [])
+        version = self._state.log_version.get(key)
+        if self._log_view_key == key and self._log_view_version == version:
+            return
+        log_view = self._log_view
         log_view.clear()
+        self._log_view_key = key
+        self._log_view_version = version
 
         # Update history title with count
         self._render_history_title(key)
 
         info = self._state.find_char(key)
-        self.query_one("#log_meta", Static).update(log_meta(info))
+        self._log_meta.update(log_meta(info))
 
         # Update latest value display
-        logs = self._state.logs.get(key, [])
         if logs:
-            latest_entry = logs[-1]
-            latest_data = self._state.latest_data.get(key, b"")
-            self.query_one("#latest_value", Static).update(
-                latest_value_markup(latest_entry, latest_data)
+            self._latest_value.update(
+                self._latest_value_markup(key, logs[-1])
             )
         else:
-            self.query_one("#latest_value", Static).update(
+            self._latest_value.update(
                 "[dim]No data received yet[/]"
             )
 
@@ -505,32 +716,45 @@ class BleTui(App):
         for entry in logs:
             log_view.write(log_line(entry))
 
-    def _iter_tree_nodes(self, root: Any) -> list[Any]:
-        nodes: list[Any] = []
+    def _iter_tree_nodes(self, root: Any) -> Iterator[Any]:
         stack = [root]
         while stack:
             node = stack.pop()
-            nodes.append(node)
-            children = list(getattr(node, "children", []))
-            if children:
-                stack.extend(reversed(children))
-        return nodes
-
-    def _refresh_gatt_labels(self) -> None:
-        gatt = self.query_one("#gatt", Tree)
+            yield node
+            stack.extend(reversed(getattr(node, "children", ())))
+
+    def _refresh_gatt_labels(self, key: Optional[str] = None) -> None:
+        """Relabel one characteristic node, or all of them when key is None.
+
+        Single-key refreshes go through the node index built by _discover_gatt;
+        the full tree walk is only a fallback and rebuilds that index.
+        """
+        if key is not None:
+            node = self._char_nodes.get(key)
+            if node is not None:
+                node.label = characteristic_label(
+                    node.data, key in self._state.subscribed
+                )
+                return
+
+        gatt = self._gatt_tree
+        self._char_nodes.clear()
         for node in self._iter_tree_nodes(gatt.root):
             info = node.data
             if isinstance(info, CharacteristicInfo):
+                self._char_nodes[info.key] = node
                 node.label = characteristic_label(
                     info, info.key in self._state.subscribed
                 )
 
     def _select_device_from_cursor(self) -> bool:
-        devices = self.query_one("#devices", DataTable)
+        devices = self._devices_table
         cursor_row = devices.cursor_row
-        if cursor_row is None or cursor_row >= len(self._state.device_order):
+        if cursor_row is None or cursor_row >= len(self._state.devices):
             return False
-        self._selected_device = self._state.device_order[cursor_row]
+        self._selected_device = next(
+            islice(self._state.device_addresses(), cursor_row, None)
+        )
         return True
 
     async def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
@@ -543,9 +767,21 @@ class BleTui(App):
     async def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
         info = event.node.data
         if isinstance(info, CharacteristicInfo):
+            if self._selected_char == info.key:
+                return
             self._selected_char = info.key
             self._render_status()
-            self._render_log(info.key)
+            # Defer the log redraw so fast cursor movement renders only once.
+            if self._highlight_timer is not None:
+                self._highlight_timer.stop()
+            self._highlight_timer = self.set_timer(
+                HIGHLIGHT_RENDER_DELAY_S, self._flush_render
+            )
+
+    def _flush_render(self) -> None:
+        self._highlight_timer = None
+        if self._selected_char:
+            self._render_log(self._selected_char)
 
     async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         self._selected_device = event.row_key.value
@@ -555,18 +791,13 @@ class BleTui(App):
     ) -> None:
         self._selected_device = event.row_key.value
 
-    def _pane_widgets(self) -> list[Any]:
-        return [
-            self.query_one("#devices", DataTable),
-            self.query_one("#gatt", Tree),
-            self.query_one("#latest_value_scroll", VerticalScroll),
-            self.query_one("#log", RichLog),
-        ]
+    def _pane_widgets(self) -> tuple[Any, ...]:
+        return self._panes
 
     def action_toggle_value_height(self) -> None:
         self._expanded_value = not self._expanded_value
-        scroll = self.query_one("#latest_value_scroll", VerticalScroll)
-        log = self.query_one("#log", RichLog)
+        scroll = self._latest_value_scroll
+        log = self._log_view
         if self._expanded_value:
             scroll.add_class("expanded")
             log.add_class("collapsed")
@@ -614,7 +845,7 @@ class BleTui(App):
             if isinstance(focused, Tree):
                 if self._selected_char:
                     info = self._state.find_char(self._selected_char)
-                    if info and "read" in info.properties:
+                    if info and info.props_mask & PROP_READ:
                         await self.action_read_char()
                         return
                 self._set_status("Select a readable characteristic to read.")
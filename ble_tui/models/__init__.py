@@ -1,5 +1,23 @@
-from ble_tui.models.characteristic import CharacteristicInfo
+from ble_tui.models.characteristic import (
+    PROP_BITS,
+    PROP_INDICATE,
+    PROP_NOTIFY,
+    PROP_READ,
+    PROP_WRITE,
+    PROP_WRITE_NO_RESPONSE,
+    CharacteristicInfo,
+)
 from ble_tui.models.device import DeviceInfo
 from ble_tui.models.log_entry import LogEntry
 
-__all__ = ["DeviceInfo", "CharacteristicInfo", "LogEntry"]
+__all__ = [
+    "DeviceInfo",
+    "CharacteristicInfo",
+    "LogEntry",
+    "PROP_BITS",
+    "PROP_READ",
+    "PROP_WRITE",
+    "PROP_WRITE_NO_RESPONSE",
+    "PROP_NOTIFY",
+    "PROP_INDICATE",
+]
@@ -1,11 +1,52 @@
-from dataclasses import dataclass
-from typing import Any
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
+# One bit per GATT characteristic property name reported by bleak
+PROP_BITS: dict[str, int] = {
+    name: 1 << i
+    for i, name in enumerate((
+        "broadcast",
+        "read",
+        "write-without-response",
+        "write",
+        "notify",
+        "indicate",
+        "authenticated-signed-writes",
+        "extended-properties",
+        "reliable-write",
+        "writable-auxiliaries",
+    ))
+}
+PROP_READ = PROP_BITS["read"]
+PROP_WRITE = PROP_BITS["write"]
+PROP_WRITE_NO_RESPONSE = PROP_BITS["write-without-response"]
+PROP_NOTIFY = PROP_BITS["notify"]
+PROP_INDICATE = PROP_BITS["indicate"]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CharacteristicInfo:
     key: str
     uuid: str
     properties: tuple[str, ...]
     service_uuid: str
     char: Any
+    # ATT handle of `char`; read from it when not given
+    handle: Optional[int] = None
+    # Derived from `properties`: PROP_* bitmask for membership checks and
+    # the rendered list
+    props_mask: int = field(init=False, repr=False, compare=False)
+    props_display: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # UUIDs repeat across characteristics and reconnects; share one string
+        object.__setattr__(self, "uuid", sys.intern(self.uuid))
+        object.__setattr__(self, "service_uuid", sys.intern(self.service_uuid))
+        if self.handle is None:
+            object.__setattr__(self, "handle", getattr(self.char, "handle", None))
+        mask = 0
+        for name in self.properties:
+            mask |= PROP_BITS.get(name, 0)
+        object.__setattr__(self, "props_mask", mask)
+        object.__setattr__(self, "props_display", ", ".join(self.properties))
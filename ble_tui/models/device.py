@@ -1,8 +1,13 @@
+import sys
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     name: str
     address: str
     rssi: int
+
+    def __post_init__(self) -> None:
+        # Devices recur across scans; share one string per address
+        object.__setattr__(self, "address", sys.intern(self.address))
@@ -1,4 +1,5 @@
 from ble_tui.services.ble_service import BleService
+from ble_tui.services.error_log import ErrorLogService
 from ble_tui.services.state_service import StateService
 
-__all__ = ["BleService", "StateService"]
+__all__ = ["BleService", "ErrorLogService", "StateService"]
@@ -1,14 +1,63 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import os
+from operator import attrgetter
 from typing import Any, Callable, Dict, Optional
 
 from bleak import BleakClient, BleakScanner
 
 from ble_tui.models import CharacteristicInfo, DeviceInfo
-from ble_tui.utils import CONNECT_TIMEOUT_S, SCAN_TIMEOUT_S
+from ble_tui.utils import CONNECT_TIMEOUT_S, NOTIFY_CONCURRENCY, SCAN_TIMEOUT_S
+
+
+# Sorted property tuples shared by every characteristic with the same set.
+_PROPS_CANON: Dict[frozenset[str], tuple[str, ...]] = {}
+
+
+def _canonical_props(properties: Any) -> tuple[str, ...]:
+    key = frozenset(properties)
+    props = _PROPS_CANON.get(key)
+    if props is None:
+        props = _PROPS_CANON[key] = tuple(sorted(key))
+    return props
+
+
+def _char_info(service_uuid: str, char: Any) -> CharacteristicInfo:
+    handle = getattr(char, "handle", None)
+    if handle is None:
+        key = f"{service_uuid}:{char.uuid}"
+    else:
+        key = f"{service_uuid}:{char.uuid}:{handle}"
+    return CharacteristicInfo(
+        key=key,
+        uuid=char.uuid,
+        properties=_canonical_props(char.properties),
+        service_uuid=service_uuid,
+        char=char,
+        handle=handle,
+    )
+
+
+def _env_service_uuids() -> list[str]:
+    raw = os.environ.get("BLETUI_SCAN_SERVICES", "")
+    return [uuid.strip().lower() for uuid in raw.split(",") if uuid.strip()]
 
 
 class BleService:
+    def __init__(
+        self,
+        service_uuids: Optional[list[str]] = None,
+        scanner: Optional[Any] = None,
+    ) -> None:
+        # Advertised service UUIDs to scan for; empty means no filter.
+        self._service_uuids = (
+            list(service_uuids) if service_uuids is not None else _env_service_uuids()
+        )
+        # Anything with BleakScanner's discover() classmethod signature.
+        self._scanner = scanner if scanner is not None else BleakScanner
+
     async def _resolve_services(self, client: BleakClient) -> Any:
         """Resolve services across Bleak versions/backends."""
         services = getattr(client, "services", None)
@@ -26,14 +75,26 @@ class BleService:
 
         return []
 
-    async def scan(self) -> list[DeviceInfo]:
-        found = await BleakScanner.discover(timeout=SCAN_TIMEOUT_S, return_adv=True)
-        devices: list[DeviceInfo] = []
-        for d, adv in found.values():
-            rssi = adv.rssi if adv.rssi is not None else -999
-            name = d.name or adv.local_name or ""
-            devices.append(DeviceInfo(name=name, address=d.address, rssi=rssi))
-        devices.sort(key=lambda x: x.rssi, reverse=True)
+    async def scan(self, limit: Optional[int] = None) -> list[DeviceInfo]:
+        """Scan for devices, strongest signal first; at most `limit` if given."""
+        kwargs: Dict[str, Any] = {}
+        if self._service_uuids:
+            # Let the OS drop unrelated advertisements where supported.
+            kwargs["service_uuids"] = self._service_uuids
+        found = await self._scanner.discover(
+            timeout=SCAN_TIMEOUT_S, return_adv=True, **kwargs
+        )
+        devices = [
+            DeviceInfo(
+                name=d.name or adv.local_name or "",
+                address=d.address,
+                rssi=adv.rssi if adv.rssi is not None else -999,
+            )
+            for d, adv in found.values()
+        ]
+        if limit is not None:
+            return heapq.nlargest(limit, devices, key=attrgetter("rssi"))
+        devices.sort(key=attrgetter("rssi"), reverse=True)
         return devices
 
     async def connect(
@@ -53,33 +114,18 @@ class BleService:
         self, client: BleakClient
     ) -> tuple[Dict[str, list[CharacteristicInfo]], Dict[int, str], int, int]:
         services = await self._resolve_services(client)
-        mapped: Dict[str, list[CharacteristicInfo]] = {}
-        key_by_handle: Dict[int, str] = {}
-
-        service_count = 0
-        char_count = 0
-        for svc in services:
-            service_count += 1
-            chars: list[CharacteristicInfo] = []
-            for char in svc.characteristics:
-                char_count += 1
-                props = tuple(sorted(char.properties))
-                handle = getattr(char, "handle", None)
-                if handle is not None:
-                    key = f"{svc.uuid}:{char.uuid}:{handle}"
-                    key_by_handle[handle] = key
-                else:
-                    key = f"{svc.uuid}:{char.uuid}"
-                chars.append(
-                    CharacteristicInfo(
-                        key=key,
-                        uuid=char.uuid,
-                        properties=props,
-                        service_uuid=svc.uuid,
-                        char=char,
-                    )
-                )
-            mapped[svc.uuid] = chars
+        mapped: Dict[str, list[CharacteristicInfo]] = {
+            svc.uuid: [_char_info(svc.uuid, char) for char in svc.characteristics]
+            for svc in services
+        }
+        key_by_handle: Dict[int, str] = {
+            info.handle: info.key
+            for chars in mapped.values()
+            for info in chars
+            if info.handle is not None
+        }
+        service_count = len(mapped)
+        char_count = sum(map(len, mapped.values()))
 
         return mapped, key_by_handle, service_count, char_count
 
@@ -94,6 +140,29 @@ class BleService:
     ) -> None:
         await client.start_notify(target, callback)
 
+    async def start_notify_many(
+        self,
+        client: BleakClient,
+        subscriptions: list[tuple[str | int, Callable[[Any, bytearray], None]]],
+    ) -> list[Optional[BaseException]]:
+        """Subscribe to several characteristics concurrently.
+
+        Returns one entry per subscription: None on success, else the exception.
+        """
+        sem = asyncio.Semaphore(NOTIFY_CONCURRENCY)
+
+        async def _start(
+            target: str | int, callback: Callable[[Any, bytearray], None]
+        ) -> None:
+            async with sem:
+                await client.start_notify(target, callback)
+
+        results = await asyncio.gather(
+            *(_start(target, callback) for target, callback in subscriptions),
+            return_exceptions=True,
+        )
+        return [r if isinstance(r, BaseException) else None for r in results]
+
     async def write_char(
         self, client: BleakClient, target: str | int, data: bytes, response: bool = True
     ) -> None:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Optional, Union
+
+from ble_tui.utils import ERROR_LOG_MAX_BYTES, ERROR_LOG_PATH
+
+_Item = Union[tuple[float, str, BaseException], threading.Event]
+
+
+class ErrorLogService:
+    """Append error tracebacks to a log file from a background thread.
+
+    `record()` only enqueues, so callers on the asyncio loop never block on
+    traceback formatting or disk I/O. If the file cannot be opened, entries
+    are dropped unformatted for `retry_after_s` before trying again.
+    """
+
+    def __init__(
+        self,
+        path: str = ERROR_LOG_PATH,
+        max_bytes: int = ERROR_LOG_MAX_BYTES,
+        retry_after_s: float = 10.0,
+    ) -> None:
+        self.path = path
+        self._max_bytes = max_bytes
+        self._retry_after_s = retry_after_s
+        self._dead_until = 0.0
+        self._queue: queue.SimpleQueue[_Item] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def record(self, context: str, exc: BaseException) -> None:
+        self._queue.put_nowait((time.time(), context, exc))
+        self._ensure_worker()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far has been written."""
+        done = threading.Event()
+        self._queue.put_nowait(done)
+        self._ensure_worker()
+        return done.wait(timeout)
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ble-tui-error-log", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            ts, context, exc = item
+            if time.monotonic() < self._dead_until:
+                continue
+            try:
+                self._rotate_if_needed()
+                f = open(self.path, "a", encoding="utf-8")
+            except OSError:
+                self._dead_until = time.monotonic() + self._retry_after_s
+                continue
+            try:
+                with f:
+                    details = "".join(
+                        traceback.format_exception(type(exc), exc, exc.__traceback__)
+                    )
+                    stamp = datetime.fromtimestamp(ts).isoformat(timespec="seconds")
+                    f.write(f"[{stamp}] {context}\n{details}\n")
+            except Exception:
+                pass
+
+    def _rotate_if_needed(self) -> None:
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size >= self._max_bytes:
+            os.replace(self.path, f"{self.path}.1")
@@ -1,36 +1,55 @@
 from __future__ import annotations
 
+import time
 from collections import deque
-from datetime import datetime
-from typing import Any, Deque, Dict, Optional
+from typing import Any, Deque, Dict, KeysView, Optional
 
 from ble_tui.models import CharacteristicInfo, DeviceInfo, LogEntry
-from ble_tui.utils import LOG_MAX, hex_groups, try_parse_json
+from ble_tui.utils import LOG_MAX, format_payload
 
 
 class StateService:
     def __init__(self) -> None:
         self.devices: Dict[str, DeviceInfo] = {}
-        self.device_order: list[str] = []
+        self.device_index: Dict[str, int] = {}
         self.services: Dict[str, list[CharacteristicInfo]] = {}
+        self.chars_by_key: Dict[str, CharacteristicInfo] = {}
         self.key_by_handle: Dict[int, str] = {}
         self.logs: Dict[str, Deque[LogEntry]] = {}
+        # Bumped on every change to a key's log; unlike len(), it keeps
+        # moving once the deque is full at LOG_MAX
+        self.log_version: Dict[str, int] = {}
+        self._log_seq = 0
         self.subscribed: set[str] = set()
         self.latest_data: Dict[str, bytes] = {}
+        # Rendered "latest value" markup, reused while the latest entry is unchanged
+        self.latest_markup: Dict[str, tuple[LogEntry, str]] = {}
+        # "HH:MM:SS" of the last formatted second, reused by _timestamp()
+        self._ts_second = -1
+        self._ts_prefix = ""
 
     def replace_devices(self, devices: list[DeviceInfo]) -> None:
         self.devices.clear()
-        self.device_order.clear()
+        self.device_index.clear()
         for dev in devices:
+            if dev.address in self.devices:
+                continue
+            self.device_index[dev.address] = len(self.devices)
             self.devices[dev.address] = dev
-            self.device_order.append(dev.address)
+
+    def device_addresses(self) -> KeysView[str]:
+        """Device addresses in display (RSSI-sorted) order."""
+        return self.devices.keys()
 
     def clear_connection_state(self) -> None:
         self.services.clear()
+        self.chars_by_key.clear()
         self.key_by_handle.clear()
         self.subscribed.clear()
         self.latest_data.clear()
+        self.latest_markup.clear()
         self.logs.clear()
+        self.log_version.clear()
 
     def set_gatt(
         self,
@@ -39,36 +58,63 @@ class StateService:
     ) -> None:
         self.services = services
         self.key_by_handle = key_by_handle
+        self.chars_by_key = {
+            info.key: info for chars in services.values() for info in chars
+        }
 
     def find_char(self, key: str) -> Optional[CharacteristicInfo]:
+        info = self.chars_by_key.get(key)
+        if info is not None:
+            return info
+        # Fallback for services populated without set_gatt().
         for chars in self.services.values():
             for info in chars:
                 if info.key == key:
+                    self.chars_by_key[key] = info
                     return info
         return None
 
     def append_value(self, key: str, data: bytes) -> LogEntry:
+        hex_str, json_str = format_payload(data)
         entry = LogEntry(
-            ts=datetime.now().strftime("%H:%M:%S.%f")[:-3],
+            ts=self._timestamp(),
             size=len(data),
-            hex_str=hex_groups(data),
-            json_str=try_parse_json(data),
+            hex_str=hex_str,
+            json_str=json_str,
         )
-        log = self.logs.setdefault(key, deque(maxlen=LOG_MAX))
+        log = self.logs.get(key)
+        if log is None:
+            log = self.logs[key] = deque(maxlen=LOG_MAX)
         log.append(entry)
+        self._bump_log_version(key)
         self.latest_data[key] = data  # Store original bytes
         return entry
 
+    def _bump_log_version(self, key: str) -> None:
+        self._log_seq += 1
+        self.log_version[key] = self._log_seq
+
+    def _timestamp(self) -> str:
+        """Local "HH:MM:SS.mmm"; strftime runs at most once per second."""
+        now = time.time()
+        second = int(now)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime("%H:%M:%S", time.localtime(second))
+        return f"{self._ts_prefix}.{int((now - second) * 1000):03d}"
+
     def clear_char_log(self, key: str) -> None:
         """Clear logs and latest data for a specific characteristic."""
         if key in self.logs:
             self.logs[key].clear()
+            self._bump_log_version(key)
         if key in self.latest_data:
             del self.latest_data[key]
+        self.latest_markup.pop(key, None)
 
     @staticmethod
     def char_target(info: CharacteristicInfo) -> str | int:
-        handle = getattr(info.char, "handle", None)
+        handle = info.handle
         return handle if handle is not None else info.uuid
 
     @staticmethod
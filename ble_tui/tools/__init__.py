@@ -0,0 +1 @@
+"""Diagnostic helpers shared by the root-level scripts."""
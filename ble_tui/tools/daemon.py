@@ -0,0 +1,249 @@
+"""Long-lived BLE connection shared by the diagnostic scripts.
+
+Start it once with `python -m ble_tui.tools.daemon`; `ble_dump.py` and
+`ble_notify_probe.py` then send JSON requests over a unix socket instead of
+connecting and discovering services on every run. The socket lives in
+$XDG_RUNTIME_DIR, or in a per-user file under the temp directory. Requests are one JSON
+object per line, e.g. `{"op": "dump", "address": "AA:BB:..."}` or
+`{"op": "notify", "address": "...", "uuids": [...], "duration": 12}`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import getpass
+import json
+import math
+import os
+import socket
+import stat
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+from bleak import BleakClient
+
+from ble_tui.utils import CONNECT_TIMEOUT_S, NOTIFY_CONCURRENCY
+
+
+def _default_socket_path() -> str:
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "ble_tui_daemon.sock")
+    return os.path.join(
+        tempfile.gettempdir(), f"ble_tui_daemon-{getpass.getuser()}.sock"
+    )
+
+
+SOCKET_PATH = os.getenv("BLETUI_DAEMON_SOCKET") or _default_socket_path()
+
+
+def _parse_request(req: Any) -> tuple[str, str, list[str], float]:
+    """Validate a request; raises ValueError before any connection is touched."""
+    if not isinstance(req, dict):
+        raise ValueError("request must be a JSON object")
+    op = req.get("op")
+    if op not in ("dump", "notify"):
+        raise ValueError(f"unknown op: {op!r}")
+    address = req.get("address")
+    if not isinstance(address, str) or not address:
+        raise ValueError("address must be a non-empty string")
+    if op == "dump":
+        return op, address, [], 0.0
+    uuids = req.get("uuids", [])
+    if not isinstance(uuids, list) or not all(isinstance(u, str) for u in uuids):
+        raise ValueError("uuids must be a list of strings")
+    duration = req.get("duration", 0)
+    if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+        raise ValueError("duration must be a number")
+    duration = float(duration)
+    if not math.isfinite(duration) or duration < 0:
+        raise ValueError("duration must be a finite, non-negative number")
+    return op, address, uuids, duration
+
+
+class BleDaemon:
+    """Keep one connected client and its service layout per address."""
+
+    def __init__(self, client_factory: Callable[[str], Any] = BleakClient) -> None:
+        self._client_factory = client_factory
+        self._clients: Dict[str, Any] = {}
+        self._layouts: Dict[str, list[dict[str, Any]]] = {}
+        # Guards connecting and (un)subscribing; not held while a notify
+        # request is collecting events.
+        self._lock = asyncio.Lock()
+
+    async def _client(self, address: str) -> Any:
+        client = self._clients.get(address)
+        if client is not None and client.is_connected:
+            return client
+        self._layouts.pop(address, None)
+        client = self._client_factory(address)
+        await client.connect(timeout=CONNECT_TIMEOUT_S)
+        self._clients[address] = client
+        return client
+
+    async def _forget(self, address: str) -> None:
+        """Drop and disconnect the cached client so nothing keeps the link up."""
+        async with self._lock:
+            client = self._clients.pop(address, None)
+            self._layouts.pop(address, None)
+            if client is None:
+                return
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
+
+    async def dump(self, address: str) -> list[dict[str, Any]]:
+        client = await self._client(address)
+        layout = self._layouts.get(address)
+        if layout is None:
+            layout = [
+                {
+                    "uuid": svc.uuid,
+                    "characteristics": [
+                        {
+                            "uuid": ch.uuid,
+                            "properties": sorted(ch.properties),
+                            "handle": getattr(ch, "handle", None),
+                        }
+                        for ch in svc.characteristics
+                    ],
+                }
+                for svc in client.services
+            ]
+            self._layouts[address] = layout
+        return layout
+
+    async def notify(
+        self, address: str, uuids: list[str], duration: float
+    ) -> dict[str, Any]:
+        events: list[dict[str, Any]] = []
+        sem = asyncio.Semaphore(NOTIFY_CONCURRENCY)
+
+        def _callback(uuid: str) -> Callable[[Any, bytearray], None]:
+            def _cb(_: Any, data: bytearray) -> None:
+                events.append({"uuid": uuid, "hex": bytes(data).hex()})
+
+            return _cb
+
+        async def _start(uuid: str) -> None:
+            async with sem:
+                await client.start_notify(uuid, _callback(uuid))
+
+        async with self._lock:
+            client = await self._client(address)
+            results = await asyncio.gather(
+                *(_start(uuid) for uuid in uuids), return_exceptions=True
+            )
+        subscribed = [u for u, r in zip(uuids, results) if r is None]
+        errors = {u: repr(r) for u, r in zip(uuids, results) if r is not None}
+
+        await asyncio.sleep(duration)
+        async with self._lock:
+            for uuid in subscribed:
+                try:
+                    await client.stop_notify(uuid)
+                except Exception:
+                    pass
+        return {"subscribed": subscribed, "errors": errors, "events": events}
+
+    async def handle(self, req: dict[str, Any]) -> dict[str, Any]:
+        try:
+            op, address, uuids, duration = _parse_request(req)
+        except ValueError as exc:
+            # Malformed request: leave cached connections alone.
+            return {"ok": False, "error": str(exc)}
+        try:
+            if op == "dump":
+                async with self._lock:
+                    return {"ok": True, "services": await self.dump(address)}
+            result = await self.notify(address, uuids, duration)
+            return {"ok": True, **result}
+        except Exception as exc:
+            # Reconnect and re-discover on the next request.
+            await self._forget(address)
+            return {"ok": False, "error": repr(exc)}
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                reply = await self.handle(json.loads(line))
+            except json.JSONDecodeError as exc:
+                reply = {"ok": False, "error": repr(exc)}
+            writer.write(json.dumps(reply).encode() + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Unlink `path` only if it is our own socket with no daemon behind it."""
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)  # nothing listening: left over from a crashed daemon
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(f"a daemon is already listening on {path}")
+
+
+async def serve(path: str = SOCKET_PATH, daemon: Optional[BleDaemon] = None) -> None:
+    daemon = daemon or BleDaemon()
+    _remove_stale_socket(path)
+    server = await asyncio.start_unix_server(daemon._serve_connection, path=path)
+    async with server:
+        await server.serve_forever()
+
+
+def request(
+    payload: dict[str, Any], path: str = SOCKET_PATH, timeout: Optional[float] = None
+) -> Optional[dict[str, Any]]:
+    """Send one request to a running daemon.
+
+    Returns None when the daemon cannot be used (no unix sockets on this
+    platform, nothing listening, any socket error or timeout, or a reply
+    that is not valid JSON), so callers fall back to a direct connection.
+    Without `timeout`, waits up to CONNECT_TIMEOUT_S plus the request's
+    notify duration.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    if timeout is None:
+        duration = payload.get("duration", 0)
+        if isinstance(duration, bool) or not isinstance(duration, (int, float)):
+            duration = 0
+        timeout = CONNECT_TIMEOUT_S + max(float(duration), 0.0)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+if __name__ == "__main__":
+    print(f"Listening on {SOCKET_PATH}")
+    asyncio.run(serve())
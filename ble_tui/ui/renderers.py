@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 from ble_tui.models import CharacteristicInfo, LogEntry
@@ -17,11 +18,7 @@ def status_line(
         conn = f"Connected {connected_address}"
 
     scan = "Scanning" if scan_in_progress else "Idle"
-    selected = "-"
-    if selected_char:
-        parts = selected_char.split(":")
-        if len(parts) > 1:
-            selected = parts[1][:8]
+    selected = _selected_char_label(selected_char) if selected_char else "-"
 
     return (
         f"[CONN {conn}] [SCAN {scan}] [CHAR {selected}] "
@@ -29,20 +26,39 @@ def status_line(
     )
 
 
+@lru_cache(maxsize=64)
+def _selected_char_label(selected_char: str) -> str:
+    """Short characteristic id for the status line; changes only on selection."""
+    parts = selected_char.split(":")
+    if len(parts) > 1:
+        return parts[1][:8]
+    return "-"
+
+
 def characteristic_label(info: CharacteristicInfo, subscribed: bool) -> str:
-    props = ", ".join(info.properties)
+    return _characteristic_label(
+        info.uuid, info.props_display, info.handle, subscribed
+    )
+
+
+@lru_cache(maxsize=512)
+def _characteristic_label(
+    uuid: str, props: str, handle: Optional[int], subscribed: bool
+) -> str:
     mark = " [N]" if subscribed else ""
-    handle = getattr(info.char, "handle", None)
     handle_label = f" h={handle}" if handle is not None else ""
-    return f"{info.uuid}{handle_label} [{props}]{mark}"
+    return f"{uuid}{handle_label} [{props}]{mark}"
 
 
 def log_meta(info: Optional[CharacteristicInfo]) -> str:
     if info is None:
         return "No characteristic selected"
-    return f"{info.uuid} [{', '.join(info.properties)}]"
+    return f"{info.uuid} [{info.props_display}]"
 
 
+# LogEntry is frozen and hashable, so formatted output can be memoised on it;
+# repaints of unchanged entries then skip the formatting entirely.
+@lru_cache(maxsize=1024)
 def log_line(entry: LogEntry) -> str:
     hex_preview = entry.hex_str
     if len(hex_preview) > 52:
@@ -52,23 +68,19 @@ def log_line(entry: LogEntry) -> str:
     return f"{entry.ts} | {entry.size:4d}B | {hex_preview}"
 
 
+_LATEST_HEADER = "[dim]{ts}[/] | [yellow]{size}B[/]\n\n[bold]Hex:[/]\n{hex}"
+_LATEST_JSON = "\n\n[bold]JSON:[/]\n{pretty}"
+
+
 def latest_value_markup(entry: LogEntry, data: bytes) -> str:
     """Render latest value with Rich markup for syntax highlighting."""
     from ble_tui.utils.formatting import pretty_json_with_highlighting
 
-    lines = [
-        f"[dim]{entry.ts}[/] | [yellow]{entry.size}B[/]",
-        "",
-        "[bold]Hex:[/]",
-        entry.hex_str,
-    ]
-
+    header = _LATEST_HEADER.format(ts=entry.ts, size=entry.size, hex=entry.hex_str)
+    # json_str is set once at ingest; binary payloads skip the JSON work here.
+    if entry.json_str is None:
+        return header
     pretty_json = pretty_json_with_highlighting(data)
-    if pretty_json:
-        lines.extend([
-            "",
-            "[bold]JSON:[/]",
-            pretty_json
-        ])
-
-    return "\n".join(lines)
+    if not pretty_json:
+        return header
+    return header + _LATEST_JSON.format(pretty=pretty_json)
@@ -12,17 +12,15 @@ from ble_tui.ui.styles import WRITE_DIALOG_CSS
 def parse_hex_string(hex_str: str) -> bytes | None:
     """Parse a hex string like 'AA BB CC' or 'AABBCC' into bytes.
 
-    Returns None if the string contains invalid hex characters.
+    Returns None for empty input or if the string contains invalid hex
+    characters. bytes.fromhex() itself skips ASCII whitespace between bytes
+    and rejects odd-length input.
     """
-    cleaned = hex_str.replace(" ", "").replace("\t", "").replace("\n", "")
-    if not cleaned:
-        return None
-    if len(cleaned) % 2 != 0:
-        return None
     try:
-        return bytes.fromhex(cleaned)
+        data = bytes.fromhex(hex_str)
     except ValueError:
         return None
+    return data or None
 
 
 class WriteDialog(ModalScreen[tuple[bytes, bool] | None]):
@@ -1,5 +1,20 @@
-from ble_tui.utils.constants import CONNECT_TIMEOUT_S, ERROR_LOG_PATH, LOG_MAX, SCAN_TIMEOUT_S
-from ble_tui.utils.formatting import hex_groups, pretty_json_with_highlighting, try_parse_json
+from ble_tui.utils.constants import (
+    CONNECT_TIMEOUT_S,
+    ERROR_LOG_MAX_BYTES,
+    ERROR_LOG_PATH,
+    HIGHLIGHT_RENDER_DELAY_S,
+    LOG_MAX,
+    NOTIFY_CONCURRENCY,
+    NOTIFY_FLUSH_INTERVAL_S,
+    NOTIFY_FLUSH_MAX_BYTES,
+    SCAN_TIMEOUT_S,
+)
+from ble_tui.utils.formatting import (
+    format_payload,
+    hex_groups,
+    pretty_json_with_highlighting,
+    try_parse_json,
+)
 from ble_tui.utils.platform_support import format_ble_error
 
 __all__ = [
@@ -7,7 +22,13 @@ __all__ = [
     "CONNECT_TIMEOUT_S",
     "LOG_MAX",
     "ERROR_LOG_PATH",
+    "ERROR_LOG_MAX_BYTES",
+    "HIGHLIGHT_RENDER_DELAY_S",
+    "NOTIFY_CONCURRENCY",
+    "NOTIFY_FLUSH_INTERVAL_S",
+    "NOTIFY_FLUSH_MAX_BYTES",
     "hex_groups",
+    "format_payload",
     "try_parse_json",
     "pretty_json_with_highlighting",
     "format_ble_error",
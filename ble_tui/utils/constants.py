@@ -1,4 +1,21 @@
+import os
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
 SCAN_TIMEOUT_S = 10.0
 CONNECT_TIMEOUT_S = 15.0
-LOG_MAX = 200
+LOG_MAX = _env_positive_int("BLETUI_HISTORY", 200)
 ERROR_LOG_PATH = "ble_tui_errors.log"
+ERROR_LOG_MAX_BYTES = 1_000_000
+# Cap on in-flight CCCD writes; some backends (CoreBluetooth) choke on large bursts
+NOTIFY_CONCURRENCY = 4
+NOTIFY_FLUSH_INTERVAL_S = 0.016
+NOTIFY_FLUSH_MAX_BYTES = 64 * 1024
+HIGHLIGHT_RENDER_DELAY_S = 0.05
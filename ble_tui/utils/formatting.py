@@ -1,36 +1,175 @@
 import json
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 
-def hex_groups(data: bytes) -> str:
+# Single-pass highlighting for pretty_json_with_highlighting. The key branch
+# only looks ahead at the colon so the value after it can still match.
+# Strings allow backslash escapes (\" inside keys and values) and numbers
+# cover the full JSON grammar (sign, fraction, exponent).
+_JSON_STRING = r'"(?:[^"\\]|\\.)*"'
+_JSON_RE = re.compile(
+    rf'(?P<key>{_JSON_STRING})\s*(?=:)'
+    rf'|:\s*(?P<str>{_JSON_STRING})'
+    r'|:\s*(?P<num>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)'
+    r'|:\s*(?P<kw>true|false|null)'
+)
+_VALUE_COLORS = {"str": "green", "num": "yellow", "kw": "magenta"}
+
+
+def _highlight(match: re.Match[str]) -> str:
+    kind = match.lastgroup
+    if kind == "key":
+        return f"[cyan]{match['key']}[/]"
+    return f": [{_VALUE_COLORS[kind]}]{match[kind]}[/]"
+
+
+# First/last bytes a JSON document can start/end with (including surrounding
+# whitespace); "e" and "l" end true/false and null.
+_JSON_FIRST_BYTES = frozenset(b'{["-0123456789tfn \t\r\n')
+_JSON_LAST_BYTES = frozenset(b'}]"0123456789el \t\r\n')
+# Bytes that never occur in UTF-8 JSON text: control characters other than
+# whitespace, and bytes that are invalid anywhere in UTF-8.
+_NON_JSON_BYTE = re.compile(rb"[\x00-\x08\x0b\x0c\x0e-\x1f\xc0\xc1\xf5-\xff]")
+
+
+def _may_be_json(data: bytes) -> bool:
+    # Most notify payloads are binary; skip decoding/parsing when the first
+    # or last byte cannot start or end a JSON document, or any byte cannot
+    # appear in JSON text at all.
+    return (
+        bool(data)
+        and data[0] in _JSON_FIRST_BYTES
+        and data[-1] in _JSON_LAST_BYTES
+        and _NON_JSON_BYTE.search(data) is None
+    )
+
+
+_NOT_JSON = object()
+
+# Parsed payloads up to this size are cached for reuse by the pretty
+# printer; larger ones are parsed on every call instead of being pinned.
+_LOAD_CACHE_MAX_BYTES = 4096
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse `data` once for both formatters; _NOT_JSON when it isn't JSON."""
+    if len(data) > _LOAD_CACHE_MAX_BYTES:
+        return _load_json_uncached(data)
+    return _load_json_cached(data)
+
+
+@lru_cache(maxsize=128)
+def _load_json_cached(data: bytes) -> Any:
+    return _load_json_uncached(data)
+
+
+def _load_json_uncached(data: bytes) -> Any:
+    if not _may_be_json(data):
+        return _NOT_JSON
+    try:
+        return json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return _NOT_JSON
+
+
+def _dumps_utf8(obj: Any, **kwargs: Any) -> str:
+    """json.dumps with raw UTF-8 text; ASCII escapes only when it can't be drawn."""
+    text = json.dumps(obj, ensure_ascii=False, **kwargs)
+    if not text.isascii():
+        # json.loads accepts lone surrogates, which cannot be drawn as UTF-8
+        try:
+            text.encode("utf-8")
+        except UnicodeEncodeError:
+            return json.dumps(obj, ensure_ascii=True, **kwargs)
+    return text
+
+
+def _dumps_compact(obj: Any, ensure_ascii: bool = True) -> str:
+    """Compact JSON text; ASCII-only unless `ensure_ascii` is False."""
+    if ensure_ascii:
+        return json.dumps(obj, ensure_ascii=True, separators=(",", ":"))
+    return _dumps_utf8(obj, separators=(",", ":"))
+
+
+def hex_groups(data: bytes, group: int = 1) -> str:
+    """Space-separated hex, `group` bytes per chunk, counted from the left."""
     if not data:
         return ""
-    h = data.hex()
-    return " ".join(h[i : i + 2] for i in range(0, len(h), 2))
+    # bytes.hex(sep, bytes_per_sep) (Python 3.8+) formats in a single C loop.
+    if group <= 1:
+        return data.hex(" ")
+    return data.hex(" ", -group)
 
 
-def try_parse_json(data: bytes) -> Optional[str]:
-    try:
-        text = data.decode("utf-8")
-    except UnicodeDecodeError:
-        return None
-    try:
-        obj = json.loads(text)
-    except json.JSONDecodeError:
+def try_parse_json(data: bytes, ensure_ascii: bool = True) -> Optional[str]:
+    obj = _load_json(bytes(data))
+    if obj is _NOT_JSON:
         return None
-    return json.dumps(obj, ensure_ascii=True, separators=(",", ":"))
+    return _dumps_compact(obj, ensure_ascii)
+
+
+# Payloads up to this size (the largest ATT value) are memoized by
+# format_payload; telemetry often repeats the exact same bytes.
+_FORMAT_CACHE_MAX_BYTES = 512
+
+
+def format_payload(data: bytes) -> tuple[str, Optional[str]]:
+    """Hex and compact JSON (raw UTF-8) text for a log entry."""
+    data = bytes(data)
+    if len(data) > _FORMAT_CACHE_MAX_BYTES:
+        return _format_payload_uncached(data)
+    return _format_payload_cached(data)
+
+
+@lru_cache(maxsize=512)
+def _format_payload_cached(data: bytes) -> tuple[str, Optional[str]]:
+    return _format_payload_uncached(data)
+
 
+def _format_payload_uncached(data: bytes) -> tuple[str, Optional[str]]:
+    # Textual draws UTF-8, so keep non-ASCII text unescaped
+    return hex_groups(data), try_parse_json(data, ensure_ascii=False)
 
-def pretty_json_with_highlighting(data: bytes, indent: int = 2) -> Optional[str]:
+
+# Payloads above this size are highlighted without caching, so a stream of
+# large notifications cannot pin megabytes of markup in memory.
+_PRETTY_CACHE_MAX_BYTES = 4096
+# Pretty-printed text beyond this is cut (at a line break where possible)
+# and replaced with a truncation marker before highlighting.
+_PRETTY_MAX_CHARS = 8192
+
+
+def pretty_json_with_highlighting(
+    data: bytes, indent: Optional[int] = 2
+) -> Optional[str]:
     """Return pretty JSON with Rich markup for syntax highlighting."""
-    try:
-        text = data.decode("utf-8")
-        obj = json.loads(text)
-    except (UnicodeDecodeError, json.JSONDecodeError):
+    data = bytes(data)
+    if len(data) > _PRETTY_CACHE_MAX_BYTES:
+        return _pretty_json_uncached(data, indent)
+    return _pretty_json_cached(data, indent)
+
+
+@lru_cache(maxsize=128)
+def _pretty_json_cached(data: bytes, indent: Optional[int]) -> Optional[str]:
+    return _pretty_json_uncached(data, indent)
+
+
+def _pretty_json_uncached(data: bytes, indent: Optional[int]) -> Optional[str]:
+    obj = _load_json(data)
+    if obj is _NOT_JSON:
         return None
 
-    pretty = json.dumps(obj, indent=indent, ensure_ascii=True)
+    # Same UTF-8 text as the history lines (see format_payload)
+    pretty = _dumps_utf8(obj, indent=indent)
+    omitted = 0
+    if len(pretty) > _PRETTY_MAX_CHARS:
+        cut = pretty.rfind("\n", 0, _PRETTY_MAX_CHARS)
+        if cut <= 0:
+            cut = _PRETTY_MAX_CHARS
+        omitted = len(pretty) - cut
+        pretty = pretty[:cut]
 
     # Escape only opening brackets to prevent Rich/Textual from interpreting
     # them as markup tags. Closing brackets ] don't need escaping (only [
@@ -42,9 +181,7 @@ def pretty_json_with_highlighting(data: bytes, indent: int = 2) -> Optional[str]
     # - String values: green
     # - Numbers: yellow
     # - Booleans/null: magenta
-    pretty = re.sub(r'"([^"]+)"\s*:', r'[cyan]"\1"[/]:', pretty)
-    pretty = re.sub(r':\s*"([^"]*)"', r': [green]"\1"[/]', pretty)
-    pretty = re.sub(r':\s*(\d+\.?\d*)', r': [yellow]\1[/]', pretty)
-    pretty = re.sub(r':\s*(true|false|null)', r': [magenta]\1[/]', pretty)
-
+    pretty = _JSON_RE.sub(_highlight, pretty)
+    if omitted:
+        pretty += f"\n[dim]... (truncated, {omitted} more chars)[/]"
     return pretty
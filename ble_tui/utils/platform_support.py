@@ -1,8 +1,27 @@
 from __future__ import annotations
 
+import re
 import sys
+from functools import lru_cache
 
+_UNAVAILABLE_TOKENS = (
+    "bluetooth is unsupported",
+    "bleakbluetoothnotavailableerror",
+    "no_bluetooth",
+    "bluetooth is off",
+)
+_LINUX_STACK_TOKENS = (
+    "org.bluez",
+    "bluez",
+    "dbus",
+    "permission denied",
+    "operation not permitted",
+)
+_UNAVAILABLE_RE = re.compile("|".join(map(re.escape, _UNAVAILABLE_TOKENS)))
+_LINUX_STACK_RE = re.compile("|".join(map(re.escape, _LINUX_STACK_TOKENS)))
 
+
+@lru_cache(maxsize=16)
 def current_platform_name(platform: str | None = None) -> str:
     value = (platform or sys.platform).lower()
     if value.startswith("win"):
@@ -14,25 +33,25 @@ def current_platform_name(platform: str | None = None) -> str:
     return "unknown"
 
 
-def platform_ble_hint(exc: Exception, platform: str | None = None) -> str:
-    plat = current_platform_name(platform)
-    text = f"{exc!r} {exc}".lower()
+def _signature(plat: str, text: str) -> str:
+    """Classify lowercased error text the way `_hint_for` checks it.
+
+    Keyword groups that only matter on one platform are only matched there,
+    so e.g. a Windows "access is denied" message that also mentions dbus
+    still gets the access-denied hint.
+    """
+    if _UNAVAILABLE_RE.search(text):
+        return "unavailable"
+    if plat == "linux" and _LINUX_STACK_RE.search(text):
+        return "linux_stack"
+    if plat == "windows" and "access is denied" in text:
+        return "access_denied"
+    return ""
+
 
-    unavailable_tokens = (
-        "bluetooth is unsupported",
-        "bleakbluetoothnotavailableerror",
-        "no_bluetooth",
-        "bluetooth is off",
-    )
-    linux_stack_tokens = (
-        "org.bluez",
-        "bluez",
-        "dbus",
-        "permission denied",
-        "operation not permitted",
-    )
-
-    if any(token in text for token in unavailable_tokens):
+@lru_cache(maxsize=64)
+def _hint_for(plat: str, signature: str) -> str:
+    if signature == "unavailable":
         if plat == "windows":
             return "Check that Bluetooth is enabled and a BLE adapter is available."
         if plat == "linux":
@@ -41,15 +60,22 @@ def platform_ble_hint(exc: Exception, platform: str | None = None) -> str:
             return "Check Bluetooth is enabled and grant terminal Bluetooth permission in System Settings."
         return "Check Bluetooth is enabled and an adapter is available."
 
-    if plat == "linux" and any(token in text for token in linux_stack_tokens):
+    if plat == "linux" and signature == "linux_stack":
         return "Ensure BlueZ/dbus are installed and running, then retry with sufficient permissions."
 
-    if plat == "windows" and "access is denied" in text:
+    if plat == "windows" and signature == "access_denied":
         return "Run with an account that has Bluetooth access and confirm adapter permissions."
 
     return "Check Bluetooth availability and platform BLE prerequisites."
 
 
+def platform_ble_hint(exc: Exception, platform: str | None = None) -> str:
+    # Repeated errors (e.g. while the adapter is off) hit the cache
+    plat = current_platform_name(platform)
+    text = f"{exc!r} {exc}".lower()
+    return _hint_for(plat, _signature(plat, text))
+
+
 def format_ble_error(action: str, exc: Exception, error_log_path: str) -> str:
     hint = platform_ble_hint(exc)
     return f"{action} failed: {hint} (details in {error_log_path})"
@@ -50,11 +50,11 @@ case "$TEST_TYPE" in
         ;;
     integration)
         echo "Running integration tests only..."
-        pytest tests/test_integration_*.py -v $EXTRA_ARGS
+        pytest tests/test_integration_*.py -n auto --dist=loadfile -v $EXTRA_ARGS
         ;;
     integration-tui)
         echo "Running TUI integration tests only..."
-        pytest tests/test_integration_tui.py -m integration_tui -v $EXTRA_ARGS
+        pytest tests/test_integration_tui.py -m integration_tui -n auto -v $EXTRA_ARGS
         ;;
     integration-ble)
         echo "Running BLE integration tests only..."
@@ -70,7 +70,7 @@ case "$TEST_TYPE" in
         ;;
     fast)
         echo "Running fast tests (unit + integration, no E2E)..."
-        pytest tests/ -m "not e2e and not slow" -v $EXTRA_ARGS
+        pytest tests/ -m "not e2e and not slow" -n auto --dist=loadfile -v $EXTRA_ARGS
         ;;
     cov|coverage)
         echo "Running all tests with coverage..."
@@ -16,6 +16,7 @@ class TestConfig:
     # Device configuration
     device_name: str = "LongBuddy-EMU"
     device_address: Optional[str] = None
+    device_addresses: list[str] = field(default_factory=list)
 
     # Test control
     run_e2e_tests: bool = False
@@ -32,7 +33,8 @@ class TestConfig:
 
         Environment variables:
         - BLE_TEST_DEVICE_NAME: Device name to test against (default: LongBuddy-EMU)
-        - BLE_TEST_DEVICE_ADDRESS: Optional device MAC address
+        - BLE_TEST_DEVICE_ADDRESS: Optional device MAC address; comma-separate
+          several to run the E2E suite once per device
         - BLE_RUN_E2E_TESTS: Enable E2E tests (true/false, default: false)
         - BLE_E2E_TIMEOUT: Timeout for E2E operations in seconds (default: 15.0)
         - BLE_EXPECTED_SERVICES: Comma-separated list of expected service UUIDs
@@ -47,9 +49,12 @@ class TestConfig:
                 return []
             return [item.strip() for item in value.split(",") if item.strip()]
 
+        device_addresses = parse_list(os.getenv("BLE_TEST_DEVICE_ADDRESS", ""))
+
         return cls(
             device_name=os.getenv("BLE_TEST_DEVICE_NAME", "LongBuddy-EMU"),
-            device_address=os.getenv("BLE_TEST_DEVICE_ADDRESS"),
+            device_address=device_addresses[0] if device_addresses else None,
+            device_addresses=device_addresses,
             run_e2e_tests=parse_bool(os.getenv("BLE_RUN_E2E_TESTS", "false")),
             e2e_timeout=float(os.getenv("BLE_E2E_TIMEOUT", "15.0")),
             expected_services=parse_list(os.getenv("BLE_EXPECTED_SERVICES", "")),
@@ -4,11 +4,38 @@ Pytest fixtures and configuration.
 Provides shared fixtures for BLE TUI tests including mock BLE devices,
 clients, and configured app instances.
 """
+import sys
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, Mock
 from typing import Any, Callable
 from tests.config import test_config
 
+try:
+    import uvloop
+except ImportError:  # optional: async tests fall back to the stdlib loop
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != "win32":
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run async tests on uvloop when it is installed."""
+        return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def error_log_path(tmp_path_factory):
+    """Point the app's error log at a temp file.
+
+    Each pytest-xdist worker has its own session and basetemp, so parallel
+    workers never share (or leave behind) a log in the working directory.
+    """
+    path = str(tmp_path_factory.mktemp("logs") / "ble_tui_errors.log")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("ble_tui.app.ERROR_LOG_PATH", path)
+        yield path
+
 
 @pytest.fixture
 def config():
@@ -57,12 +84,8 @@ def mock_service(mock_characteristic):
 def mock_scanner():
     """Create a mock BleakScanner with async discover method."""
     scanner = MagicMock()
-
-    async def discover_mock(timeout: float = 10.0, return_adv: bool = False):
-        """Mock discover that returns empty dict by default."""
-        return {}
-
-    scanner.discover = AsyncMock(side_effect=discover_mock)
+    # Returns an empty dict by default
+    scanner.discover = AsyncMock(return_value={})
     return scanner
 
 
@@ -91,6 +114,7 @@ def mock_client_factory(mock_service):
         address: str = "AA:BB:CC:DD:EE:FF",
         is_connected: bool = True,
         services: list = None,
+        **overrides: Any,
     ):
         client = AsyncMock()
         client.address = address
@@ -103,6 +127,10 @@ def mock_client_factory(mock_service):
         client.start_notify = AsyncMock()
         client.stop_notify = AsyncMock()
 
+        # Replace any attribute, e.g. start_notify=AsyncMock(side_effect=...)
+        for name, value in overrides.items():
+            setattr(client, name, value)
+
         return client
 
     return _create_client
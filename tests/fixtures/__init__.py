@@ -4,9 +4,14 @@ Test fixtures for BLE TUI App.
 Provides mock BLE devices, services, and characteristics for testing.
 """
 from tests.fixtures.ble_fixtures import (
+    FakeAdvertisement,
+    FakeChar,
+    FakeDevice,
+    FakeService,
     MockBLEDeviceBuilder,
     MockServiceBuilder,
     MockCharacteristicBuilder,
+    MockServiceCollection,
     create_mock_scanner_with_devices,
 )
 from tests.fixtures.device_fixtures import (
@@ -14,15 +19,25 @@ from tests.fixtures.device_fixtures import (
     create_longbuddy_emu,
     create_minimal_device,
     create_device_with_notifications,
+    normalize_uuid,
 )
+from tests.fixtures.tui_helpers import seed_log, wait_until
 
 __all__ = [
+    "FakeAdvertisement",
+    "FakeChar",
+    "FakeDevice",
+    "FakeService",
     "MockBLEDeviceBuilder",
     "MockServiceBuilder",
     "MockCharacteristicBuilder",
+    "MockServiceCollection",
     "create_mock_scanner_with_devices",
     "create_test_device",
     "create_longbuddy_emu",
     "create_minimal_device",
     "create_device_with_notifications",
+    "normalize_uuid",
+    "seed_log",
+    "wait_until",
 ]
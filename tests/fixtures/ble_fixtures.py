@@ -4,13 +4,53 @@ Mock BLE device and service builders for testing.
 Provides builder patterns for constructing mock BLE devices, services,
 and characteristics with configurable properties.
 """
+from dataclasses import dataclass
 from typing import Any, Optional
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
+
+
+# Plain data stand-ins for Bleak objects: Mock() is far more expensive to
+# construct, and nothing asserts calls on these. Like the Bleak objects they
+# replace, they compare and hash by identity.
+
+@dataclass(slots=True, eq=False)
+class FakeChar:
+    """Stand-in for BleakGATTCharacteristic."""
+
+    uuid: str
+    properties: list[str]
+    handle: Optional[int] = None
+
+
+@dataclass(slots=True, eq=False)
+class FakeService:
+    """Stand-in for BleakGATTService."""
+
+    uuid: str
+    characteristics: list[FakeChar]
+
+
+@dataclass(slots=True, eq=False)
+class FakeDevice:
+    """Stand-in for BLEDevice."""
+
+    name: Optional[str]
+    address: str
+
+
+@dataclass(slots=True, eq=False)
+class FakeAdvertisement:
+    """Stand-in for AdvertisementData."""
+
+    rssi: Optional[int]
+    local_name: Optional[str]
 
 
 class MockCharacteristicBuilder:
     """Builder for mock BLE characteristics."""
 
+    __slots__ = ("uuid", "properties", "handle", "_value")
+
     def __init__(self, uuid: str, properties: list[str], handle: Optional[int] = None):
         self.uuid = uuid
         self.properties = properties
@@ -22,22 +62,19 @@ class MockCharacteristicBuilder:
         self._value = value
         return self
 
-    def build(self) -> Mock:
+    def build(self) -> FakeChar:
         """Build and return the mock characteristic."""
-        char = Mock()
-        char.uuid = self.uuid
-        char.properties = self.properties
-        if self.handle is not None:
-            char.handle = self.handle
-        return char
+        return FakeChar(self.uuid, self.properties, self.handle)
 
 
 class MockServiceBuilder:
     """Builder for mock BLE GATT services."""
 
+    __slots__ = ("uuid", "_characteristics")
+
     def __init__(self, uuid: str):
         self.uuid = uuid
-        self._characteristics: list[Mock] = []
+        self._characteristics: list[FakeChar] = []
 
     def add_char(
         self,
@@ -50,17 +87,44 @@ class MockServiceBuilder:
         self._characteristics.append(char)
         return self
 
-    def add_characteristic(self, char: Mock) -> "MockServiceBuilder":
+    def add_characteristic(self, char: FakeChar) -> "MockServiceBuilder":
         """Add a pre-built characteristic to this service."""
         self._characteristics.append(char)
         return self
 
-    def build(self) -> Mock:
+    def build(self) -> FakeService:
         """Build and return the mock service."""
-        svc = Mock()
-        svc.uuid = self.uuid
-        svc.characteristics = self._characteristics
-        return svc
+        return FakeService(self.uuid, self._characteristics)
+
+
+class MockServiceCollection:
+    """Stand-in for BleakGATTServiceCollection over mock services.
+
+    Iterates like a list of services; `characteristics` and
+    `get_characteristic()` use dicts built once, like Bleak's own
+    collection, so lookups by handle or UUID are O(1).
+    """
+
+    def __init__(self, services: list[FakeService]):
+        self._services = services
+        self.characteristics: dict[int, FakeChar] = {}
+        self._char_by_uuid: dict[str, FakeChar] = {}
+        for svc in services:
+            for char in svc.characteristics:
+                if char.handle is not None:
+                    self.characteristics[char.handle] = char
+                self._char_by_uuid.setdefault(char.uuid, char)
+
+    def __iter__(self):
+        return iter(self._services)
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+    def get_characteristic(self, specifier: int | str) -> Optional[FakeChar]:
+        if isinstance(specifier, int):
+            return self.characteristics.get(specifier)
+        return self._char_by_uuid.get(specifier)
 
 
 class MockBLEDeviceBuilder:
@@ -74,15 +138,30 @@ class MockBLEDeviceBuilder:
         client = builder.build_client()
     """
 
+    __slots__ = (
+        "name",
+        "address",
+        "rssi",
+        "_services",
+        "_current_service",
+        "_finalized",
+        "_built",
+        "_collection",
+    )
+
     def __init__(self, name: str, address: str, rssi: int = -50):
         self.name = name
         self.address = address
         self.rssi = rssi
-        self._services: list[Mock] = []
+        self._services: list[FakeService] | tuple[FakeService, ...] = []
         self._current_service: Optional[MockServiceBuilder] = None
+        self._finalized = False
+        self._built: Optional[tuple[FakeDevice, FakeAdvertisement]] = None
+        self._collection: Optional[MockServiceCollection] = None
 
     def add_service(self, uuid: str) -> "MockBLEDeviceBuilder":
         """Add a new service to this device."""
+        self._check_not_finalized()
         if self._current_service is not None:
             # Finalize previous service
             self._services.append(self._current_service.build())
@@ -96,50 +175,60 @@ class MockBLEDeviceBuilder:
         handle: Optional[int] = None,
     ) -> "MockBLEDeviceBuilder":
         """Add a characteristic to the current service."""
+        self._check_not_finalized()
         if self._current_service is None:
             raise ValueError("Must call add_service() before add_char()")
         self._current_service.add_char(uuid, properties, handle)
         return self
 
+    def _check_not_finalized(self) -> None:
+        if self._finalized:
+            raise ValueError("Cannot add to a builder after build_*() was called")
+
     def _finalize(self) -> None:
-        """Finalize the current service if any."""
+        """Finalize the current service if any; the builder is then frozen."""
+        if self._finalized:
+            return
         if self._current_service is not None:
             self._services.append(self._current_service.build())
             self._current_service = None
+        self._finalized = True
 
-    def build_device_and_adv(self) -> tuple[Mock, Mock]:
-        """Build and return a (BLEDevice, AdvertisementData) tuple."""
-        self._finalize()
-
-        device = Mock()
-        device.name = self.name
-        device.address = self.address
+    def build_device_and_adv(self) -> tuple[FakeDevice, FakeAdvertisement]:
+        """Build and return a (BLEDevice, AdvertisementData) tuple.
 
-        adv = Mock()
-        adv.rssi = self.rssi
-        adv.local_name = self.name
-
-        return device, adv
+        Built once; later calls return the same pair.
+        """
+        if self._built is None:
+            self._finalize()
+            self._built = (
+                FakeDevice(self.name, self.address),
+                FakeAdvertisement(self.rssi, self.name),
+            )
+        return self._built
 
     def build_client(self) -> AsyncMock:
-        """Build and return a mock BleakClient for this device."""
-        self._finalize()
+        """Build and return a mock BleakClient for this device.
+
+        Each call returns a fresh client (separate call tracking) sharing
+        one service collection.
+        """
+        if self._collection is None:
+            self._finalize()
+            self._collection = MockServiceCollection(self._services)
 
         client = AsyncMock()
         client.address = self.address
         client.is_connected = True
-        client.services = self._services
+        client.services = self._collection
 
-        # Setup async methods
-        client.connect = AsyncMock()
-        client.disconnect = AsyncMock()
-        client.read_gatt_char = AsyncMock(return_value=b"test data")
-        client.start_notify = AsyncMock()
-        client.stop_notify = AsyncMock()
+        # Other async methods (connect, start_notify, ...) are AsyncMock
+        # children created lazily on first access, each with its own calls.
+        client.read_gatt_char.return_value = b"test data"
 
         return client
 
-    def build_scanner_result(self) -> dict[str, tuple[Mock, Mock]]:
+    def build_scanner_result(self) -> dict[str, tuple[FakeDevice, FakeAdvertisement]]:
         """Build a scanner discover result dict."""
         device, adv = self.build_device_and_adv()
         return {self.address: (device, adv)}
@@ -157,12 +246,9 @@ def create_mock_scanner_with_devices(*builders: MockBLEDeviceBuilder) -> AsyncMo
     scanner = AsyncMock()
 
     # Combine all device results
-    result_dict = {}
-    for builder in builders:
-        result_dict.update(builder.build_scanner_result())
-
-    async def discover_mock(timeout: float = 10.0, return_adv: bool = False):
-        return result_dict
+    result_dict = {
+        builder.address: builder.build_device_and_adv() for builder in builders
+    }
 
-    scanner.discover = AsyncMock(side_effect=discover_mock)
+    scanner.discover = AsyncMock(return_value=result_dict)
     return scanner
@@ -4,7 +4,9 @@ Predefined test device profiles and expected data.
 Provides factory functions for creating common test BLE devices
 with realistic service and characteristic configurations.
 """
-from tests.fixtures.ble_fixtures import MockBLEDeviceBuilder
+from functools import lru_cache
+
+from tests.fixtures.ble_fixtures import FakeService, MockBLEDeviceBuilder
 
 
 # Common BLE GATT UUIDs
@@ -24,6 +26,87 @@ MODEL_NUMBER_CHAR = "00002a24-0000-1000-8000-00805f9b34fb"
 SERIAL_NUMBER_CHAR = "00002a25-0000-1000-8000-00805f9b34fb"
 
 
+@lru_cache(maxsize=256)
+def normalize_uuid(uuid: str) -> str:
+    """Canonical (lowercase, trimmed) form of a UUID for comparisons."""
+    return uuid.strip().lower()
+
+
+# Service trees are constant per profile, so each is built once at import
+# and shared (read-only) between builders. Factories return builders that
+# are already finalized, so services cannot be added to them.
+_CharSpec = tuple[str, list[str], int]
+
+
+def _build_services(
+    *services: tuple[str, list[_CharSpec]],
+) -> tuple[FakeService, ...]:
+    builder = MockBLEDeviceBuilder("", "")
+    for svc_uuid, chars in services:
+        builder.add_service(svc_uuid)
+        for uuid, properties, handle in chars:
+            builder.add_char(uuid, properties, handle=handle)
+    builder._finalize()
+    return tuple(builder._services)
+
+
+def _from_template(
+    template: tuple[FakeService, ...], name: str, address: str, rssi: int
+) -> MockBLEDeviceBuilder:
+    builder = MockBLEDeviceBuilder(name, address, rssi)
+    builder._services = template
+    builder._finalized = True
+    return builder
+
+
+_TEST_DEVICE_SERVICES = _build_services(
+    # Generic Access Service
+    (GENERIC_ACCESS_SERVICE, [
+        (DEVICE_NAME_CHAR, ["read"], 10),
+        (APPEARANCE_CHAR, ["read"], 11),
+    ]),
+    # Generic Attribute Service
+    (GENERIC_ATTRIBUTE_SERVICE, [(SERVICE_CHANGED_CHAR, ["indicate"], 20)]),
+    # Battery Service
+    (BATTERY_SERVICE, [(BATTERY_LEVEL_CHAR, ["read", "notify"], 30)]),
+)
+
+_LONGBUDDY_SERVICES = _build_services(
+    # Generic Access Service
+    (GENERIC_ACCESS_SERVICE, [
+        (DEVICE_NAME_CHAR, ["read"], 3),
+        (APPEARANCE_CHAR, ["read"], 5),
+    ]),
+    # Generic Attribute Service
+    (GENERIC_ATTRIBUTE_SERVICE, [(SERVICE_CHANGED_CHAR, ["indicate"], 8)]),
+    # Device Information Service
+    (DEVICE_INFO_SERVICE, [
+        (MANUFACTURER_NAME_CHAR, ["read"], 11),
+        (MODEL_NUMBER_CHAR, ["read"], 13),
+        (SERIAL_NUMBER_CHAR, ["read"], 15),
+    ]),
+    # Battery Service
+    (BATTERY_SERVICE, [(BATTERY_LEVEL_CHAR, ["read", "notify"], 18)]),
+    # Custom services would be added here based on actual LongBuddy-EMU device
+    # These would be discovered during E2E testing
+)
+
+_MINIMAL_SERVICES = _build_services(
+    (GENERIC_ACCESS_SERVICE, [(DEVICE_NAME_CHAR, ["read"], 1)]),
+)
+
+_NOTIFY_DEVICE_SERVICES = _build_services(
+    # Service with multiple notifiable characteristics
+    ("custom-service-uuid-1", [
+        ("notify-char-1", ["notify"], 100),
+        ("notify-char-2", ["notify", "read"], 101),
+        ("indicate-char", ["indicate"], 102),
+    ]),
+    # Battery service for good measure
+    (BATTERY_SERVICE, [(BATTERY_LEVEL_CHAR, ["read", "notify"], 110)]),
+)
+
+
 def create_test_device(
     name: str = "Test Device",
     address: str = "AA:BB:CC:DD:EE:FF",
@@ -39,22 +122,7 @@ def create_test_device(
     Returns:
         Configured MockBLEDeviceBuilder
     """
-    builder = MockBLEDeviceBuilder(name, address, rssi)
-
-    # Generic Access Service
-    builder.add_service(GENERIC_ACCESS_SERVICE)
-    builder.add_char(DEVICE_NAME_CHAR, ["read"], handle=10)
-    builder.add_char(APPEARANCE_CHAR, ["read"], handle=11)
-
-    # Generic Attribute Service
-    builder.add_service(GENERIC_ATTRIBUTE_SERVICE)
-    builder.add_char(SERVICE_CHANGED_CHAR, ["indicate"], handle=20)
-
-    # Battery Service
-    builder.add_service(BATTERY_SERVICE)
-    builder.add_char(BATTERY_LEVEL_CHAR, ["read", "notify"], handle=30)
-
-    return builder
+    return _from_template(_TEST_DEVICE_SERVICES, name, address, rssi)
 
 
 def create_longbuddy_emu(
@@ -73,31 +141,7 @@ def create_longbuddy_emu(
     Returns:
         Configured MockBLEDeviceBuilder
     """
-    builder = MockBLEDeviceBuilder("LongBuddy-EMU", address, rssi)
-
-    # Generic Access Service
-    builder.add_service(GENERIC_ACCESS_SERVICE)
-    builder.add_char(DEVICE_NAME_CHAR, ["read"], handle=3)
-    builder.add_char(APPEARANCE_CHAR, ["read"], handle=5)
-
-    # Generic Attribute Service
-    builder.add_service(GENERIC_ATTRIBUTE_SERVICE)
-    builder.add_char(SERVICE_CHANGED_CHAR, ["indicate"], handle=8)
-
-    # Device Information Service
-    builder.add_service(DEVICE_INFO_SERVICE)
-    builder.add_char(MANUFACTURER_NAME_CHAR, ["read"], handle=11)
-    builder.add_char(MODEL_NUMBER_CHAR, ["read"], handle=13)
-    builder.add_char(SERIAL_NUMBER_CHAR, ["read"], handle=15)
-
-    # Battery Service
-    builder.add_service(BATTERY_SERVICE)
-    builder.add_char(BATTERY_LEVEL_CHAR, ["read", "notify"], handle=18)
-
-    # Custom services would be added here based on actual LongBuddy-EMU device
-    # These would be discovered during E2E testing
-
-    return builder
+    return _from_template(_LONGBUDDY_SERVICES, "LongBuddy-EMU", address, rssi)
 
 
 def create_minimal_device(
@@ -115,12 +159,7 @@ def create_minimal_device(
     Returns:
         Configured MockBLEDeviceBuilder
     """
-    builder = MockBLEDeviceBuilder(name, address, rssi=-50)
-
-    builder.add_service(GENERIC_ACCESS_SERVICE)
-    builder.add_char(DEVICE_NAME_CHAR, ["read"], handle=1)
-
-    return builder
+    return _from_template(_MINIMAL_SERVICES, name, address, rssi=-50)
 
 
 def create_device_with_notifications(
@@ -138,16 +177,4 @@ def create_device_with_notifications(
     Returns:
         Configured MockBLEDeviceBuilder
     """
-    builder = MockBLEDeviceBuilder(name, address, rssi=-40)
-
-    # Service with multiple notifiable characteristics
-    builder.add_service("custom-service-uuid-1")
-    builder.add_char("notify-char-1", ["notify"], handle=100)
-    builder.add_char("notify-char-2", ["notify", "read"], handle=101)
-    builder.add_char("indicate-char", ["indicate"], handle=102)
-
-    # Battery service for good measure
-    builder.add_service(BATTERY_SERVICE)
-    builder.add_char(BATTERY_LEVEL_CHAR, ["read", "notify"], handle=110)
-
-    return builder
+    return _from_template(_NOTIFY_DEVICE_SERVICES, name, address, rssi=-40)
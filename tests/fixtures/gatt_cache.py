@@ -0,0 +1,74 @@
+"""
+Persistent GATT layout cache for E2E tests.
+
+Stores each device's (service, characteristic, properties, handle) layout
+in pytest's cache directory, keyed by address and validated against the
+device's Firmware Revision string, so later sessions can skip walking the
+live service collection.
+"""
+from typing import Any, Optional
+
+from tests.fixtures.ble_fixtures import FakeChar, FakeService
+
+
+FIRMWARE_REVISION_CHAR = "00002a26-0000-1000-8000-00805f9b34fb"
+
+
+def dump_layout(services: Any) -> list[dict[str, Any]]:
+    """Serialize a service collection to JSON-compatible data."""
+    return [
+        {
+            "uuid": svc.uuid,
+            "characteristics": [
+                [char.uuid, list(char.properties), char.handle]
+                for char in svc.characteristics
+            ],
+        }
+        for svc in services
+    ]
+
+
+def load_layout(data: list[dict[str, Any]]) -> list[FakeService]:
+    """Rebuild services from `dump_layout` output."""
+    return [
+        FakeService(
+            svc["uuid"],
+            [
+                FakeChar(uuid, props, handle)
+                for uuid, props, handle in svc["characteristics"]
+            ],
+        )
+        for svc in data
+    ]
+
+
+class GattLayoutCache:
+    """GATT layouts stored in a pytest `Cache` (`request.config.cache`).
+
+    A cached layout is only returned while the device reports the same
+    firmware revision it had when the layout was stored.
+    """
+
+    def __init__(self, cache: Optional[Any]):
+        # None when the cacheprovider plugin is disabled (-p no:cacheprovider)
+        self._cache = cache
+
+    @staticmethod
+    def _key(address: str) -> str:
+        return "gatt/" + address.replace(":", "-").lower()
+
+    def get(self, address: str, revision: str) -> Optional[list[FakeService]]:
+        if self._cache is None:
+            return None
+        entry = self._cache.get(self._key(address), None)
+        if not entry or entry.get("revision") != revision:
+            return None
+        return load_layout(entry["services"])
+
+    def put(self, address: str, revision: str, services: Any) -> None:
+        if self._cache is None:
+            return
+        self._cache.set(
+            self._key(address),
+            {"revision": revision, "services": dump_layout(services)},
+        )
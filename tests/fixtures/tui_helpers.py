@@ -0,0 +1,44 @@
+"""
+Helpers for TUI tests: driving the app through Textual's `Pilot` and
+seeding app state directly.
+"""
+import time
+from collections import deque
+from typing import Callable
+
+from textual.pilot import Pilot
+
+from ble_tui.models import LogEntry
+from ble_tui.services import StateService
+from ble_tui.utils import LOG_MAX
+
+
+_CANNED_ENTRY = LogEntry(ts="00:00:00.000", size=1, hex_str="00", json_str=None)
+
+
+async def wait_until(
+    pilot: Pilot, condition: Callable[[], bool], timeout: float = 2.0
+) -> None:
+    """Yield to the app until `condition()` holds.
+
+    Replaces fixed `pilot.pause(<seconds>)` sleeps: returns as soon as the
+    awaited state is reached and raises `TimeoutError` if it never is.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Condition not met within {timeout}s")
+        await pilot.pause(0)
+
+
+def seed_log(state: StateService, key: str, n: int = 1) -> None:
+    """Append `n` canned entries to `key`'s history.
+
+    Skips the hex/JSON/timestamp work of `append_value` for tests that only
+    need a history of some length.
+    """
+    log = state.logs.get(key)
+    if log is None:
+        log = state.logs[key] = deque(maxlen=LOG_MAX)
+    log.extend([_CANNED_ENTRY] * n)
+    state._bump_log_version(key)
@@ -1,12 +1,14 @@
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
+from ble_tui.models import CharacteristicInfo
 from ble_tui.services.ble_service import BleService
+from tests.fixtures import create_test_device
+from tests.fixtures.device_fixtures import BATTERY_LEVEL_CHAR
 
 
 @pytest.mark.unit
 async def test_scan_returns_sorted_devices():
-    service = BleService()
 
     d1 = Mock()
     d1.name = "Weak"
@@ -23,18 +25,33 @@ async def test_scan_returns_sorted_devices():
     a2.local_name = "Strong"
 
     discovered = {"AA": (d1, a1), "BB": (d2, a2)}
+    service = BleService(scanner=Mock(discover=AsyncMock(return_value=discovered)))
 
-    with patch("ble_tui.services.ble_service.BleakScanner.discover", new=AsyncMock(return_value=discovered)):
-        result = await service.scan()
+    result = await service.scan()
+    top = await service.scan(limit=1)
 
     assert [d.address for d in result] == ["BB", "AA"]
+    assert [d.address for d in top] == ["BB"]
 
 
 @pytest.mark.unit
-async def test_connect_uses_bleak_client():
+async def test_scan_passes_service_filter_from_env(monkeypatch):
+    monkeypatch.setenv("BLETUI_SCAN_SERVICES", "180D, 0000180f-0000-1000-8000-00805F9B34FB")
+    discover = AsyncMock(return_value={})
+    service = BleService(scanner=Mock(discover=discover))
+
+    await service.scan()
+
+    assert discover.call_args.kwargs["service_uuids"] == [
+        "180d",
+        "0000180f-0000-1000-8000-00805f9b34fb",
+    ]
+
+
+@pytest.mark.unit
+async def test_connect_uses_bleak_client(mock_client_factory):
     service = BleService()
-    mock_client = AsyncMock()
-    mock_client.connect = AsyncMock()
+    mock_client = mock_client_factory()
 
     with patch("ble_tui.services.ble_service.BleakClient", return_value=mock_client):
         client = await service.connect("AA")
@@ -44,7 +61,7 @@ async def test_connect_uses_bleak_client():
 
 
 @pytest.mark.unit
-async def test_discover_gatt_falls_back_to_get_services():
+async def test_discover_gatt_falls_back_to_get_services(mock_client_factory):
     service = BleService()
 
     char = Mock()
@@ -56,9 +73,8 @@ async def test_discover_gatt_falls_back_to_get_services():
     svc.uuid = "svc-uuid"
     svc.characteristics = [char]
 
-    client = AsyncMock()
+    client = mock_client_factory(get_services=AsyncMock(return_value=[svc]))
     client.services = None
-    client.get_services = AsyncMock(return_value=[svc])
 
     mapped, key_by_handle, service_count, char_count = await service.discover_gatt(client)
 
@@ -67,3 +83,54 @@ async def test_discover_gatt_falls_back_to_get_services():
     assert key_by_handle[42] == "svc-uuid:char-uuid:42"
     assert service_count == 1
     assert char_count == 1
+
+
+@pytest.mark.unit
+async def test_discover_gatt_shares_sorted_property_tuples():
+    service = BleService()
+
+    chars = []
+    for handle, props in ((1, ["write", "read"]), (2, ["read", "write"])):
+        char = Mock()
+        char.uuid = f"char-{handle}"
+        char.properties = props
+        char.handle = handle
+        chars.append(char)
+
+    svc = Mock()
+    svc.uuid = "svc-uuid"
+    svc.characteristics = chars
+
+    client = Mock()
+    client.services = [svc]
+
+    mapped, _, _, _ = await service.discover_gatt(client)
+
+    first, second = mapped["svc-uuid"]
+    assert first.properties == ("read", "write")
+    assert first.properties is second.properties
+
+
+@pytest.mark.unit
+async def test_discover_gatt_indexes_fixture_collection_by_handle():
+    service = BleService()
+    client = create_test_device().build_client()
+    _, key_by_handle, _, _ = await service.discover_gatt(client)
+
+    assert client.services.get_characteristic(BATTERY_LEVEL_CHAR).handle == 30
+    assert key_by_handle[30].endswith(f"{BATTERY_LEVEL_CHAR}:30")
+
+
+@pytest.mark.unit
+async def test_start_notify_many_reports_per_target_errors(mock_client_factory):
+    service = BleService()
+    failure = RuntimeError("cccd write failed")
+    client = mock_client_factory(
+        start_notify=AsyncMock(side_effect=[None, failure, None])
+    )
+    cb = Mock()
+
+    errors = await service.start_notify_many(client, [(1, cb), (2, cb), (3, cb)])
+
+    assert errors == [None, failure, None]
+    assert client.start_notify.call_count == 3
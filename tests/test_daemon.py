@@ -0,0 +1,232 @@
+import asyncio
+import io
+import socket
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ble_tui.tools.daemon import BleDaemon, request, serve
+from ble_tui.utils import CONNECT_TIMEOUT_S
+
+
+def _fake_client():
+    ch = Mock()
+    ch.uuid = "char"
+    ch.properties = ["notify", "read"]
+    ch.handle = 10
+    svc = Mock()
+    svc.uuid = "svc"
+    svc.characteristics = [ch]
+
+    client = AsyncMock()
+    client.is_connected = True
+    client.services = [svc]
+    return client
+
+
+@pytest.mark.unit
+async def test_dump_reuses_connection_and_layout():
+    client = _fake_client()
+    factory = Mock(return_value=client)
+    daemon = BleDaemon(client_factory=factory)
+
+    first = await daemon.handle({"op": "dump", "address": "AA"})
+    second = await daemon.handle({"op": "dump", "address": "AA"})
+
+    assert first == second
+    assert first["services"] == [
+        {
+            "uuid": "svc",
+            "characteristics": [
+                {"uuid": "char", "properties": ["notify", "read"], "handle": 10}
+            ],
+        }
+    ]
+    factory.assert_called_once_with("AA")
+    client.connect.assert_awaited_once()
+
+
+@pytest.mark.unit
+async def test_failed_request_drops_cached_client():
+    client = _fake_client()
+    client.start_notify.side_effect = OSError("gone")
+    factory = Mock(return_value=client)
+    daemon = BleDaemon(client_factory=factory)
+
+    reply = await daemon.handle(
+        {"op": "notify", "address": "AA", "uuids": ["char"], "duration": 0}
+    )
+    assert reply["ok"] is True
+    assert reply["subscribed"] == []
+    assert "gone" in reply["errors"]["char"]
+
+    client.services = None  # layout building now raises
+    client.disconnect.side_effect = OSError("already gone")
+    assert (await daemon.handle({"op": "dump", "address": "AA"}))["ok"] is False
+    client.disconnect.assert_awaited_once()
+    await daemon.handle({"op": "dump", "address": "AA"})
+    assert factory.call_count == 2
+
+
+@pytest.mark.unit
+async def test_request_roundtrip_over_unix_socket(tmp_path):
+    path = str(tmp_path / "d.sock")
+    assert request({"op": "dump"}, path=path) is None
+
+    daemon = BleDaemon(client_factory=Mock(return_value=_fake_client()))
+    server = asyncio.create_task(serve(path, daemon))
+    try:
+        for _ in range(50):
+            if (tmp_path / "d.sock").exists():
+                break
+            await asyncio.sleep(0.01)
+        reply = await asyncio.to_thread(
+            request, {"op": "dump", "address": "AA"}, path, 5.0
+        )
+    finally:
+        server.cancel()
+
+    assert reply["ok"] is True
+    assert reply["services"][0]["uuid"] == "svc"
+
+
+@pytest.mark.unit
+async def test_malformed_request_keeps_cached_client():
+    factory = Mock(return_value=_fake_client())
+    daemon = BleDaemon(client_factory=factory)
+    await daemon.handle({"op": "dump", "address": "AA"})
+
+    for bad in (
+        {"op": "notify", "address": "AA", "duration": "soon"},
+        {"op": "notify", "address": "AA", "uuids": "char"},
+        {"op": "notify", "address": "AA", "duration": -1},
+        {"op": "dump"},
+        {"op": "nope", "address": "AA"},
+        ["dump"],
+    ):
+        reply = await daemon.handle(bad)
+        assert reply["ok"] is False
+
+    await daemon.handle({"op": "dump", "address": "AA"})
+    factory.assert_called_once_with("AA")
+
+
+@pytest.mark.unit
+async def test_notify_wait_does_not_block_other_requests():
+    daemon = BleDaemon(client_factory=Mock(return_value=_fake_client()))
+    await daemon.handle({"op": "dump", "address": "AA"})
+
+    notify = asyncio.create_task(
+        daemon.handle({"op": "notify", "address": "AA", "uuids": ["char"], "duration": 5})
+    )
+    try:
+        await asyncio.sleep(0)
+        reply = await asyncio.wait_for(
+            daemon.handle({"op": "dump", "address": "AA"}), timeout=1.0
+        )
+        assert reply["ok"] is True
+    finally:
+        notify.cancel()
+
+
+class _FailingSocket:
+    def __init__(self, exc):
+        self._exc = exc
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect(self, path):
+        raise self._exc
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exc", [PermissionError("denied"), TimeoutError("timed out"), OSError("other")]
+)
+def test_request_returns_none_on_socket_errors(monkeypatch, exc):
+    monkeypatch.setattr(socket, "socket", lambda *args: _FailingSocket(exc))
+    assert request({"op": "dump", "address": "AA"}, path="unused") is None
+
+
+class _ReplySocket(_FailingSocket):
+    def __init__(self, reply):
+        self._reply = reply
+        self.timeout = None
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def connect(self, path):
+        pass
+
+    def sendall(self, data):
+        pass
+
+    def makefile(self, mode):
+        return io.BytesIO(self._reply)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("reply", [b'{"ok": tr', b"\xff\xfe\n", b""])
+def test_request_returns_none_on_garbled_reply(monkeypatch, reply):
+    monkeypatch.setattr(socket, "socket", lambda *args: _ReplySocket(reply))
+    assert request({"op": "dump", "address": "AA"}, path="unused") is None
+
+
+@pytest.mark.unit
+def test_request_default_timeout_covers_notify_duration(monkeypatch):
+    sock = _ReplySocket(b'{"ok": true}\n')
+    monkeypatch.setattr(socket, "socket", lambda *args: sock)
+
+    reply = request({"op": "notify", "address": "AA", "duration": 12}, path="unused")
+
+    assert reply == {"ok": True}
+    assert sock.timeout == CONNECT_TIMEOUT_S + 12
+
+
+@pytest.mark.unit
+def test_request_returns_none_without_unix_sockets(monkeypatch):
+    monkeypatch.delattr(socket, "AF_UNIX", raising=False)
+    assert request({"op": "dump", "address": "AA"}, path="unused") is None
+
+
+@pytest.mark.unit
+async def test_serve_refuses_to_remove_non_socket(tmp_path):
+    path = tmp_path / "d.sock"
+    path.write_text("not a socket")
+
+    with pytest.raises(FileExistsError):
+        await serve(str(path), BleDaemon(client_factory=Mock()))
+    assert path.read_text() == "not a socket"
+
+
+@pytest.mark.unit
+async def test_serve_replaces_stale_socket(tmp_path):
+    path = str(tmp_path / "d.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()  # leaves the socket file behind with nothing listening
+
+    server = asyncio.create_task(
+        serve(path, BleDaemon(client_factory=Mock(return_value=_fake_client())))
+    )
+    try:
+        reply = None
+        for _ in range(50):
+            reply = await asyncio.to_thread(
+                request, {"op": "dump", "address": "AA"}, path, 5.0
+            )
+            if reply is not None:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        server.cancel()
+
+    assert reply["ok"] is True
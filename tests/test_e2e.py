@@ -6,21 +6,32 @@ by default. Enable them by setting BLE_RUN_E2E_TESTS=true.
 
 Environment variables:
 - BLE_TEST_DEVICE_NAME: Device name to connect to (default: LongBuddy-EMU)
-- BLE_TEST_DEVICE_ADDRESS: Optional device MAC address
+- BLE_TEST_DEVICE_ADDRESS: Optional device MAC address(es), comma-separated
 - BLE_RUN_E2E_TESTS: Set to "true" to run E2E tests
 - BLE_E2E_TIMEOUT: Timeout for operations in seconds (default: 15.0)
 - BLE_EXPECTED_SERVICES: Comma-separated list of expected service UUIDs
 - BLE_EXPECTED_READABLE_CHARS: Expected readable characteristic UUIDs
 - BLE_EXPECTED_NOTIFIABLE_CHARS: Expected notifiable characteristic UUIDs
+
+Connection tests are grouped per device with `xdist_group`, so
+`pytest -n auto --dist=loadgroup` keeps each device on one worker while
+different devices (and the scan test) run in parallel.
 """
 import asyncio
+from typing import Any, NamedTuple, Optional
+
 import pytest
+import pytest_asyncio
 from bleak import BleakScanner, BleakClient
 from tests.config import test_config
+from tests.fixtures import normalize_uuid
+from tests.fixtures.gatt_cache import FIRMWARE_REVISION_CHAR, GattLayoutCache
 
 
-# Skip all E2E tests if not enabled
+# Skip all E2E tests if not enabled. Tests share one session event loop so
+# they can reuse the session-scoped scan result and connection below.
 pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
     pytest.mark.e2e,
     pytest.mark.slow,
     pytest.mark.skipif(
@@ -30,50 +41,61 @@ pytestmark = [
 ]
 
 
-@pytest.fixture
-async def discovered_device_address():
-    """Discover and return the test device address.
+def _device_params() -> list:
+    """One fixture param per configured address (or one name-based lookup)."""
+    addresses = test_config.device_addresses or [None]
+    return [
+        pytest.param(
+            address,
+            id=address or "by-name",
+            marks=pytest.mark.xdist_group(f"device_{address or 'by-name'}"),
+        )
+        for address in addresses
+    ]
 
-    Returns the device address if found, or skips the test if not found.
-    """
-    timeout = test_config.e2e_timeout
 
-    # Scan for devices
-    try:
-        devices = await asyncio.wait_for(
-            BleakScanner.discover(timeout=timeout, return_adv=True),
-            timeout=timeout + 2.0
-        )
-    except asyncio.TimeoutError:
-        pytest.skip(f"Scan timeout after {timeout}s")
-        return None
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def scan_results():
+    """Scan once per session (per xdist worker) and share the results."""
+    # discover() stops scanning after `timeout` itself; no outer wait_for.
+    return await BleakScanner.discover(
+        timeout=test_config.e2e_timeout, return_adv=True
+    )
+
+
+@pytest.fixture(scope="session", params=_device_params())
+def discovered_device_address(request, scan_results):
+    """Return the test device address found by the session scan.
 
-    # Find device by name or address
+    Parametrized over BLE_TEST_DEVICE_ADDRESS entries; without one, the
+    device is matched by name. Skips the test if it is not found.
+    """
     target_name = test_config.device_name
-    target_address = test_config.device_address
+    target_address = request.param
 
-    for device, adv_data in devices.values():
+    for device, adv_data in scan_results.values():
         device_name = device.name or adv_data.local_name or ""
 
         if target_address and device.address == target_address:
             return device.address
 
-        if target_name and target_name in device_name:
+        if not target_address and target_name and target_name in device_name:
             return device.address
 
     # Device not found
     pytest.skip(
         f"Device '{target_name}' (or address '{target_address}') not found in scan. "
-        f"Found {len(devices)} devices."
+        f"Found {len(scan_results)} devices."
     )
-    return None
 
 
-@pytest.fixture
-async def connected_client(discovered_device_address):
-    """Connect to the test device and return a connected BleakClient.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_client(discovered_device_address):
+    """Connect to the test device once and share the BleakClient.
 
-    Ensures proper cleanup on teardown.
+    Only for tests that leave the connection as they found it; tests that
+    connect or disconnect on purpose create their own client. Ensures
+    proper cleanup at session teardown.
     """
     if not discovered_device_address:
         pytest.skip("No device address available")
@@ -100,15 +122,70 @@ async def connected_client(discovered_device_address):
                 pass
 
 
+class GattIndex(NamedTuple):
+    """GATT layout of the session device, walked once."""
+
+    services: list[Any]
+    by_property: dict[str, list[Any]]
+    notifiable: list[Any]
+    by_uuid: dict[str, Any]
+    by_handle: dict[int, Any]
+
+    @property
+    def readable(self) -> list[Any]:
+        return self.by_property.get("read", [])
+
+
+def build_gatt_index(services: Any) -> GattIndex:
+    services = list(services)
+    chars = [char for svc in services for char in svc.characteristics]
+    by_property: dict[str, list[Any]] = {}
+    for char in chars:
+        for prop in char.properties:
+            by_property.setdefault(prop, []).append(char)
+    return GattIndex(
+        services=services,
+        by_property=by_property,
+        notifiable=[c for c in chars if {"notify", "indicate"} & set(c.properties)],
+        by_uuid={normalize_uuid(c.uuid): c for c in chars},
+        by_handle={c.handle: c for c in chars if c.handle is not None},
+    )
+
+
+async def read_firmware_revision(client: Any) -> Optional[str]:
+    """Firmware Revision string, or None when the device has none."""
+    if client.services.get_characteristic(FIRMWARE_REVISION_CHAR) is None:
+        return None
+    data = await client.read_gatt_char(FIRMWARE_REVISION_CHAR)
+    return bytes(data).decode("utf-8", errors="replace")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def gatt_index(request, session_client):
+    """Index the shared client's services once instead of per test.
+
+    Some backends re-resolve the service collection on every access, so
+    tests read from this snapshot rather than `session_client.services`.
+    The layout is also cached across sessions (see gatt_cache) while the
+    device's firmware revision is unchanged.
+    """
+    cache = GattLayoutCache(getattr(request.config, "cache", None))
+    address = str(session_client.address)
+    revision = await read_firmware_revision(session_client)
+
+    services = cache.get(address, revision) if revision else None
+    if services is None:
+        services = list(session_client.services)
+        if revision:
+            cache.put(address, revision, services)
+    return build_gatt_index(services)
+
+
 @pytest.mark.e2e
-async def test_e2e_scan_discovers_device():
+@pytest.mark.xdist_group("scan")
+async def test_e2e_scan_discovers_device(scan_results):
     """Test that BLE scan discovers the target device."""
-    timeout = test_config.e2e_timeout
-
-    devices = await asyncio.wait_for(
-        BleakScanner.discover(timeout=timeout, return_adv=True),
-        timeout=timeout + 2.0
-    )
+    devices = scan_results
 
     assert len(devices) > 0, "No BLE devices found during scan"
 
@@ -144,61 +221,59 @@ async def test_e2e_connect_to_device(discovered_device_address):
 
 
 @pytest.mark.e2e
-async def test_e2e_discover_services(connected_client):
+async def test_e2e_discover_services(gatt_index):
     """Test discovering GATT services on the real device."""
-    services = connected_client.services
-
-    assert services is not None, "Services should not be None"
-
-    # Convert to list to check length
-    service_list = list(services)
-    assert len(service_list) > 0, "Should discover at least one service"
+    services = gatt_index.services
+    assert len(services) > 0, "Should discover at least one service"
 
     # If expected services are configured, verify them
     if test_config.expected_services:
-        discovered_uuids = {svc.uuid.lower() for svc in services}
+        remaining = {normalize_uuid(u) for u in test_config.expected_services}
+        for svc in services:
+            remaining.discard(normalize_uuid(svc.uuid))
+            if not remaining:
+                break
 
-        for expected_uuid in test_config.expected_services:
-            expected_lower = expected_uuid.lower()
-            assert expected_lower in discovered_uuids, \
-                f"Expected service {expected_uuid} not found. " \
-                f"Discovered: {discovered_uuids}"
+        assert not remaining, \
+            f"Expected services {sorted(remaining)} not found. " \
+            f"Discovered: {[svc.uuid for svc in services]}"
 
 
 @pytest.mark.e2e
-async def test_e2e_discover_characteristics(connected_client):
+async def test_e2e_discover_characteristics(gatt_index):
     """Test discovering characteristics on the real device."""
-    services = connected_client.services
-
-    total_chars = 0
-    for svc in services:
-        total_chars += len(svc.characteristics)
+    total_chars = sum(len(svc.characteristics) for svc in gatt_index.services)
 
     assert total_chars > 0, "Should discover at least one characteristic"
 
+    # If expected characteristics are configured, verify them
+    expected = {
+        "read": test_config.expected_readable_chars,
+        "notify": test_config.expected_notifiable_chars,
+    }
+    for prop, uuids in expected.items():
+        for uuid in uuids:
+            char = gatt_index.by_uuid.get(normalize_uuid(uuid))
+            assert char is not None, f"Expected characteristic {uuid} not found"
+            if prop == "notify":
+                assert {"notify", "indicate"} & set(char.properties), \
+                    f"Characteristic {uuid} is not notifiable"
+            else:
+                assert prop in char.properties, \
+                    f"Characteristic {uuid} is not readable"
+
 
 @pytest.mark.e2e
-async def test_e2e_read_characteristic(connected_client):
+async def test_e2e_read_characteristic(session_client, gatt_index):
     """Test reading a characteristic from the real device."""
-    services = connected_client.services
-
-    # Find a readable characteristic
-    readable_char = None
-    for svc in services:
-        for char in svc.characteristics:
-            if "read" in char.properties:
-                readable_char = char
-                break
-        if readable_char:
-            break
-
-    if not readable_char:
+    if not gatt_index.readable:
         pytest.skip("No readable characteristics found on device")
+    readable_char = gatt_index.readable[0]
 
     # Read the characteristic
     try:
         data = await asyncio.wait_for(
-            connected_client.read_gatt_char(readable_char),
+            session_client.read_gatt_char(readable_char.handle),
             timeout=test_config.e2e_timeout
         )
 
@@ -213,50 +288,36 @@ async def test_e2e_read_characteristic(connected_client):
 
 
 @pytest.mark.e2e
-async def test_e2e_subscribe_to_notifications(connected_client):
+async def test_e2e_subscribe_to_notifications(session_client, gatt_index):
     """Test subscribing to notifications on the real device."""
-    services = connected_client.services
-
-    # Find a notifiable characteristic
-    notifiable_char = None
-    for svc in services:
-        for char in svc.characteristics:
-            if "notify" in char.properties or "indicate" in char.properties:
-                notifiable_char = char
-                break
-        if notifiable_char:
-            break
-
-    if not notifiable_char:
+    if not gatt_index.notifiable:
         pytest.skip("No notifiable characteristics found on device")
+    notifiable_char = gatt_index.notifiable[0]
 
-    # Track if notification was received
-    notification_received = asyncio.Event()
-    notification_data = []
+    # Notifications arrive on this queue
+    notifications: asyncio.Queue[bytes] = asyncio.Queue()
 
     def notification_callback(sender, data):
-        notification_data.append(bytes(data))
-        notification_received.set()
+        notifications.put_nowait(bytes(data))
 
     try:
         # Subscribe
-        await connected_client.start_notify(notifiable_char, notification_callback)
+        await session_client.start_notify(notifiable_char.handle, notification_callback)
 
         # Wait for at least one notification (with timeout)
         try:
-            await asyncio.wait_for(notification_received.wait(), timeout=5.0)
+            first = await asyncio.wait_for(notifications.get(), timeout=5.0)
         except asyncio.TimeoutError:
             # It's OK if no notification arrives - some devices don't send
             # notifications immediately
-            pass
+            first = None
 
         # Unsubscribe
-        await connected_client.stop_notify(notifiable_char)
+        await session_client.stop_notify(notifiable_char.handle)
 
         # If we received data, verify it
-        if notification_data:
-            assert isinstance(notification_data[0], bytes), \
-                "Notification data should be bytes"
+        if first is not None:
+            assert isinstance(first, bytes), "Notification data should be bytes"
 
     except Exception as e:
         pytest.fail(
@@ -279,22 +340,19 @@ async def test_e2e_full_workflow(discovered_device_address):
         assert client.is_connected
 
         # Discover services
-        services = client.services
-        service_list = list(services)
-        assert len(service_list) > 0
+        index = build_gatt_index(client.services)
+        assert len(index.services) > 0
 
         # Find and read a characteristic if available
-        for svc in services:
-            for char in svc.characteristics:
-                if "read" in char.properties:
-                    try:
-                        data = await client.read_gatt_char(char)
-                        assert data is not None
-                        # Successfully read at least one char, test passes
-                        return
-                    except Exception:
-                        # Try next characteristic
-                        continue
+        for char in index.readable:
+            try:
+                data = await client.read_gatt_char(char)
+                assert data is not None
+                # Successfully read at least one char, test passes
+                return
+            except Exception:
+                # Try next characteristic
+                continue
 
         # If we get here, no readable chars found, but that's OK
         # The connection and discovery worked
@@ -0,0 +1,55 @@
+import pytest
+
+from ble_tui.services.error_log import ErrorLogService
+
+
+def _raise_and_capture() -> Exception:
+    try:
+        raise RuntimeError("adapter gone")
+    except RuntimeError as exc:
+        return exc
+
+
+@pytest.mark.unit
+def test_record_writes_traceback_in_background(tmp_path):
+    path = tmp_path / "errors.log"
+    errors = ErrorLogService(str(path))
+
+    errors.record("scan", _raise_and_capture())
+    assert errors.flush(timeout=2.0)
+
+    text = path.read_text(encoding="utf-8")
+    assert "] scan\n" in text
+    assert "RuntimeError: adapter gone" in text
+
+
+@pytest.mark.unit
+def test_record_rotates_oversized_log(tmp_path):
+    path = tmp_path / "errors.log"
+    path.write_text("x" * 64, encoding="utf-8")
+    errors = ErrorLogService(str(path), max_bytes=32)
+
+    errors.record("connect", _raise_and_capture())
+    assert errors.flush(timeout=2.0)
+
+    assert (tmp_path / "errors.log.1").read_text(encoding="utf-8") == "x" * 64
+    assert "connect" in path.read_text(encoding="utf-8")
+
+
+@pytest.mark.unit
+def test_unwritable_log_backs_off_without_formatting(tmp_path, monkeypatch):
+    path = tmp_path / "missing-dir" / "errors.log"
+    errors = ErrorLogService(str(path), retry_after_s=60.0)
+
+    errors.record("scan", _raise_and_capture())
+    assert errors.flush(timeout=2.0)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("traceback formatted for a dead log file")
+
+    monkeypatch.setattr("ble_tui.services.error_log.traceback.format_exception", _fail)
+    (tmp_path / "missing-dir").mkdir()
+    errors.record("scan", _raise_and_capture())
+    assert errors.flush(timeout=2.0)
+
+    assert not path.exists()
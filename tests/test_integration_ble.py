@@ -4,298 +4,303 @@ BLE Integration tests with mocked BleakClient.
 These tests verify BLE operations (connect, disconnect, discover, read, notify)
 using mocked BLE client instances without requiring full TUI initialization.
 """
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, patch, Mock
+from unittest.mock import DEFAULT, AsyncMock, patch, Mock
 import threading
+from ble_tui import BleTui
 from ble_tui.models import CharacteristicInfo
+from ble_tui.services import StateService
+from tests.fixtures import FakeChar, FakeService
 
 
-@pytest.mark.integration_ble
-async def test_connect_to_device(mock_client_factory):
-    """Test connecting to a BLE device."""
-    from ble_tui import BleTui
+@pytest.fixture(scope="module")
+def _shared_app():
+    return BleTui()
+
+
+@pytest.fixture
+def bare_app(_shared_app):
+    """An unmounted BleTui shared by the module, with fresh state per test.
+
+    For tests of pure helpers that never start the Textual app.
+    """
+    _shared_app._state = StateService()
+    return _shared_app
 
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
+
+@pytest.fixture
+async def pilot():
+    """A running BleTui under Textual's test pilot."""
+    async with BleTui(auto_scan=False).run_test() as pilot:
         await pilot.pause()
+        yield pilot
 
-        # Setup: Add a device
-        app._state.devices["AA:BB:CC:DD:EE:FF"] = Mock(
-            name="Test", address="AA:BB:CC:DD:EE:FF", rssi=-45
-        )
-        app._state.device_order.append("AA:BB:CC:DD:EE:FF")
-        app._selected_device = "AA:BB:CC:DD:EE:FF"
 
-        # Mock BleakClient
-        mock_client = mock_client_factory("AA:BB:CC:DD:EE:FF")
+@pytest.mark.integration_ble
+async def test_connect_to_device(mock_client_factory, pilot):
+    """Test connecting to a BLE device."""
+    app = pilot.app
 
-        with patch("ble_tui.services.ble_service.BleakClient", return_value=mock_client):
-            await app.action_connect()
+    # Setup: Add a device
+    app._state.devices["AA:BB:CC:DD:EE:FF"] = Mock(
+        name="Test", address="AA:BB:CC:DD:EE:FF", rssi=-45
+    )
+    app._selected_device = "AA:BB:CC:DD:EE:FF"
 
-        # Client should be set
-        assert app._client is not None
-        mock_client.connect.assert_called_once()
+    # Mock BleakClient
+    mock_client = mock_client_factory("AA:BB:CC:DD:EE:FF")
+
+    with patch("ble_tui.services.ble_service.BleakClient", return_value=mock_client):
+        await app.action_connect()
+
+    # Client should be set
+    assert app._client is not None
+    mock_client.connect.assert_called_once()
 
 
 @pytest.mark.integration_ble
-async def test_disconnect_clears_state():
+async def test_disconnect_clears_state(mock_client_factory, pilot):
     """Test that disconnect clears all BLE state."""
-    from ble_tui import BleTui
+    app = pilot.app
 
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    # Setup: Simulate connected state
+    mock_client = mock_client_factory()
 
-        # Setup: Simulate connected state
-        mock_client = AsyncMock()
-        mock_client.is_connected = True
-        mock_client.disconnect = AsyncMock()
+    app._client = mock_client
+    app._state.services = {"svc1": []}
+    app._state.key_by_handle = {100: "key1"}
+    app._state.subscribed = {"key1"}
+    app._state.logs = {"key1": [{"ts": "12:00:00.000", "data": b"test"}]}
+    app._selected_char = "key1"
 
-        app._client = mock_client
-        app._state.services = {"svc1": []}
-        app._state.key_by_handle = {100: "key1"}
-        app._state.subscribed = {"key1"}
-        app._state.logs = {"key1": [{"ts": "12:00:00.000", "data": b"test"}]}
-        app._selected_char = "key1"
+    # Disconnect
+    await app._disconnect_internal()
 
-        # Disconnect
-        await app._disconnect_internal()
+    # All state should be cleared
+    assert app._client is None
+    assert len(app._state.services) == 0
+    assert len(app._state.key_by_handle) == 0
+    assert len(app._state.subscribed) == 0
+    assert len(app._state.logs) == 0
+    assert app._selected_char is None
 
-        # All state should be cleared
-        assert app._client is None
-        assert len(app._state.services) == 0
-        assert len(app._state.key_by_handle) == 0
-        assert len(app._state.subscribed) == 0
-        assert len(app._state.logs) == 0
-        assert app._selected_char is None
-
-        # Client disconnect should have been called
-        mock_client.disconnect.assert_called_once()
+    # Client disconnect should have been called
+    mock_client.disconnect.assert_called_once()
 
 
 @pytest.mark.integration_ble
-async def test_disconnect_handles_no_client():
+async def test_disconnect_handles_no_client(pilot):
     """Test disconnect when no client exists."""
-    from ble_tui import BleTui
+    app = pilot.app
 
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    # No client set
+    app._client = None
 
-        # No client set
-        app._client = None
-
-        # Disconnect should not raise error
-        await app._disconnect_internal()
+    # Disconnect should not raise error
+    await app._disconnect_internal()
 
-        # Should still be None
-        assert app._client is None
+    # Should still be None
+    assert app._client is None
 
 
 @pytest.mark.integration_ble
-async def test_discover_gatt_services():
-    """Test GATT service and characteristic discovery."""
-    from ble_tui import BleTui
+async def test_disconnected_callback_on_app_thread_clears_state(
+    mock_client_factory, pilot
+):
+    """Bleak's disconnected_callback updates the UI when fired on the app thread."""
+    app = pilot.app
+    mock_client = mock_client_factory()
+    app._client = mock_client
+    app._state.subscribed = {"key1"}
 
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app._on_disconnected(mock_client)
 
-        # Create mock service with characteristic
-        char = Mock()
-        char.uuid = "00002a00-0000-1000-8000-00805f9b34fb"
-        char.properties = ["read", "write"]
-        char.handle = 100
-
-        svc = Mock()
-        svc.uuid = "00001800-0000-1000-8000-00805f9b34fb"
-        svc.characteristics = [char]
-
-        # Setup client with string address to avoid markup issues
-        mock_client = AsyncMock()
-        mock_client.address = "AA:BB:CC:DD:EE:FF"
-        mock_client.is_connected = True
-        mock_client.services = [svc]
-        app._client = mock_client
-
-        # Discover GATT
-        await app._discover_gatt()
+    assert app._client is None
+    assert not app._state.subscribed
+    assert app._status_msg == "Device disconnected unexpectedly"
+
+
+@pytest.mark.integration_ble
+async def test_disconnected_callback_ignores_replaced_client(
+    mock_client_factory, pilot
+):
+    """A late callback from a previous connection leaves the current one alone."""
+    app = pilot.app
+    current = mock_client_factory()
+    app._client = current
 
-        # Services should be stored
-        assert len(app._state.services) > 0
-        assert len(app._state.key_by_handle) > 0
+    app._on_disconnected(mock_client_factory("11:22:33:44:55:66"))
+
+    assert app._client is current
 
 
 @pytest.mark.integration_ble
-async def test_read_characteristic():
-    """Test reading a characteristic."""
-    from ble_tui import BleTui
+async def test_discover_gatt_services(mock_client_factory, pilot):
+    """Test GATT service and characteristic discovery."""
+    app = pilot.app
 
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    # Create mock service with characteristic
+    char = Mock()
+    char.uuid = "00002a00-0000-1000-8000-00805f9b34fb"
+    char.properties = ["read", "write"]
+    char.handle = 100
 
-        # Setup: Readable characteristic
-        char = Mock()
-        char.uuid = "char-uuid"
-        char.properties = ["read"]
-        char.handle = 100
-
-        char_info = CharacteristicInfo(
-            key="svc:char:100",
-            uuid="char-uuid",
-            properties=("read",),
-            service_uuid="svc-uuid",
-            char=char,
-        )
+    svc = Mock()
+    svc.uuid = "00001800-0000-1000-8000-00805f9b34fb"
+    svc.characteristics = [char]
 
-        mock_client = AsyncMock()
-        mock_client.address = "AA:BB:CC:DD:EE:FF"
-        mock_client.is_connected = True
-        mock_client.read_gatt_char = AsyncMock(return_value=b"Hello BLE")
+    # Setup client with string address to avoid markup issues
+    mock_client = mock_client_factory(services=[svc])
+    app._client = mock_client
 
-        app._client = mock_client
-        app._state.services = {"svc-uuid": [char_info]}
-        app._selected_char = "svc:char:100"
+    # Discover GATT
+    await app._discover_gatt()
 
-        # Read characteristic
-        await app.action_read_char()
+    # Services should be stored
+    assert len(app._state.services) > 0
+    assert len(app._state.key_by_handle) > 0
 
-        # Read should have been called
-        mock_client.read_gatt_char.assert_called_once()
 
-        # Value should be logged
-        assert "svc:char:100" in app._state.logs
-        assert len(app._state.logs["svc:char:100"]) == 1
+@pytest.mark.integration_ble
+async def test_discover_gatt_builds_tree_in_one_batch(mock_client_factory, pilot):
+    """A large GATT layout is added to the tree under a single batched update."""
+    app = pilot.app
+    services = [
+        FakeService(
+            f"svc-{s}",
+            [FakeChar(f"char-{s}-{c}", ("read",), s * 10 + c) for c in range(5)],
+        )
+        for s in range(10)
+    ]
+    app._client = mock_client_factory(services=services)
+
+    with patch.object(app, "batch_update", wraps=app.batch_update) as batch_mock:
+        await app._discover_gatt()
+    await pilot.pause()
+
+    batch_mock.assert_called_once()
+    svc_nodes = app._gatt_tree.root.children
+    assert len(svc_nodes) == 10
+    assert all(node.is_expanded and len(node.children) == 5 for node in svc_nodes)
+    assert len(app._char_nodes) == 50
 
 
 @pytest.mark.integration_ble
-async def test_read_non_readable_characteristic_fails():
-    """Test that reading a non-readable characteristic fails gracefully."""
-    from ble_tui import BleTui
+@pytest.mark.parametrize(
+    "properties,expect_read",
+    [(("read",), True), (("notify",), False)],
+    ids=["readable", "not-readable"],
+)
+async def test_read_characteristic(mock_client_factory, pilot, properties, expect_read):
+    """Test reading a characteristic, and refusing when it is not readable."""
+    app = pilot.app
 
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    char = Mock()
+    char.uuid = "char-uuid"
+    char.properties = list(properties)
+    char.handle = 100
 
-        # Setup: Non-readable characteristic
-        char = Mock()
-        char.uuid = "char-uuid"
-        char.properties = ["notify"]  # No read!
-        char.handle = 100
-
-        char_info = CharacteristicInfo(
-            key="svc:char:100",
-            uuid="char-uuid",
-            properties=("notify",),
-            service_uuid="svc-uuid",
-            char=char,
-        )
+    char_info = CharacteristicInfo(
+        key="svc:char:100",
+        uuid="char-uuid",
+        properties=properties,
+        service_uuid="svc-uuid",
+        char=char,
+    )
 
-        mock_client = AsyncMock()
-        mock_client.address = "AA:BB:CC:DD:EE:FF"
-        mock_client.is_connected = True
+    mock_client = mock_client_factory(
+        read_gatt_char=AsyncMock(return_value=b"Hello BLE")
+    )
 
-        app._client = mock_client
-        app._state.services = {"svc-uuid": [char_info]}
-        app._selected_char = "svc:char:100"
+    app._client = mock_client
+    app._state.services = {"svc-uuid": [char_info]}
+    app._selected_char = "svc:char:100"
 
-        # Try to read
-        await app.action_read_char()
+    # Read characteristic
+    await app.action_read_char()
 
+    if expect_read:
+        # Read should have been called and the value logged
+        mock_client.read_gatt_char.assert_called_once()
+        assert len(app._state.logs["svc:char:100"]) == 1
+    else:
         # Read should NOT have been called
         mock_client.read_gatt_char.assert_not_called()
+        assert "svc:char:100" not in app._state.logs
 
 
 @pytest.mark.integration_ble
-async def test_start_notify():
-    """Test starting notifications on a characteristic."""
-    from ble_tui import BleTui
-
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+async def test_read_is_not_blocked_by_connection_lock(mock_client_factory, pilot):
+    """GATT operations only take the op lock, not the connection lock."""
+    app = pilot.app
 
-        # Setup: Notifiable characteristic
-        char = Mock()
-        char.uuid = "char-uuid"
-        char.properties = ["notify"]
-        char.handle = 100
-
-        char_info = CharacteristicInfo(
-            key="svc:char:100",
-            uuid="char-uuid",
-            properties=("notify",),
-            service_uuid="svc-uuid",
-            char=char,
-        )
-
-        mock_client = AsyncMock()
-        mock_client.address = "AA:BB:CC:DD:EE:FF"
-        mock_client.is_connected = True
+    char = Mock()
+    char.handle = 100
+    char_info = CharacteristicInfo(
+        key="svc:char:100",
+        uuid="char-uuid",
+        properties=("read",),
+        service_uuid="svc-uuid",
+        char=char,
+    )
 
-        app._client = mock_client
-        app._state.services = {"svc-uuid": [char_info]}
-        app._selected_char = "svc:char:100"
+    mock_client = mock_client_factory(read_gatt_char=AsyncMock(return_value=b"\x01"))
 
-        # Start notify
-        await app.action_toggle_notify()
+    app._client = mock_client
+    app._state.services = {"svc-uuid": [char_info]}
+    app._selected_char = "svc:char:100"
 
-        # start_notify should have been called
-        mock_client.start_notify.assert_called_once()
+    async with app._conn_lock:
+        await asyncio.wait_for(app.action_read_char(), timeout=1.0)
 
-        # Should be in subscribed set
-        assert "svc:char:100" in app._state.subscribed
+    mock_client.read_gatt_char.assert_called_once()
+    assert not app._op_lock.locked()
 
 
 @pytest.mark.integration_ble
-async def test_stop_notify():
-    """Test stopping notifications on a characteristic."""
-    from ble_tui import BleTui
-
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+@pytest.mark.parametrize(
+    "already_subscribed,expected_method",
+    [(False, "start_notify"), (True, "stop_notify")],
+    ids=["start", "stop"],
+)
+async def test_toggle_notify(mock_client_factory, pilot, already_subscribed, expected_method):
+    """Test starting and stopping notifications on a characteristic."""
+    app = pilot.app
+
+    # Setup: Notifiable characteristic
+    char = Mock()
+    char.uuid = "char-uuid"
+    char.properties = ["notify"]
+    char.handle = 100
 
-        # Setup: Already subscribed characteristic
-        char = Mock()
-        char.uuid = "char-uuid"
-        char.properties = ["notify"]
-        char.handle = 100
-
-        char_info = CharacteristicInfo(
-            key="svc:char:100",
-            uuid="char-uuid",
-            properties=("notify",),
-            service_uuid="svc-uuid",
-            char=char,
-        )
+    char_info = CharacteristicInfo(
+        key="svc:char:100",
+        uuid="char-uuid",
+        properties=("notify",),
+        service_uuid="svc-uuid",
+        char=char,
+    )
 
-        mock_client = AsyncMock()
-        mock_client.address = "AA:BB:CC:DD:EE:FF"
-        mock_client.is_connected = True
+    mock_client = mock_client_factory()
 
-        app._client = mock_client
-        app._state.services = {"svc-uuid": [char_info]}
-        app._selected_char = "svc:char:100"
+    app._client = mock_client
+    app._state.services = {"svc-uuid": [char_info]}
+    app._selected_char = "svc:char:100"
+    if already_subscribed:
         app._state.subscribed.add("svc:char:100")
 
-        # Stop notify
-        await app.action_toggle_notify()
-
-        # stop_notify should have been called
-        mock_client.stop_notify.assert_called_once()
+    await app.action_toggle_notify()
 
-        # Should be removed from subscribed set
-        assert "svc:char:100" not in app._state.subscribed
+    getattr(mock_client, expected_method).assert_called_once()
+    # Subscription state should have flipped
+    assert ("svc:char:100" in app._state.subscribed) is not already_subscribed
 
 
 @pytest.mark.integration_ble
-async def test_append_value_creates_log_entry():
+async def test_append_value_creates_log_entry(bare_app):
     """Test that appending a value creates a proper log entry."""
-    from ble_tui import BleTui
-
-    app = BleTui()
+    app = bare_app
 
     # Append a value
     test_data = b'{"test": 123}'
@@ -312,26 +317,23 @@ async def test_append_value_creates_log_entry():
 
 
 @pytest.mark.integration_ble
-async def test_log_entry_max_limit():
+def test_log_entry_max_limit(bare_app):
     """Test that log entries respect max limit (200)."""
-    from ble_tui import BleTui
-
-    app = BleTui()
+    app = bare_app
+    payloads = [b"data-%d" % i for i in range(250)]
 
     # Add 250 entries
-    for i in range(250):
-        app._append_value("test-key", f"data-{i}".encode())
+    for payload in payloads:
+        app._append_value("test-key", payload)
 
     # Should only keep last 200 (LOG_MAX)
     assert len(app._state.logs["test-key"]) == 200
 
 
 @pytest.mark.integration_ble
-async def test_find_char_by_key():
+async def test_find_char_by_key(bare_app):
     """Test finding a characteristic by its key."""
-    from ble_tui import BleTui
-
-    app = BleTui()
+    app = bare_app
 
     # Setup: Add a characteristic
     char_info = CharacteristicInfo(
@@ -353,11 +355,9 @@ async def test_find_char_by_key():
 
 
 @pytest.mark.integration_ble
-async def test_find_char_returns_none_if_not_found():
+async def test_find_char_returns_none_if_not_found(bare_app):
     """Test that finding a non-existent characteristic returns None."""
-    from ble_tui import BleTui
-
-    app = BleTui()
+    app = bare_app
     app._state.services = {}
 
     found = app._find_char("non-existent-key")
@@ -366,11 +366,9 @@ async def test_find_char_returns_none_if_not_found():
 
 
 @pytest.mark.integration_ble
-async def test_char_target_uses_handle_if_available():
+async def test_char_target_uses_handle_if_available(bare_app):
     """Test that _char_target returns handle when available."""
-    from ble_tui import BleTui
-
-    app = BleTui()
+    app = bare_app
 
     char = Mock()
     char.handle = 100
@@ -391,11 +389,9 @@ async def test_char_target_uses_handle_if_available():
 
 
 @pytest.mark.integration_ble
-async def test_char_target_uses_uuid_if_no_handle():
+async def test_char_target_uses_uuid_if_no_handle(bare_app):
     """Test that _char_target returns UUID when handle not available."""
-    from ble_tui import BleTui
-
-    app = BleTui()
+    app = bare_app
 
     char = Mock(spec=[])  # No handle attribute
     char.uuid = "char-uuid"
@@ -417,42 +413,179 @@ async def test_char_target_uses_uuid_if_no_handle():
 @pytest.mark.integration_ble
 async def test_dispatch_notify_does_not_touch_ui_when_thread_dispatch_fails():
     """Notification callback fallback must not update UI off the main thread."""
-    from ble_tui import BleTui
+    app = BleTui()
+    app._app_thread_id = threading.get_ident() + 1
 
+    with patch.multiple(
+        app,
+        call_from_thread=Mock(side_effect=RuntimeError("closed loop")),
+        _append_values=DEFAULT,
+        _set_status=DEFAULT,
+        _record_error=DEFAULT,
+    ) as mocks:
+        app._dispatch_notify("svc:char:1", b"\x01\x02", "char-uuid")
+
+    mocks["_append_values"].assert_not_called()
+    mocks["_set_status"].assert_not_called()
+    mocks["_record_error"].assert_called_once()
+
+
+@pytest.mark.integration_ble
+async def test_dispatch_notify_on_app_thread_flushes_after_refresh():
+    """If callbacks run on the app thread, a burst is flushed once after refresh."""
     app = BleTui()
-    app._thread_id = threading.get_ident() + 1
+    app._app_thread_id = threading.get_ident()
 
-    with patch.object(app, "call_from_thread", side_effect=RuntimeError("closed loop")):
-        with patch.object(app, "_append_value") as append_mock:
+    marshal_mock = Mock(
+        side_effect=RuntimeError(
+            "The `call_from_thread` method must run in a different thread from the app"
+        )
+    )
+    with patch.multiple(
+        app,
+        call_from_thread=marshal_mock,
+        call_after_refresh=DEFAULT,
+        _append_values=DEFAULT,
+        _set_status=DEFAULT,
+        _record_error=DEFAULT,
+    ) as mocks:
+        app._dispatch_notify("svc:char:1", b"\x01\x02", "char-uuid")
+        app._dispatch_notify("svc:char:1", b"\x03", "char-uuid")
+        mocks["_append_values"].assert_not_called()
+        mocks["call_after_refresh"].assert_called_once_with(app._flush_notifies)
+        app._flush_notifies()
+
+    marshal_mock.assert_not_called()
+    mocks["_append_values"].assert_called_once_with(
+        "svc:char:1", [b"\x01\x02", b"\x03"]
+    )
+    mocks["_set_status"].assert_called_once_with("Notify char-uuid (1 B)")
+    mocks["_record_error"].assert_not_called()
+
+
+@pytest.mark.integration_ble
+async def test_dispatch_notify_coalesces_payloads_into_one_flush():
+    """A burst of notifications should schedule a single UI flush."""
+    app = BleTui()
+    app._app_thread_id = threading.get_ident() + 1
+
+    def _run(callback, *args):
+        return callback(*args)
+
+    with patch.object(app, "call_from_thread", side_effect=_run) as marshal_mock:
+        with patch.object(app, "_append_values") as append_mock:
             with patch.object(app, "_set_status") as status_mock:
-                with patch.object(app, "_record_error") as error_mock:
-                    app._dispatch_notify("svc:char:1", b"\x01\x02", "char-uuid")
+                for i in range(5):
+                    app._dispatch_notify("svc:char:1", bytes([i]), "char-uuid")
+                await asyncio.sleep(0.1)
 
-    append_mock.assert_not_called()
-    status_mock.assert_not_called()
-    error_mock.assert_called_once()
+    assert marshal_mock.call_count == 1
+    append_mock.assert_called_once_with(
+        "svc:char:1", [b"\x00", b"\x01", b"\x02", b"\x03", b"\x04"]
+    )
+    status_mock.assert_called_once_with("Notify char-uuid (1 B)")
 
 
 @pytest.mark.integration_ble
-async def test_dispatch_notify_falls_back_to_direct_calls_on_app_thread():
-    """If callback runs on app thread, fallback should apply updates directly."""
-    from ble_tui import BleTui
+async def test_dispatch_notify_flushes_early_past_byte_threshold():
+    """A buffered burst reaching NOTIFY_FLUSH_MAX_BYTES is flushed right away."""
+    from ble_tui.utils import NOTIFY_FLUSH_MAX_BYTES
 
     app = BleTui()
-    app._thread_id = threading.get_ident()
+    app._app_thread_id = threading.get_ident() + 1
+    chunk = b"\x00" * (NOTIFY_FLUSH_MAX_BYTES // 2)
 
-    with patch.object(
+    with patch.multiple(
         app,
-        "call_from_thread",
-        side_effect=RuntimeError(
-            "The `call_from_thread` method must run in a different thread from the app"
-        ),
-    ):
-        with patch.object(app, "_append_value") as append_mock:
-            with patch.object(app, "_set_status") as status_mock:
-                with patch.object(app, "_record_error") as error_mock:
-                    app._dispatch_notify("svc:char:1", b"\x01\x02", "char-uuid")
+        call_from_thread=DEFAULT,
+        _append_values=DEFAULT,
+        _set_status=DEFAULT,
+    ) as mocks:
+        app._dispatch_notify("svc:char:1", chunk, "char-uuid")
+        mocks["call_from_thread"].assert_called_once_with(app._schedule_flush)
+        app._dispatch_notify("svc:char:1", chunk, "char-uuid")
+        app._dispatch_notify("svc:char:1", chunk, "char-uuid")
+        app._flush_notifies()
+
+    assert mocks["call_from_thread"].call_args_list[1:] == [
+        ((app._flush_notifies,),)
+    ]
+    mocks["_append_values"].assert_called_once_with("svc:char:1", [chunk] * 3)
+    assert app._pending_bytes == 0
+    assert not app._flush_scheduled and not app._flush_forced
+
+
+@pytest.mark.integration_ble
+async def test_subscribe_all_subscribes_every_notifiable_char(mock_client_factory, pilot):
+    """Subscribe-all should batch start_notify over all notifiable characteristics."""
+    app = pilot.app
+
+    infos = []
+    for handle, props in ((10, ("notify",)), (11, ("indicate",)), (12, ("read",))):
+        char = Mock()
+        char.handle = handle
+        infos.append(
+            CharacteristicInfo(
+                key=f"svc:char{handle}:{handle}",
+                uuid=f"char{handle}",
+                properties=props,
+                service_uuid="svc",
+                char=char,
+            )
+        )
+
+    mock_client = mock_client_factory()
+
+    app._client = mock_client
+    app._state.services = {"svc": infos}
+
+    await app.action_subscribe_all()
+
+    assert mock_client.start_notify.call_count == 2
+    assert app._state.subscribed == {"svc:char10:10", "svc:char11:11"}
+
+
+@pytest.mark.integration_ble
+async def test_toggle_notify_relabels_only_indexed_node(mock_client_factory, pilot):
+    """Discovered characteristic nodes are indexed and relabelled in place."""
+    app = pilot.app
+
+    char = Mock()
+    char.uuid = "char-uuid"
+    char.properties = ["notify"]
+    char.handle = 100
+    svc = Mock()
+    svc.uuid = "svc-uuid"
+    svc.characteristics = [char]
+
+    mock_client = mock_client_factory(services=[svc])
+    app._client = mock_client
+
+    await app._discover_gatt()
+    key = "svc-uuid:char-uuid:100"
+    node = app._char_nodes[key]
+
+    app._selected_char = key
+    await app.action_toggle_notify()
+
+    assert str(node.label).endswith("[N]")
+
+
+@pytest.mark.integration_ble
+async def test_connected_address_is_read_once_per_client():
+    """Status re-renders must not re-read the client's address each time."""
+    app = BleTui()
+    client = Mock()
+    client.address = "AA:BB:CC:DD:EE:FF"
+    client.is_connected = True
+    app._client = client
+
+    with patch.object(
+        app._state, "connected_address", wraps=app._state.connected_address
+    ) as lookup_mock:
+        for _ in range(3):
+            assert app._connected_address() == "AA:BB:CC:DD:EE:FF"
+        app._client = None
+        assert app._connected_address() is None
 
-    append_mock.assert_called_once_with("svc:char:1", b"\x01\x02")
-    status_mock.assert_called_once_with("Notify char-uuid (2 B)")
-    error_mock.assert_not_called()
+    assert lookup_mock.call_count == 2
@@ -8,128 +8,185 @@ while mocking the BLE operations.
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from textual.widgets import DataTable, RichLog, Tree
+import pytest_asyncio
+from textual.containers import VerticalScroll
+from textual.widgets import DataTable, RichLog, Static, Tree
 
 from ble_tui import BleTui
-from tests.fixtures import create_mock_scanner_with_devices, create_test_device
+from ble_tui.models import CharacteristicInfo
+from ble_tui.services import BleService
+from ble_tui.ui.write_dialog import WriteDialog
+from ble_tui.utils import LOG_MAX
+from tests.fixtures import (
+    FakeChar,
+    create_mock_scanner_with_devices,
+    create_test_device,
+    seed_log,
+    wait_until,
+)
+
+
+# The shared app lives on the session loop, so every test here runs there too
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _scan_settled(app: BleTui) -> bool:
+    return not app._scan_in_progress and app._status_msg.startswith(
+        ("Scan complete", "Scan failed")
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_pilot():
+    """One BleTui started once for the whole session."""
+    async with BleTui(auto_scan=False).run_test() as pilot:
+        yield pilot
+
+
+def _reset_app(app: BleTui) -> None:
+    """Return a running app to its freshly mounted state."""
+    while len(app.screen_stack) > 1:
+        app.pop_screen()
+    if app._highlight_timer is not None:
+        app._highlight_timer.stop()
+    app._ble = BleService()
+    app._init_state()
+    app._latest_value_scroll.remove_class("expanded")
+    app._log_view.remove_class("collapsed")
+    app._clear_gatt_ui()
+    app._set_status("Ready")
+    app._devices_table.focus()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def pilot(_session_pilot):
+    """The shared BleTui pilot, reset before each test.
+
+    Tests that inject a scanner for the auto-scan, or that quit the app,
+    start their own instance instead.
+    """
+    _reset_app(_session_pilot.app)
+    await _session_pilot.pause()
+    return _session_pilot
 
 
 @pytest.mark.integration_tui
-async def test_app_starts_and_renders():
+async def test_app_starts_and_renders(pilot):
     """Test that the app starts and renders basic UI elements."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
+    app = pilot.app
 
-        # Check that main widgets exist
-        assert app.query_one("#devices", DataTable)
-        assert app.query_one("#gatt", Tree)
-        assert app.query_one("#log", RichLog)
-        assert app.query_one("#status")
+    # Check that main widgets exist
+    assert app.query_one("#devices", DataTable)
+    assert app.query_one("#gatt", Tree)
+    assert app.query_one("#log", RichLog)
+    assert app.query_one("#status")
 
 
 @pytest.mark.integration_tui
-async def test_devices_table_has_columns():
+async def test_devices_table_has_columns(pilot):
     """Test that the devices DataTable has the correct columns."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        devices_table = app.query_one("#devices", DataTable)
+    app = pilot.app
+    devices_table = app.query_one("#devices", DataTable)
 
-        # Should have columns after mount
-        assert devices_table.columns
-        # Columns: Conn, RSSI, Name, Address
-        assert len(devices_table.columns) == 4
+    # Should have columns after mount
+    assert devices_table.columns
+    # Columns: Conn, RSSI, Name, Address
+    assert len(devices_table.columns) == 4
 
 
 @pytest.mark.integration_tui
-async def test_initial_focus_on_devices():
+async def test_initial_focus_on_devices(pilot):
     """Test that initial focus is on the devices table."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app = pilot.app
 
-        # Devices table should have focus initially
-        focused = app.focused
-        assert isinstance(focused, DataTable)
+    # Devices table should have focus initially
+    focused = app.focused
+    assert isinstance(focused, DataTable)
 
 
 @pytest.mark.integration_tui
-async def test_tab_navigation_between_panes():
+async def test_tab_navigation_between_panes(pilot):
     """Test Tab key navigates between panes."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        from textual.containers import VerticalScroll
-
-        await pilot.pause()
+    app = pilot.app
 
-        # Start at devices table
-        assert isinstance(app.focused, DataTable)
+    # Start at devices table
+    assert isinstance(app.focused, DataTable)
 
-        # Press Tab -> should move to GATT tree
-        await pilot.press("tab")
-        assert isinstance(app.focused, Tree)
+    # Press Tab -> should move to GATT tree
+    await pilot.press("tab")
+    assert isinstance(app.focused, Tree)
 
-        # Press Tab again -> should move to latest value scroll
-        await pilot.press("tab")
-        assert isinstance(app.focused, VerticalScroll)
+    # Press Tab again -> should move to latest value scroll
+    await pilot.press("tab")
+    assert isinstance(app.focused, VerticalScroll)
 
-        # Press Tab again -> should move to log
-        await pilot.press("tab")
-        assert isinstance(app.focused, RichLog)
+    # Press Tab again -> should move to log
+    await pilot.press("tab")
+    assert isinstance(app.focused, RichLog)
 
-        # Press Tab again -> should wrap to devices
-        await pilot.press("tab")
-        assert isinstance(app.focused, DataTable)
+    # Press Tab again -> should wrap to devices
+    await pilot.press("tab")
+    assert isinstance(app.focused, DataTable)
 
 
 @pytest.mark.integration_tui
-async def test_shift_tab_navigation_backward():
+async def test_shift_tab_navigation_backward(pilot):
     """Test Shift+Tab navigates backward between panes."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        from textual.containers import VerticalScroll
+    app = pilot.app
 
-        await pilot.pause()
+    # Start at devices table
+    assert isinstance(app.focused, DataTable)
 
-        # Start at devices table
-        assert isinstance(app.focused, DataTable)
+    # Press Shift+Tab -> should move backward to log
+    await pilot.press("shift+tab")
+    assert isinstance(app.focused, RichLog)
 
-        # Press Shift+Tab -> should move backward to log
-        await pilot.press("shift+tab")
-        assert isinstance(app.focused, RichLog)
+    # Press Shift+Tab again -> should move to latest value scroll
+    await pilot.press("shift+tab")
+    assert isinstance(app.focused, VerticalScroll)
 
-        # Press Shift+Tab again -> should move to latest value scroll
-        await pilot.press("shift+tab")
-        assert isinstance(app.focused, VerticalScroll)
+    # Press Shift+Tab again -> should move to GATT
+    await pilot.press("shift+tab")
+    assert isinstance(app.focused, Tree)
 
-        # Press Shift+Tab again -> should move to GATT
-        await pilot.press("shift+tab")
-        assert isinstance(app.focused, Tree)
-
-        # Press Shift+Tab again -> should wrap to devices
-        await pilot.press("shift+tab")
-        assert isinstance(app.focused, DataTable)
+    # Press Shift+Tab again -> should wrap to devices
+    await pilot.press("shift+tab")
+    assert isinstance(app.focused, DataTable)
 
 
 @pytest.mark.integration_tui
 async def test_scan_with_mocked_scanner():
-    """Test scan action with mocked BleakScanner."""
+    """Test scan action with an injected mock scanner."""
     # Create mock devices
     device1 = create_test_device("Device1", "AA:BB:CC:DD:EE:F1", -45)
     device2 = create_test_device("Device2", "AA:BB:CC:DD:EE:F2", -55)
 
     scanner = create_mock_scanner_with_devices(device1, device2)
 
-    with patch("ble_tui.services.ble_service.BleakScanner", scanner):
-        async with BleTui().run_test() as pilot:
-            app = pilot.app
+    async with BleTui(ble=BleService(scanner=scanner)).run_test() as pilot:
+        app = pilot.app
 
-            # Wait for auto-scan to complete
-            await pilot.pause(0.5)
+        devices_table = app.query_one("#devices", DataTable)
+
+        # Wait for auto-scan to complete
+        await wait_until(pilot, lambda: devices_table.row_count == 2)
+
+        # Should have 2 devices
+        assert devices_table.row_count == 2
+
+
+@pytest.mark.integration_tui
+async def test_auto_scan_disabled_skips_startup_scan():
+    """With auto_scan=False the app mounts without scanning."""
+    scanner = create_mock_scanner_with_devices(create_test_device())
 
-            devices_table = app.query_one("#devices", DataTable)
+    async with BleTui(
+        ble=BleService(scanner=scanner), auto_scan=False
+    ).run_test() as pilot:
+        await pilot.pause()
 
-            # Should have 2 devices
-            assert devices_table.row_count == 2
+        scanner.discover.assert_not_awaited()
+        assert pilot.app._status_msg == "Ready"
 
 
 @pytest.mark.integration_tui
@@ -138,25 +195,42 @@ async def test_scan_action_populates_devices():
     device1 = create_test_device("TestDev", "AA:BB:CC:DD:EE:FF", -40)
     scanner = create_mock_scanner_with_devices(device1)
 
-    with patch("ble_tui.services.ble_service.BleakScanner", scanner):
-        async with BleTui().run_test() as pilot:
-            app = pilot.app
-            await pilot.pause()
+    async with BleTui(ble=BleService(scanner=scanner)).run_test() as pilot:
+        app = pilot.app
+        await wait_until(pilot, lambda: _scan_settled(app))
 
-            # Clear any auto-scan results
-            app._state.devices.clear()
-            app._state.device_order.clear()
+        # Clear any auto-scan results
+        app._state.replace_devices([])
 
-            # Trigger manual scan
-            await pilot.press("s")
-            await pilot.pause(0.5)
+        # Trigger manual scan
+        await pilot.press("s")
+        await wait_until(pilot, lambda: len(app._state.devices) == 1)
 
-            # Check device was added
-            assert len(app._state.devices) == 1
-            assert "AA:BB:CC:DD:EE:FF" in app._state.devices
+        # Check device was added
+        assert len(app._state.devices) == 1
+        assert "AA:BB:CC:DD:EE:FF" in app._state.devices
 
-            devices_table = app.query_one("#devices", DataTable)
-            assert devices_table.row_count == 1
+        devices_table = app.query_one("#devices", DataTable)
+        assert devices_table.row_count == 1
+
+
+@pytest.mark.integration_tui
+async def test_scan_renders_devices_table_once():
+    """Scan should only clear the table up front and render it once at the end."""
+    device1 = create_test_device("TestDev", "AA:BB:CC:DD:EE:FF", -40)
+    scanner = create_mock_scanner_with_devices(device1)
+
+    async with BleTui(ble=BleService(scanner=scanner)).run_test() as pilot:
+        app = pilot.app
+        await wait_until(pilot, lambda: _scan_settled(app))
+
+        with patch.object(
+            app, "_render_devices_table", wraps=app._render_devices_table
+        ) as render_mock:
+            await app.action_scan()
+
+        render_mock.assert_called_once()
+        assert app.query_one("#devices", DataTable).row_count == 1
 
 
 @pytest.mark.integration_tui
@@ -170,21 +244,21 @@ async def test_devices_sorted_by_rssi():
         weak_device, strong_device, medium_device
     )
 
-    with patch("ble_tui.services.ble_service.BleakScanner", scanner):
-        async with BleTui().run_test() as pilot:
-            app = pilot.app
-            await pilot.pause(0.5)
+    async with BleTui(ble=BleService(scanner=scanner)).run_test() as pilot:
+        app = pilot.app
+        await wait_until(pilot, lambda: len(app._state.devices) == 3)
 
-            # Devices should be sorted by RSSI (strongest first)
-            assert len(app._state.device_order) == 3
+        # Devices should be sorted by RSSI (strongest first)
+        addresses = list(app._state.device_addresses())
+        assert len(addresses) == 3
 
-            # First device should be strongest (-30)
-            first_addr = app._state.device_order[0]
-            assert app._state.devices[first_addr].rssi == -30
+        # First device should be strongest (-30)
+        first_addr = addresses[0]
+        assert app._state.devices[first_addr].rssi == -30
 
-            # Last device should be weakest (-80)
-            last_addr = app._state.device_order[-1]
-            assert app._state.devices[last_addr].rssi == -80
+        # Last device should be weakest (-80)
+        last_addr = addresses[-1]
+        assert app._state.devices[last_addr].rssi == -80
 
 
 @pytest.mark.integration_tui
@@ -192,64 +266,68 @@ async def test_status_updates_during_scan():
     """Test that status message updates during scan."""
     scanner = create_mock_scanner_with_devices()
 
-    with patch("ble_tui.services.ble_service.BleakScanner", scanner):
-        async with BleTui().run_test() as pilot:
-            app = pilot.app
+    async with BleTui(ble=BleService(scanner=scanner)).run_test() as pilot:
+        app = pilot.app
 
-            # Trigger scan
-            await pilot.press("s")
-            await pilot.pause(0.1)
+        # Trigger scan
+        await pilot.press("s")
+        await wait_until(pilot, lambda: _scan_settled(app))
 
-            # Status should be updated (check internal state)
-            assert app._status_msg is not None
+        # Status should be updated (check internal state)
+        assert app._status_msg is not None
 
 
 @pytest.mark.integration_tui
-async def test_scan_failure_shows_platform_guidance():
+async def test_scan_failure_shows_platform_guidance(pilot):
     """Test scan failure message includes actionable Bluetooth guidance."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause(0.5)
+    app = pilot.app
+
+    app._ble.scan = AsyncMock(side_effect=RuntimeError("org.bluez.Error.Failed"))
+    await app.action_scan()
+
+    assert "Scan failed:" in app._status_msg
+    assert "Bluetooth" in app._status_msg
+
 
-        app._scan_in_progress = False
-        app._ble.scan = AsyncMock(side_effect=RuntimeError("org.bluez.Error.Failed"))
-        await app.action_scan()
+@pytest.mark.integration_tui
+async def test_status_widget_updates_only_on_change(pilot):
+    """Re-setting an unchanged status does not touch the status widget."""
+    app = pilot.app
+
+    with patch.object(app._status_widget, "update") as update_mock:
+        app._set_status("Notify char (2 B)")
+        app._set_status("Notify char (2 B)")
+        app._set_status("Notify char (3 B)")
 
-        assert "Scan failed:" in app._status_msg
-        assert "Bluetooth" in app._status_msg
+    assert update_mock.call_count == 2
 
 
 @pytest.mark.integration_tui
-async def test_gatt_tree_empty_initially():
+async def test_gatt_tree_empty_initially(pilot):
     """Test that GATT tree is empty on startup."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app = pilot.app
 
-        gatt_tree = app.query_one("#gatt", Tree)
+    gatt_tree = app.query_one("#gatt", Tree)
 
-        # Root should exist but have no children
-        assert gatt_tree.root
-        assert len(list(gatt_tree.root.children)) == 0
+    # Root should exist but have no children
+    assert gatt_tree.root
+    assert len(list(gatt_tree.root.children)) == 0
 
 
 @pytest.mark.integration_tui
-async def test_log_pane_empty_initially():
+async def test_log_pane_empty_initially(pilot):
     """Test that log pane shows 'No characteristic selected' initially."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app = pilot.app
 
-        # Check that no characteristic is selected
-        assert app._selected_char is None
+    # Check that no characteristic is selected
+    assert app._selected_char is None
 
 
 @pytest.mark.integration_tui
 async def test_quit_action():
     """Test that 'q' key quits the app."""
-    async with BleTui().run_test() as pilot:
+    async with BleTui(auto_scan=False).run_test() as pilot:
         app = pilot.app
-        await pilot.pause()
 
         # Press 'q' to quit
         await pilot.press("q")
@@ -265,449 +343,482 @@ async def test_scan_handles_no_devices():
     # Empty scanner
     scanner = create_mock_scanner_with_devices()
 
-    with patch("ble_tui.services.ble_service.BleakScanner", scanner):
-        async with BleTui().run_test() as pilot:
-            app = pilot.app
-            await pilot.pause()
+    async with BleTui(ble=BleService(scanner=scanner)).run_test() as pilot:
+        app = pilot.app
+        await wait_until(pilot, lambda: _scan_settled(app))
 
-            # Clear and rescan
-            app._state.devices.clear()
-            await pilot.press("s")
-            await pilot.pause(0.5)
+        # Clear and rescan
+        app._state.devices.clear()
+        await pilot.press("s")
+        await wait_until(pilot, lambda: _scan_settled(app))
 
-            devices_table = app.query_one("#devices", DataTable)
-            assert devices_table.row_count == 0
+        devices_table = app.query_one("#devices", DataTable)
+        assert devices_table.row_count == 0
 
 
 @pytest.mark.integration_tui
-async def test_disconnect_clears_gatt_tree():
+async def test_disconnect_clears_gatt_tree(pilot):
     """Test that disconnect action clears the GATT tree."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app = pilot.app
 
-        # Simulate having a connection by setting up GATT tree
-        gatt_tree = app.query_one("#gatt", Tree)
-        gatt_tree.root.add("Test Service")
+    # Simulate having a connection by setting up GATT tree
+    gatt_tree = app.query_one("#gatt", Tree)
+    gatt_tree.root.add("Test Service")
 
-        # Disconnect
-        await pilot.press("d")
-        await pilot.pause()
+    # Disconnect
+    await pilot.press("d")
+    await pilot.pause()
 
-        # GATT tree should be cleared
-        assert len(list(gatt_tree.root.children)) == 0
+    # GATT tree should be cleared
+    assert len(list(gatt_tree.root.children)) == 0
 
 
 @pytest.mark.integration_tui
-async def test_escape_key_disconnects():
+async def test_escape_key_disconnects(pilot):
     """Test that Escape key triggers disconnect."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app = pilot.app
 
-        # Press Escape
-        await pilot.press("escape")
-        await pilot.pause()
+    # Press Escape
+    await pilot.press("escape")
+    await pilot.pause()
 
-        # Should be disconnected (no client)
-        assert app._client is None
+    # Should be disconnected (no client)
+    assert app._client is None
 
 
 @pytest.mark.integration_tui
-async def test_latest_value_widget_exists():
+async def test_latest_value_widget_exists(pilot):
     """Test that latest value widget is present in UI."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        from textual.containers import VerticalScroll
-        from textual.widgets import Static
+    app = pilot.app
 
-        # Check VerticalScroll container exists
-        scroll_container = app.query_one("#latest_value_scroll", VerticalScroll)
-        assert scroll_container is not None
+    # Check VerticalScroll container exists
+    scroll_container = app.query_one("#latest_value_scroll", VerticalScroll)
+    assert scroll_container is not None
 
-        # Check Static widget inside exists
-        latest = app.query_one("#latest_value", Static)
-        assert latest is not None
+    # Check Static widget inside exists
+    latest = app.query_one("#latest_value", Static)
+    assert latest is not None
 
 
 @pytest.mark.integration_tui
-async def test_latest_value_is_scrollable():
+async def test_latest_value_is_scrollable(pilot):
     """Test that latest value widget supports scrolling."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        from textual.containers import VerticalScroll
+    app = pilot.app
 
-        scroll_container = app.query_one("#latest_value_scroll", VerticalScroll)
+    scroll_container = app.query_one("#latest_value_scroll", VerticalScroll)
 
-        # VerticalScroll should be scrollable
-        assert hasattr(scroll_container, "scroll_to")
-        assert hasattr(scroll_container, "scroll_up")
-        assert hasattr(scroll_container, "scroll_down")
+    # VerticalScroll should be scrollable
+    assert hasattr(scroll_container, "scroll_to")
+    assert hasattr(scroll_container, "scroll_up")
+    assert hasattr(scroll_container, "scroll_down")
 
 
 @pytest.mark.integration_tui
-async def test_history_title_widget_exists():
+async def test_history_title_widget_exists(pilot):
     """Test that history title widget is present in UI."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        from textual.widgets import Static
+    app = pilot.app
 
-        # Find the history title widget
-        history_titles = app.query(".history-title")
-        assert len(history_titles) > 0
+    # Find the history title widget
+    history_titles = app.query(".history-title")
+    assert len(history_titles) > 0
 
 
 @pytest.mark.integration_tui
-async def test_history_title_shows_entry_count():
+async def test_history_title_shows_entry_count(pilot):
     """Test that history title dynamically shows entry count."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        from textual.widgets import Static
-        from ble_tui.models import CharacteristicInfo
+    app = pilot.app
 
-        await pilot.pause()
+    # Get the title widget
+    title_widget = app.query_one("#history_title", Static)
 
-        # Get the title widget
-        title_widget = app.query_one("#history_title", Static)
+    # Create fake characteristic
+    char = FakeChar("test-char", ("read", "notify"), handle=42)
 
-        # Create mock characteristic
-        char = Mock()
-        char.handle = 42
+    info = CharacteristicInfo(
+        key="test-svc:test-char:42",
+        uuid="test-char",
+        properties=("read", "notify"),
+        service_uuid="test-svc",
+        char=char,
+    )
 
-        info = CharacteristicInfo(
-            key="test-svc:test-char:42",
-            uuid="test-char",
-            properties=("read", "notify"),
-            service_uuid="test-svc",
-            char=char,
-        )
+    # Set up GATT service
+    app._state.services = {"test-svc": [info]}
+    key = "test-svc:test-char:42"
 
-        # Set up GATT service
-        app._state.services = {"test-svc": [info]}
-        key = "test-svc:test-char:42"
+    # Select characteristic with no data - should show "History (0)"
+    app._selected_char = key
+    app._render_log(key)
 
-        # Select characteristic with no data - should show "History (0)"
-        app._selected_char = key
-        app._render_log(key)
-        await pilot.pause()
+    rendered = title_widget.render()
+    assert "History (0)" in str(rendered)
 
-        rendered = title_widget.render()
-        assert "History (0)" in str(rendered)
+    # Add one entry - should show "History (1)"
+    app._state.append_value(key, b"data1")
+    app._render_log(key)
 
-        # Add one entry - should show "History (1)"
-        app._state.append_value(key, b"data1")
-        app._render_log(key)
-        await pilot.pause()
+    rendered = title_widget.render()
+    assert "History (1)" in str(rendered)
 
-        rendered = title_widget.render()
-        assert "History (1)" in str(rendered)
+    # Add more entries - should show "History (3)"
+    app._state.append_value(key, b"data2")
+    app._state.append_value(key, b"data3")
+    app._render_log(key)
 
-        # Add more entries - should show "History (3)"
-        app._state.append_value(key, b"data2")
-        app._state.append_value(key, b"data3")
-        app._render_log(key)
-        await pilot.pause()
+    rendered = title_widget.render()
+    assert "History (3)" in str(rendered)
 
-        rendered = title_widget.render()
-        assert "History (3)" in str(rendered)
+    # Fill to max capacity with canned entries (already have 3 entries)
+    seed_log(app._state, key, LOG_MAX - 3)
+    app._state.latest_data[key] = b"\x00"
+    app._render_log(key)
 
-        # Fill to max capacity (200 entries)
-        for i in range(197):  # Already have 3 entries
-            app._state.append_value(key, f"data{i}".encode())
-        app._render_log(key)
-        await pilot.pause()
+    # Should show "History (<LOG_MAX> - max)"
+    rendered = title_widget.render()
+    assert f"History ({LOG_MAX} - max)" in str(rendered)
 
-        # Should show "History (200 - max)"
-        rendered = title_widget.render()
-        assert "History (200 - max)" in str(rendered)
+    # Clear log - should show "History (0)"
+    app._state.clear_char_log(key)
+    app._render_log(key)
 
-        # Clear log - should show "History (0)"
-        app._state.clear_char_log(key)
-        app._render_log(key)
-        await pilot.pause()
+    rendered = title_widget.render()
+    assert "History (0)" in str(rendered)
 
-        rendered = title_widget.render()
-        assert "History (0)" in str(rendered)
+    # Disconnect/clear GATT - should reset to "History"
+    app._selected_char = None  # Clear selection (done by disconnect_internal)
+    app._clear_gatt_ui()
 
-        # Disconnect/clear GATT - should reset to "History"
-        app._selected_char = None  # Clear selection (done by disconnect_internal)
-        app._clear_gatt_ui()
-        await pilot.pause()
+    rendered = title_widget.render()
+    assert str(rendered) == "History"
 
-        rendered = title_widget.render()
-        assert str(rendered) == "History"
+
+@pytest.mark.integration_tui
+async def test_render_log_redraws_full_history_after_unseen_appends(pilot):
+    """A full (LOG_MAX) history is redrawn when it changed while unselected."""
+    app = pilot.app
+    key = "test-svc:test-char:42"
+    seed_log(app._state, key, LOG_MAX)
+    app._selected_char = key
+    app._render_log(key)
+
+    app._selected_char = None
+    app._append_values(key, [b"\x01"])  # not drawn: nothing selected
+    app._selected_char = key
+
+    with patch.object(app._log_view, "clear", wraps=app._log_view.clear) as clear:
+        app._render_log(key)
+        clear.assert_called_once()
+        app._render_log(key)  # unchanged now: no second redraw
+        clear.assert_called_once()
 
 
 @pytest.mark.integration_tui
-async def test_latest_value_empty_state():
+async def test_latest_value_empty_state(pilot):
     """Test placeholder message when no data received."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        from textual.widgets import Static
-
-        await pilot.pause()
+    app = pilot.app
 
-        # Before any reads/notifications, latest_value should be empty
-        latest = app.query_one("#latest_value", Static)
-        # Initial state is empty string - check by rendering
-        rendered_text = latest.render()
-        assert str(rendered_text) == ""
+    # Before any reads/notifications, latest_value should be empty
+    latest = app.query_one("#latest_value", Static)
+    # Initial state is empty string - check by rendering
+    rendered_text = latest.render()
+    assert str(rendered_text) == ""
 
 
 @pytest.mark.integration_tui
-async def test_write_char_no_connection():
+async def test_write_char_no_connection(pilot):
     """Test that pressing 'w' without a connection shows status message."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app = pilot.app
 
-        await pilot.press("w")
-        await pilot.pause()
+    await pilot.press("w")
+    await pilot.pause()
 
-        assert "Connect" in app._status_msg
+    assert "Connect" in app._status_msg
 
 
 @pytest.mark.integration_tui
-async def test_write_char_not_writable():
+async def test_write_char_not_writable(pilot):
     """Test that pressing 'w' on a non-writable characteristic shows status."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    app = pilot.app
+
+    # Simulate connected state with a read-only characteristic
+    app._client = Mock()
+    app._client.is_connected = True
+    app._client.address = "AA:BB:CC:DD:EE:FF"
+
+    char = CharacteristicInfo(
+        key="svc:char:1",
+        uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
+        properties=("read",),
+        service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
+        char=None,
+    )
+    app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
+    app._selected_char = char.key
 
-        # Simulate connected state with a read-only characteristic
-        app._client = Mock()
-        app._client.is_connected = True
-        app._client.address = "AA:BB:CC:DD:EE:FF"
+    await pilot.press("w")
+    await pilot.pause()
 
-        from ble_tui.models import CharacteristicInfo
+    assert "not writable" in app._status_msg
 
-        char = CharacteristicInfo(
-            key="svc:char:1",
-            uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
-            properties=("read",),
-            service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
-            char=None,
-        )
-        app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
-        app._selected_char = char.key
 
-        await pilot.press("w")
-        await pilot.pause()
+@pytest.mark.integration_tui
+async def test_write_dialog_opens_for_writable_char(pilot):
+    """Test that write dialog opens for a writable characteristic."""
+    app = pilot.app
+
+    # Simulate connected state
+    app._client = Mock()
+    app._client.is_connected = True
+    app._client.address = "AA:BB:CC:DD:EE:FF"
+
+    char = CharacteristicInfo(
+        key="svc:char:1",
+        uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
+        properties=("read", "write"),
+        service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
+        char=None,
+    )
+    app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
+    app._selected_char = char.key
+
+    await pilot.press("w")
+    await wait_until(pilot, lambda: isinstance(app.screen, WriteDialog))
 
-        assert "not writable" in app._status_msg
+    # Dialog should be on the screen stack
+    assert any(isinstance(s, WriteDialog) for s in app.screen_stack)
+
+    # Cancel the dialog via the active screen
+    dialog = app.screen
+    dialog.query_one("#write-cancel").press()
+    await pilot.pause()
 
 
 @pytest.mark.integration_tui
-async def test_write_dialog_opens_for_writable_char():
-    """Test that write dialog opens for a writable characteristic."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+async def test_write_dialog_cancel(pilot):
+    """Test that cancelling the write dialog does nothing."""
+    app = pilot.app
+
+    app._client = Mock()
+    app._client.is_connected = True
+    app._client.address = "AA:BB:CC:DD:EE:FF"
+
+    char = CharacteristicInfo(
+        key="svc:char:1",
+        uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
+        properties=("write",),
+        service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
+        char=None,
+    )
+    app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
+    app._selected_char = char.key
 
-        # Simulate connected state
-        app._client = Mock()
-        app._client.is_connected = True
-        app._client.address = "AA:BB:CC:DD:EE:FF"
+    await pilot.press("w")
+    await wait_until(pilot, lambda: isinstance(app.screen, WriteDialog))
 
-        from ble_tui.models import CharacteristicInfo
+    # Press cancel
+    app.screen.query_one("#write-cancel").press()
+    await pilot.pause()
 
-        char = CharacteristicInfo(
-            key="svc:char:1",
-            uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
-            properties=("read", "write"),
-            service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
-            char=None,
-        )
-        app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
-        app._selected_char = char.key
+    # Should not have written anything - status shouldn't mention "Wrote"
+    assert "Wrote" not in app._status_msg
 
-        await pilot.press("w")
-        await pilot.pause(0.5)
 
-        # Dialog should be on the screen stack
-        from ble_tui.ui.write_dialog import WriteDialog
+@pytest.mark.integration_tui
+async def test_write_dialog_submit_hex(pilot):
+    """Test writing hex data through the dialog."""
+    app = pilot.app
 
-        assert any(isinstance(s, WriteDialog) for s in app.screen_stack)
+    mock_client = AsyncMock()
+    mock_client.is_connected = True
+    mock_client.address = "AA:BB:CC:DD:EE:FF"
+    app._client = mock_client
 
-        # Cancel the dialog via the active screen
-        dialog = app.screen
-        dialog.query_one("#write-cancel").press()
-        await pilot.pause()
+    fake_char = FakeChar(
+        "0000aaaa-0000-1000-8000-00805f9b34fb", ("write",), handle=1
+    )
+    char = CharacteristicInfo(
+        key="svc:char:1",
+        uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
+        properties=("write",),
+        service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
+        char=fake_char,
+    )
+    app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
+    app._selected_char = char.key
 
+    app._ble.write_char = AsyncMock()
 
-@pytest.mark.integration_tui
-async def test_write_dialog_cancel():
-    """Test that cancelling the write dialog does nothing."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+    await pilot.press("w")
+    await wait_until(pilot, lambda: isinstance(app.screen, WriteDialog))
 
-        app._client = Mock()
-        app._client.is_connected = True
-        app._client.address = "AA:BB:CC:DD:EE:FF"
+    # Verify the dialog opened
+    dialog = app.screen
+    assert isinstance(dialog, WriteDialog)
 
-        from ble_tui.models import CharacteristicInfo
+    # Instead of interacting with the dialog UI (which is tricky in tests),
+    # dismiss the dialog and call _do_write directly to test the write flow
+    dialog.dismiss(None)
+    await wait_until(pilot, lambda: not isinstance(app.screen, WriteDialog))
 
-        char = CharacteristicInfo(
-            key="svc:char:1",
-            uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
-            properties=("write",),
-            service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
-            char=None,
-        )
-        app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
-        app._selected_char = char.key
+    # Directly test the write flow
+    await app._do_write(char, b"\xaa\xbb\xcc", True)
 
-        await pilot.press("w")
-        await pilot.pause(0.5)
+    app._ble.write_char.assert_called_once()
+    assert "Wrote 3 bytes" in app._status_msg
 
-        # Press cancel
-        app.screen.query_one("#write-cancel").press()
-        await pilot.pause()
 
-        # Should not have written anything - status shouldn't mention "Wrote"
-        assert "Wrote" not in app._status_msg
+@pytest.mark.integration_tui
+async def test_clear_log_with_no_selection(pilot):
+    """Test 'l' key with no characteristic selected shows error."""
+    await pilot.press("l")
+    await pilot.pause()
+    assert "No characteristic selected" in pilot.app._status_msg
 
 
 @pytest.mark.integration_tui
-async def test_write_dialog_submit_hex():
-    """Test writing hex data through the dialog."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-        await pilot.pause()
+async def test_clear_log_clears_selected_only(pilot):
+    """Test 'l' key clears only the selected characteristic."""
+    app = pilot.app
+
+    # Create fake characteristics
+    char1 = FakeChar("char1", ("read",), handle=10)
+    char2 = FakeChar("char2", ("read",), handle=20)
+
+    info1 = CharacteristicInfo(
+        key="svc:char1:10",
+        uuid="char1",
+        properties=("read",),
+        service_uuid="svc",
+        char=char1,
+    )
+    info2 = CharacteristicInfo(
+        key="svc:char2:20",
+        uuid="char2",
+        properties=("read",),
+        service_uuid="svc",
+        char=char2,
+    )
 
-        mock_client = AsyncMock()
-        mock_client.is_connected = True
-        mock_client.address = "AA:BB:CC:DD:EE:FF"
-        app._client = mock_client
-
-        from ble_tui.models import CharacteristicInfo
-
-        mock_char = Mock()
-        mock_char.handle = 1
-        char = CharacteristicInfo(
-            key="svc:char:1",
-            uuid="0000aaaa-0000-1000-8000-00805f9b34fb",
-            properties=("write",),
-            service_uuid="0000bbbb-0000-1000-8000-00805f9b34fb",
-            char=mock_char,
-        )
-        app._state.services["0000bbbb-0000-1000-8000-00805f9b34fb"] = [char]
-        app._selected_char = char.key
+    # Set up GATT services
+    app._state.services = {"svc": [info1, info2]}
 
-        app._ble.write_char = AsyncMock()
+    # Add logs for two characteristics
+    key1, key2 = "svc:char1:10", "svc:char2:20"
+    seed_log(app._state, key1)
+    seed_log(app._state, key2)
 
-        await pilot.press("w")
-        await pilot.pause(0.5)
+    # Select and clear first characteristic
+    app._selected_char = key1
+    await pilot.press("l")
+    await pilot.pause()
 
-        # Verify the dialog opened
-        from ble_tui.ui.write_dialog import WriteDialog
+    # Verify only key1 cleared, key2 preserved
+    assert len(app._state.logs[key1]) == 0
+    assert len(app._state.logs[key2]) == 1
 
-        dialog = app.screen
-        assert isinstance(dialog, WriteDialog)
 
-        # Instead of interacting with the dialog UI (which is tricky in tests),
-        # dismiss the dialog and call _do_write directly to test the write flow
-        dialog.dismiss(None)
-        await pilot.pause(0.5)
+@pytest.mark.integration_tui
+async def test_clear_log_preserves_notifications(pilot):
+    """Test 'l' key doesn't stop notification subscriptions."""
+    app = pilot.app
 
-        # Directly test the write flow
-        from ble_tui.models import CharacteristicInfo as CI
+    # Create fake characteristic
+    char = FakeChar("char", ("notify",), handle=42)
 
-        await app._do_write(char, b"\xaa\xbb\xcc", True)
-        await pilot.pause(0.5)
+    info = CharacteristicInfo(
+        key="svc:char:42",
+        uuid="char",
+        properties=("notify",),
+        service_uuid="svc",
+        char=char,
+    )
 
-        app._ble.write_char.assert_called_once()
-        assert "Wrote 3 bytes" in app._status_msg
+    # Set up GATT service
+    app._state.services = {"svc": [info]}
 
+    key = "svc:char:42"
+    app._state.subscribed.add(key)
+    seed_log(app._state, key)
+    app._selected_char = key
 
-@pytest.mark.integration_tui
-async def test_clear_log_with_no_selection():
-    """Test 'l' key with no characteristic selected shows error."""
-    async with BleTui().run_test() as pilot:
-        await pilot.press("l")
-        await pilot.pause()
-        assert "No characteristic selected" in pilot.app._status_msg
+    await pilot.press("l")
+    await pilot.pause()
+
+    # Subscription preserved, but logs cleared
+    assert key in app._state.subscribed
+    assert len(app._state.logs[key]) == 0
 
 
 @pytest.mark.integration_tui
-async def test_clear_log_clears_selected_only():
-    """Test 'l' key clears only the selected characteristic."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
+async def test_append_value_writes_only_new_entry_to_log(pilot):
+    """New values for the shown characteristic are appended, not redrawn."""
+    app = pilot.app
 
-        # Create mock characteristics
-        from ble_tui.models import CharacteristicInfo
+    key = "svc:char:1"
+    app._selected_char = key
+    app._render_log(key)
 
-        char1 = Mock()
-        char1.handle = 10
-        char2 = Mock()
-        char2.handle = 20
+    with patch.object(app, "_render_log") as render_mock:
+        app._append_value(key, b"one")
+        app._append_value(key, b"two")
 
-        info1 = CharacteristicInfo(
-            key="svc:char1:10",
-            uuid="char1",
-            properties=("read",),
-            service_uuid="svc",
-            char=char1,
-        )
-        info2 = CharacteristicInfo(
-            key="svc:char2:20",
-            uuid="char2",
+    render_mock.assert_not_called()
+    assert len(app.query_one("#log", RichLog).lines) == 2
+
+
+@pytest.mark.integration_tui
+async def test_tree_highlight_debounces_log_render(pilot):
+    """Fast highlight moves should render the log once, for the final node."""
+    app = pilot.app
+
+    infos = [
+        CharacteristicInfo(
+            key=f"svc:char:{handle}",
+            uuid=f"char-{handle}",
             properties=("read",),
             service_uuid="svc",
-            char=char2,
+            char=None,
         )
+        for handle in (1, 2, 3)
+    ]
 
-        # Set up GATT services
-        app._state.services = {"svc": [info1, info2]}
-
-        # Add logs for two characteristics
-        key1, key2 = "svc:char1:10", "svc:char2:20"
-        app._state.append_value(key1, b"data1")
-        app._state.append_value(key2, b"data2")
-
-        # Select and clear first characteristic
-        app._selected_char = key1
-        await pilot.press("l")
-        await pilot.pause()
+    with patch.object(app, "_render_log") as render_mock:
+        for info in infos:
+            event = Mock()
+            event.node.data = info
+            await app.on_tree_node_highlighted(event)
+        await wait_until(pilot, lambda: render_mock.called)
 
-        # Verify only key1 cleared, key2 preserved
-        assert len(app._state.logs[key1]) == 0
-        assert len(app._state.logs[key2]) == 1
+    render_mock.assert_called_once_with("svc:char:3")
+    assert app._selected_char == "svc:char:3"
 
 
 @pytest.mark.integration_tui
-async def test_clear_log_preserves_notifications():
-    """Test 'l' key doesn't stop notification subscriptions."""
-    async with BleTui().run_test() as pilot:
-        app = pilot.app
-
-        # Create mock characteristic
-        from ble_tui.models import CharacteristicInfo
+async def test_render_log_skips_unchanged_view(pilot):
+    """Re-rendering the key already shown with no new entries is a no-op."""
+    app = pilot.app
 
-        char = Mock()
-        char.handle = 42
+    key = "svc:char:1"
+    app._state.append_value(key, b"one")
+    app._render_log(key)
 
-        info = CharacteristicInfo(
-            key="svc:char:42",
-            uuid="char",
-            properties=("notify",),
-            service_uuid="svc",
-            char=char,
-        )
-
-        # Set up GATT service
-        app._state.services = {"svc": [info]}
+    log_view = app.query_one("#log", RichLog)
+    with patch.object(log_view, "clear") as clear_mock:
+        app._render_log(key)
 
-        key = "svc:char:42"
-        app._state.subscribed.add(key)
-        app._state.append_value(key, b"notification")
-        app._selected_char = key
+    clear_mock.assert_not_called()
 
-        await pilot.press("l")
-        await pilot.pause()
 
-        # Subscription preserved, but logs cleared
-        assert key in app._state.subscribed
-        assert len(app._state.logs[key]) == 0
+@pytest.mark.integration_tui
+async def test_iter_tree_nodes_walks_depth_first(pilot):
+    """Tree traversal yields nodes lazily in depth-first order."""
+    app = pilot.app
+
+    gatt = app.query_one("#gatt", Tree)
+    svc_a = gatt.root.add("A")
+    svc_a.add("A1")
+    gatt.root.add("B")
+
+    walk = app._iter_tree_nodes(gatt.root)
+    assert not isinstance(walk, list)
+    assert [str(node.label) for node in walk] == ["GATT", "A", "A1", "B"]
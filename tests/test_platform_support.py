@@ -1,6 +1,7 @@
 import pytest
 
 from ble_tui.utils.platform_support import (
+    _hint_for,
     current_platform_name,
     format_ble_error,
     platform_ble_hint,
@@ -8,13 +9,12 @@ from ble_tui.utils.platform_support import (
 
 
 @pytest.mark.unit
-def test_current_platform_name_windows():
-    assert current_platform_name("win32") == "windows"
-
-
-@pytest.mark.unit
-def test_current_platform_name_linux():
-    assert current_platform_name("linux") == "linux"
+@pytest.mark.parametrize(
+    "platform,expected",
+    [("win32", "windows"), ("linux", "linux")],
+)
+def test_current_platform_name(platform, expected):
+    assert current_platform_name(platform) == expected
 
 
 @pytest.mark.unit
@@ -33,6 +33,22 @@ def test_platform_ble_hint_linux_bluez_stack_issue():
     assert "dbus" in hint
 
 
+@pytest.mark.unit
+def test_platform_ble_hint_windows_access_denied_mentioning_dbus():
+    exc = PermissionError("Access is denied (dbus proxy: permission denied)")
+    hint = platform_ble_hint(exc, platform="win32")
+    assert hint.startswith("Run with an account that has Bluetooth access")
+
+
+@pytest.mark.unit
+def test_platform_ble_hint_caches_repeat_errors():
+    _hint_for.cache_clear()
+    first = platform_ble_hint(RuntimeError("org.bluez.Error.Failed"), platform="linux")
+    second = platform_ble_hint(RuntimeError("org.bluez.Error.Failed"), platform="linux")
+    assert second is first
+    assert _hint_for.cache_info().hits == 1
+
+
 @pytest.mark.unit
 def test_format_ble_error_includes_action_and_log_path():
     msg = format_ble_error("Scan", RuntimeError("x"), "ble_tui_errors.log")
@@ -1,8 +1,8 @@
 import pytest
-from unittest.mock import Mock
 
 from ble_tui.models import CharacteristicInfo, LogEntry
 from ble_tui.ui.renderers import characteristic_label, log_line, log_meta, status_line
+from tests.fixtures import FakeChar
 
 
 @pytest.mark.unit
@@ -31,6 +31,9 @@ def test_status_line_connected_and_selected_char():
         subscribed_count=2,
     )
 
+    # Pure over its inputs, which is what lets the app skip unchanged updates
+    assert status_line("ok", "AA:BB", True, "svc:1234567890:10", 2) == line
+
     assert "[CONN Connected AA:BB]" in line
     assert "[SCAN Scanning]" in line
     assert "[CHAR 12345678]" in line
@@ -39,8 +42,7 @@ def test_status_line_connected_and_selected_char():
 
 @pytest.mark.unit
 def test_characteristic_label_includes_handle_and_notify_mark():
-    char = Mock()
-    char.handle = 101
+    char = FakeChar("char-uuid", ("notify", "read"), handle=101)
     info = CharacteristicInfo(
         key="svc:char:101",
         uuid="char-uuid",
@@ -58,7 +60,7 @@ def test_characteristic_label_includes_handle_and_notify_mark():
 def test_log_meta_none_and_with_info():
     assert log_meta(None) == "No characteristic selected"
 
-    char = Mock()
+    char = FakeChar("char-uuid", ("read",))
     info = CharacteristicInfo(
         key="k",
         uuid="char-uuid",
@@ -79,3 +81,15 @@ def test_log_line_json_and_long_hex():
     line = log_line(plain_entry)
     assert "..." in line
     assert "12:00:00.000" in line
+
+
+@pytest.mark.unit
+def test_log_line_is_memoised_per_entry():
+    log_line.cache_clear()
+    entry = LogEntry(ts="12:00:00.000", size=1, hex_str="01", json_str=None)
+
+    first = log_line(entry)
+    second = log_line(LogEntry(ts="12:00:00.000", size=1, hex_str="01", json_str=None))
+
+    assert first == second
+    assert log_line.cache_info().hits == 1
@@ -1,22 +1,36 @@
+import re
+import sys
+from collections import deque
+
 import pytest
 from unittest.mock import Mock
 
 from ble_tui.models import CharacteristicInfo, DeviceInfo
 from ble_tui.services.state_service import StateService
+from ble_tui.utils import LOG_MAX
 
 
 @pytest.mark.unit
 def test_replace_devices_populates_maps_in_order():
     state = StateService()
+    # BleService.scan() returns devices strongest signal first
     devices = [
         DeviceInfo(name="A", address="AA", rssi=-40),
         DeviceInfo(name="B", address="BB", rssi=-60),
+        DeviceInfo(name="C", address="CC", rssi=-75),
     ]
 
     state.replace_devices(devices)
 
-    assert state.device_order == ["AA", "BB"]
+    assert list(state.device_addresses()) == ["AA", "BB", "CC"]
+    assert state.device_index == {"AA": 0, "BB": 1, "CC": 2}
     assert state.devices["AA"].name == "A"
+    assert [d.rssi for d in state.devices.values()] == [-40, -60, -75]
+
+    # Addresses built at runtime (as bleak's are) are interned
+    scanned = DeviceInfo(name="D", address="".join(["DD", ":EE"]), rssi=-50)
+    state.replace_devices([scanned])
+    assert state.devices["DD:EE"].address is sys.intern("DD:EE")
 
 
 @pytest.mark.unit
@@ -26,11 +40,49 @@ def test_append_value_creates_log_entry_with_json():
     state.append_value("k", b'{"ok":true}')
 
     assert "k" in state.logs
+    assert isinstance(state.logs["k"], deque)
+    assert state.logs["k"].maxlen == LOG_MAX
     entry = state.logs["k"][0]
     assert entry.size == 11
     assert entry.json_str == '{"ok":true}'
 
 
+@pytest.mark.unit
+def test_append_value_stores_non_ascii_json_unescaped():
+    state = StateService()
+
+    entry = state.append_value("k", '{"name":"caf\u00e9"}'.encode())
+
+    assert entry.json_str == '{"name":"caf\u00e9"}'
+
+
+@pytest.mark.unit
+def test_append_value_skips_json_parse_for_binary(monkeypatch):
+    state = StateService()
+    loads = Mock(side_effect=AssertionError("binary payload was parsed"))
+    monkeypatch.setattr("ble_tui.utils.formatting.json.loads", loads)
+
+    entry = state.append_value("k", b"\x01\x7b\x00\xfe")
+
+    assert entry.json_str is None
+    loads.assert_not_called()
+
+
+@pytest.mark.unit
+def test_append_value_timestamp_format(monkeypatch):
+    state = StateService()
+    monkeypatch.setattr(
+        "ble_tui.services.state_service.time.time", lambda: 1_700_000_000.25
+    )
+
+    first = state.append_value("k", b"\x01")
+    second = state.append_value("k", b"\x02")
+
+    assert first.ts == second.ts
+    assert first.ts.endswith(".250")
+    assert re.fullmatch(r"\d{2}:\d{2}:\d{2}\.\d{3}", first.ts)
+
+
 @pytest.mark.unit
 def test_find_char_and_target_helpers():
     state = StateService()
@@ -49,6 +101,23 @@ def test_find_char_and_target_helpers():
     assert state.char_target(info) == 101
 
 
+@pytest.mark.unit
+def test_set_gatt_indexes_chars_by_key():
+    state = StateService()
+    info = CharacteristicInfo(
+        key="svc:char:7", uuid="char", properties=(), service_uuid="svc", char=None
+    )
+
+    state.set_gatt({"svc": [info]}, {7: info.key})
+
+    assert state.chars_by_key == {"svc:char:7": info}
+    assert state.find_char("svc:char:7") is info
+    assert state.find_char("missing") is None
+
+    state.clear_connection_state()
+    assert state.chars_by_key == {}
+
+
 @pytest.mark.unit
 def test_clear_char_log():
     """Test clearing logs and latest data for a specific characteristic."""
@@ -71,3 +140,29 @@ def test_clear_char_log_nonexistent_key():
     """Test clearing a characteristic that doesn't exist (should not error)."""
     state = StateService()
     state.clear_char_log("nonexistent:key:999")  # Should not raise
+
+
+@pytest.mark.unit
+def test_clear_char_log_drops_cached_markup():
+    state = StateService()
+    entry = state.append_value("k", b"\x01")
+    state.latest_markup["k"] = (entry, "markup")
+
+    state.clear_char_log("k")
+
+    assert "k" not in state.latest_markup
+
+
+@pytest.mark.unit
+def test_log_version_advances_once_log_is_full():
+    state = StateService()
+    for i in range(LOG_MAX):
+        state.append_value("k", bytes([i % 256]))
+    full = state.log_version["k"]
+
+    state.append_value("k", b"\xff")
+    assert len(state.logs["k"]) == LOG_MAX
+    assert state.log_version["k"] > full
+
+    state.clear_char_log("k")
+    assert state.log_version["k"] > full + 1
@@ -5,6 +5,7 @@ These tests are fast, have no external dependencies, and can run in CI.
 """
 import json
 import pytest
+from unittest.mock import Mock
 from ble_tui.models import DeviceInfo, CharacteristicInfo, LogEntry
 from ble_tui.utils.formatting import hex_groups as _hex_groups
 from ble_tui.utils.formatting import try_parse_json as _try_parse_json
@@ -15,36 +16,38 @@ from ble_tui.utils.formatting import try_parse_json as _try_parse_json
 # =============================================================================
 
 @pytest.mark.unit
-def test_hex_groups_empty():
-    """Test _hex_groups with empty bytes."""
-    assert _hex_groups(b"") == ""
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (b"", ""),
+        (b"\x00", "00"),
+        (b"\xff", "ff"),
+        (b"\x42", "42"),
+        (b"\x01\x02\x03", "01 02 03"),
+        (b"\xaa\xbb\xcc\xdd", "aa bb cc dd"),
+        (b"Hello", "48 65 6c 6c 6f"),
+        (b"\x00\x00\x00", "00 00 00"),
+    ],
+    ids=["empty", "zero", "ff", "42", "multiple", "multiple-high", "ascii", "zeros"],
+)
+def test_hex_groups(data, expected):
+    """Test _hex_groups formats one space-separated pair per byte."""
+    assert _hex_groups(data) == expected
 
 
 @pytest.mark.unit
-def test_hex_groups_single_byte():
-    """Test _hex_groups with a single byte."""
-    assert _hex_groups(b"\x00") == "00"
-    assert _hex_groups(b"\xff") == "ff"
-    assert _hex_groups(b"\x42") == "42"
+def test_hex_groups_multi_byte_groups():
+    """Test _hex_groups groups bytes from the left when group > 1."""
+    assert _hex_groups(b"\x01\x02\x03\x04\x05", group=2) == "0102 0304 05"
 
 
 @pytest.mark.unit
-def test_hex_groups_multiple_bytes():
-    """Test _hex_groups with multiple bytes."""
-    assert _hex_groups(b"\x01\x02\x03") == "01 02 03"
-    assert _hex_groups(b"\xaa\xbb\xcc\xdd") == "aa bb cc dd"
-
-
-@pytest.mark.unit
-def test_hex_groups_ascii_text():
-    """Test _hex_groups with ASCII text."""
-    assert _hex_groups(b"Hello") == "48 65 6c 6c 6f"
-
-
-@pytest.mark.unit
-def test_hex_groups_with_zeros():
-    """Test _hex_groups with zero bytes."""
-    assert _hex_groups(b"\x00\x00\x00") == "00 00 00"
+def test_hex_groups_large_payload():
+    """Test _hex_groups' bytes.hex() path matches per-byte formatting."""
+    data = bytes(range(256)) * 16
+    reference = " ".join(f"{b:02x}" for b in data)
+    assert _hex_groups(data) == reference
+    assert _hex_groups(b"\xaa" * 4096) == " ".join(["aa"] * 4096)
 
 
 # =============================================================================
@@ -133,6 +136,46 @@ def test_try_parse_json_ensures_ascii():
     assert "\\u" in result
 
 
+@pytest.mark.unit
+def test_try_parse_json_keeps_utf8_without_ensure_ascii():
+    """Test _try_parse_json leaves non-ASCII text raw when asked to."""
+    assert _try_parse_json(b'{"t": "\\u00e9"}', ensure_ascii=False) == '{"t":"\u00e9"}'
+
+
+@pytest.mark.unit
+def test_try_parse_json_preserves_big_integers():
+    """Test integers wider than 64 bits are shown exactly, not as floats."""
+    data = b'{"a": 123456789012345678901234567890, "b": -18446744073709551616}'
+    assert _try_parse_json(data) == (
+        '{"a":123456789012345678901234567890,"b":-18446744073709551616}'
+    )
+
+
+@pytest.mark.unit
+def test_try_parse_json_prefilter():
+    """Test _try_parse_json skips binary payloads but allows surrounding whitespace."""
+    assert _try_parse_json(b"\x01{}") is None
+    assert _try_parse_json(b"[1]\x02") is None
+    assert _try_parse_json(b"  [1]") == "[1]"
+    assert _try_parse_json(b"[1]\r\n") == "[1]"
+    assert _try_parse_json(b"null") == "null"
+
+
+@pytest.mark.unit
+def test_try_parse_json_rejects_bytes_that_cannot_appear_in_json(monkeypatch):
+    """Test binary framed like JSON is rejected without a parse attempt."""
+    from ble_tui.utils import formatting
+
+    loads = Mock(side_effect=AssertionError("payload was parsed"))
+    monkeypatch.setattr(formatting.json, "loads", loads)
+    formatting._load_json_cached.cache_clear()
+
+    assert _try_parse_json(b"1\x00\x02 3") is None
+    assert _try_parse_json(b'"\xff"') is None
+    loads.assert_not_called()
+    formatting._load_json_cached.cache_clear()
+
+
 # =============================================================================
 # Tests for DeviceInfo dataclass
 # =============================================================================
@@ -208,10 +251,79 @@ def test_characteristic_info_properties_tuple():
     assert "notify" in char.properties
 
 
+@pytest.mark.unit
+def test_characteristic_info_derived_properties():
+    """Test that props_mask/props_display are derived once from properties."""
+    from ble_tui.models import PROP_NOTIFY, PROP_READ, PROP_WRITE
+
+    char = CharacteristicInfo(
+        key="test", uuid="uuid", properties=("notify", "read", "vendor-x"),
+        service_uuid="svc", char=None
+    )
+    assert char.props_mask == PROP_NOTIFY | PROP_READ
+    assert not char.props_mask & PROP_WRITE
+    assert char.props_display == "notify, read, vendor-x"
+
+
+@pytest.mark.unit
+def test_characteristic_info_handle_from_char():
+    """Test that handle defaults to the underlying characteristic's handle."""
+    from types import SimpleNamespace
+
+    derived = CharacteristicInfo(
+        key="k", uuid="u", properties=(), service_uuid="s",
+        char=SimpleNamespace(handle=42),
+    )
+    missing = CharacteristicInfo(
+        key="k", uuid="u", properties=(), service_uuid="s", char=None
+    )
+    assert derived.handle == 42
+    assert missing.handle is None
+
+
+@pytest.mark.unit
+def test_characteristic_info_is_hashable():
+    """Test that equal CharacteristicInfo instances collapse in a set."""
+    def make(key: str) -> CharacteristicInfo:
+        return CharacteristicInfo(
+            key=key, uuid="u", properties=("read",), service_uuid="s", char=None
+        )
+
+    assert len({make("a"), make("a"), make("b")}) == 2
+
+
+@pytest.mark.unit
+def test_characteristic_info_interns_uuids():
+    """Test that UUIDs built at runtime share one interned string."""
+    import sys
+
+    uuid = "".join(["0000180f", "-0000-1000-8000-00805f9b34fb"])
+    svc = "".join(["0000180a", "-0000-1000-8000-00805f9b34fb"])
+    char = CharacteristicInfo(
+        key="k", uuid=uuid, properties=(), service_uuid=svc, char=None
+    )
+    assert char.uuid is sys.intern("0000180f-0000-1000-8000-00805f9b34fb")
+    assert char.service_uuid is sys.intern("0000180a-0000-1000-8000-00805f9b34fb")
+
+
 # =============================================================================
 # Tests for LogEntry dataclass
 # =============================================================================
 
+@pytest.mark.unit
+def test_models_use_slots():
+    """Test that model instances carry no per-instance __dict__."""
+    models = (
+        DeviceInfo(name="n", address="a", rssi=0),
+        CharacteristicInfo(
+            key="k", uuid="u", properties=(), service_uuid="s", char=None
+        ),
+        LogEntry(ts="t", size=0, hex_str="", json_str=None),
+    )
+    for model in models:
+        assert not hasattr(model, "__dict__")
+
+
 @pytest.mark.unit
 def test_log_entry_creation():
     """Test creating a LogEntry instance."""
@@ -309,6 +421,156 @@ def test_pretty_json_with_highlighting_invalid():
 
     assert pretty_json_with_highlighting(b"not json") is None
     assert pretty_json_with_highlighting(b"\xff\xfe") is None
+    assert pretty_json_with_highlighting(b"\x00{}") is None
+    assert pretty_json_with_highlighting(b"7") == "7"
+
+
+@pytest.mark.unit
+def test_json_parsed_once_for_both_formatters():
+    """Test that the compact and pretty formatters share one parse."""
+    from ble_tui.utils.formatting import (
+        _load_json_cached,
+        _pretty_json_cached,
+        pretty_json_with_highlighting,
+    )
+
+    _load_json_cached.cache_clear()
+    _pretty_json_cached.cache_clear()
+    data = b'{"shared": 1}'
+    _try_parse_json(data)
+    pretty_json_with_highlighting(data)
+
+    info = _load_json_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+@pytest.mark.unit
+def test_large_payloads_are_not_pinned_by_the_parse_cache():
+    """Test that payloads above the size cap bypass the parse cache."""
+    from ble_tui.utils.formatting import _LOAD_CACHE_MAX_BYTES, _load_json_cached
+
+    _load_json_cached.cache_clear()
+    large = b'{"blob": "' + b"x" * _LOAD_CACHE_MAX_BYTES + b'"}'
+    assert _try_parse_json(large) is not None
+    assert _load_json_cached.cache_info().currsize == 0
+
+
+@pytest.mark.unit
+def test_pretty_json_with_highlighting_caches_small_payloads():
+    """Test that repeat renders reuse markup, except for large payloads."""
+    from ble_tui.utils.formatting import (
+        _PRETTY_CACHE_MAX_BYTES,
+        _pretty_json_cached,
+        pretty_json_with_highlighting,
+    )
+
+    _pretty_json_cached.cache_clear()
+    small = b'{"temp": 21}'
+    first = pretty_json_with_highlighting(small)
+    assert pretty_json_with_highlighting(bytearray(small)) is first
+    assert _pretty_json_cached.cache_info().hits == 1
+
+    large = b'{"blob": "' + b"x" * _PRETTY_CACHE_MAX_BYTES + b'"}'
+    assert pretty_json_with_highlighting(large) is not None
+    assert _pretty_json_cached.cache_info().currsize == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_formatters_accept_buffer_types(wrap):
+    """Test bytearray/memoryview payloads (as bleak may pass) format like bytes."""
+    from ble_tui.utils.formatting import format_payload, pretty_json_with_highlighting
+
+    data = b'{"a": 1}'
+    assert _hex_groups(wrap(data)) == "7b 22 61 22 3a 20 31 7d"
+    assert _try_parse_json(wrap(data)) == '{"a":1}'
+    assert format_payload(wrap(data)) == format_payload(data)
+    assert pretty_json_with_highlighting(wrap(data)) == pretty_json_with_highlighting(data)
+
+
+@pytest.mark.unit
+def test_format_payload_memoizes_small_payloads():
+    """Test that repeated payloads reuse hex/JSON text, except large ones."""
+    from ble_tui.utils.formatting import (
+        _FORMAT_CACHE_MAX_BYTES,
+        _format_payload_cached,
+        format_payload,
+    )
+
+    _format_payload_cached.cache_clear()
+    first = format_payload(b'{"battery":84}')
+    assert first == ("7b 22 62 61 74 74 65 72 79 22 3a 38 34 7d", '{"battery":84}')
+    assert format_payload(bytearray(b'{"battery":84}')) is first
+    assert _format_payload_cached.cache_info().hits == 1
+
+    format_payload(b"\x00" * (_FORMAT_CACHE_MAX_BYTES + 1))
+    assert _format_payload_cached.cache_info().currsize == 1
+
+
+@pytest.mark.unit
+def test_pretty_json_with_highlighting_truncates_oversized_output():
+    """Test that oversized pretty output is cut at a line with a marker."""
+    from ble_tui.utils.formatting import (
+        _PRETTY_MAX_CHARS,
+        pretty_json_with_highlighting,
+    )
+
+    data = json.dumps(list(range(5000))).encode()
+    result = pretty_json_with_highlighting(data)
+
+    body, marker = result.rsplit("\n", 1)
+    assert len(body) < 2 * _PRETTY_MAX_CHARS
+    assert body.endswith(",")  # cut after a complete line
+    assert marker.startswith("[dim]... (truncated, ")
+    assert marker.endswith(" more chars)[/]")
+
+
+@pytest.mark.unit
+def test_pretty_json_with_highlighting_exact_markup():
+    """Test the markup produced for each token type in one pass."""
+    from ble_tui.utils.formatting import pretty_json_with_highlighting
+
+    data = b'{"a:b": "x", "n": 1.5, "z": null}'
+    result = pretty_json_with_highlighting(data, indent=None)
+
+    assert result == (
+        '{[cyan]"a:b"[/]: [green]"x"[/], [cyan]"n"[/]: [yellow]1.5[/], '
+        '[cyan]"z"[/]: [magenta]null[/]}'
+    )
+
+
+@pytest.mark.unit
+def test_latest_value_and_history_show_non_ascii_json_alike():
+    """Test both panes render non-ASCII JSON text the same way (raw UTF-8)."""
+    from ble_tui.ui.renderers import latest_value_markup, log_line
+    from ble_tui.utils.formatting import format_payload
+
+    def panes(data: bytes) -> tuple[str, str]:
+        hex_str, json_str = format_payload(data)
+        entry = LogEntry(ts="10:30:45.126", size=len(data), hex_str=hex_str, json_str=json_str)
+        return log_line(entry), latest_value_markup(entry, data)
+
+    history, latest = panes('{"name": "caf\u00e9"}'.encode())
+    assert "caf\u00e9" in history and "caf\u00e9" in latest
+    assert "\\u00e9" not in history and "\\u00e9" not in latest
+
+    # Lone surrogates can't be drawn; both panes fall back to escapes
+    history, latest = panes(b'{"bad": "\\ud800"}')
+    assert "\\ud800" in history and "\\ud800" in latest
+
+
+@pytest.mark.unit
+def test_pretty_json_with_highlighting_escapes_and_signed_numbers():
+    """Test escaped quotes and signed/exponent numbers are single tokens."""
+    from ble_tui.utils.formatting import pretty_json_with_highlighting
+
+    data = rb'{"k\"q": "v\"x", "n": -2, "e": 1e300}'
+    result = pretty_json_with_highlighting(data, indent=None)
+
+    assert result == (
+        r'{[cyan]"k\"q"[/]: [green]"v\"x"[/], [cyan]"n"[/]: [yellow]-2[/], '
+        '[cyan]"e"[/]: [yellow]1e+300[/]}'
+    )
 
 
 @pytest.mark.unit
@@ -395,6 +657,39 @@ def test_latest_value_markup_binary_only():
     assert "JSON:" not in result  # No JSON section for binary data
 
 
+@pytest.mark.unit
+def test_latest_value_markup_exact_layout():
+    """Test the full header/hex/JSON layout of the latest value markup."""
+    from ble_tui.ui.renderers import latest_value_markup
+
+    entry = LogEntry(ts="10:30:45.125", size=7, hex_str="7b 22 61 22 3a 31 7d",
+                     json_str='{"a":1}')
+    result = latest_value_markup(entry, b'{"a":1}')
+
+    assert result == (
+        "[dim]10:30:45.125[/] | [yellow]7B[/]\n\n[bold]Hex:[/]\n"
+        "7b 22 61 22 3a 31 7d\n\n[bold]JSON:[/]\n"
+        '{\n  [cyan]"a"[/]: [yellow]1[/]\n}'
+    )
+
+
+@pytest.mark.unit
+def test_latest_value_markup_binary_skips_json_parse(monkeypatch):
+    """Entries without json_str never reach the JSON formatter."""
+    from ble_tui.ui.renderers import latest_value_markup
+    from ble_tui.utils import formatting
+
+    calls = []
+    monkeypatch.setattr(
+        formatting, "pretty_json_with_highlighting", lambda data: calls.append(data)
+    )
+    entry = LogEntry(ts="10:30:45.124", size=2, hex_str="7b 7d", json_str=None)
+    result = latest_value_markup(entry, b"{}")
+
+    assert calls == []
+    assert "JSON:" not in result
+
+
 # =============================================================================
 # Tests for parse_hex_string()
 # =============================================================================
@@ -420,6 +715,13 @@ def test_parse_hex_string_lowercase():
     assert parse_hex_string("0a ff 01") == b"\x0a\xff\x01"
 
 
+@pytest.mark.unit
+def test_parse_hex_string_mixed_whitespace():
+    """Test parse_hex_string with tabs and newlines between bytes."""
+    from ble_tui.ui.write_dialog import parse_hex_string
+    assert parse_hex_string("AA\tBB\nCC") == b"\xaa\xbb\xcc"
+
+
 @pytest.mark.unit
 def test_parse_hex_string_empty():
     """Test parse_hex_string with empty string."""